@@ -1,9 +1,14 @@
 """
 API routes for the Embedding Service.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Dict, Any
 
+from ..core.config import settings
 from ..core.errors import EmbeddingServiceError
 from ..models.schemas import (
     TextEmbeddingRequest,
@@ -20,6 +25,7 @@ from ..models.schemas import (
     HealthResponse
 )
 from ..services.embedding_service import EmbeddingService
+from ..services.micro_batcher import EmbeddingMicroBatcher
 
 
 # Create router
@@ -28,6 +34,32 @@ router = APIRouter()
 # Create embedding service instance
 embedding_service = EmbeddingService()
 
+# Coalesces concurrent /embeddings requests into shared forward passes
+micro_batcher = EmbeddingMicroBatcher(embedding_service)
+
+
+def _stream_embeddings(service: EmbeddingService, texts: List[str], model: str):
+    """Yield NDJSON lines of embeddings, one batch at a time.
+
+    Batches are embedded and flushed incrementally, so peak memory stays
+    bounded by one batch and the client sees the first vectors before the
+    whole array is computed.
+    """
+    async def generate():
+        for start in range(0, len(texts), settings.BATCH_SIZE):
+            batch = texts[start:start + settings.BATCH_SIZE]
+            embeddings, model_name, dimension = await run_in_threadpool(
+                service.generate_embeddings, batch, model
+            )
+            for embedding in embeddings:
+                yield orjson.dumps({
+                    "embedding": embedding,
+                    "model": model_name,
+                    "dimension": dimension
+                }, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 
 def get_embedding_service() -> EmbeddingService:
     """Get the embedding service instance.
@@ -51,16 +83,24 @@ async def generate_embeddings(
 ):
     """Generate embeddings for texts."""
     try:
-        embeddings, model_name, dimension = service.generate_embeddings(
+        # Very large requests stream incrementally instead of building one
+        # multi-megabyte JSON body in memory
+        if settings.STREAM_THRESHOLD and len(request.texts) >= settings.STREAM_THRESHOLD:
+            return _stream_embeddings(service, request.texts, request.model)
+
+        embeddings, model_name, dimension = await micro_batcher.embed(
             texts=request.texts,
             model_name=request.model
         )
-        
-        return TextEmbeddingResponse(
-            embeddings=embeddings,
-            model=model_name,
-            dimension=dimension
-        )
+
+        # The embeddings come straight from the model, so skip Pydantic
+        # validation of every float (response_model stays for the OpenAPI
+        # schema; returning a Response bypasses validation).
+        return ORJSONResponse({
+            "embeddings": embeddings,
+            "model": model_name,
+            "dimension": dimension
+        })
     except EmbeddingServiceError as e:
         raise e.to_http_exception()
     except Exception as e:
@@ -70,6 +110,68 @@ async def generate_embeddings(
         )
 
 
+@router.post(
+    "/embeddings/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream embeddings for texts as NDJSON",
+    description="Generate embeddings for a list of texts and stream them one per line as they are computed."
+)
+async def generate_embeddings_stream(
+    request: TextEmbeddingRequest,
+    service: EmbeddingService = Depends(get_embedding_service)
+):
+    """Stream embeddings for texts, one NDJSON line per input text."""
+    try:
+        return _stream_embeddings(service, request.texts, request.model)
+    except EmbeddingServiceError as e:
+        raise e.to_http_exception()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": f"Failed to stream embeddings: {str(e)}"}
+        )
+
+
+@router.post(
+    "/embeddings/bin",
+    status_code=status.HTTP_200_OK,
+    summary="Generate embeddings as binary FP16",
+    description="Generate embeddings and return them as a raw little-endian float16 buffer, skipping JSON entirely."
+)
+async def generate_embeddings_binary(
+    request: TextEmbeddingRequest,
+    service: EmbeddingService = Depends(get_embedding_service)
+):
+    """Generate embeddings and return them as a raw FP16 buffer.
+
+    The row-major shape is carried in the X-Embedding-Shape header; the
+    payload is ~4x smaller than the equivalent JSON of FP32 numbers.
+    """
+    try:
+        embeddings, model_name, dimension = await service.agenerate_embeddings(
+            texts=request.texts,
+            model_name=request.model
+        )
+
+        array = np.asarray(embeddings, dtype=np.float16)
+        return Response(
+            content=array.tobytes(),
+            media_type="application/octet-stream",
+            headers={
+                "X-Embedding-Shape": f"{array.shape[0]},{array.shape[1] if array.ndim > 1 else dimension}",
+                "X-Embedding-Dtype": "float16",
+                "X-Embedding-Model": model_name
+            }
+        )
+    except EmbeddingServiceError as e:
+        raise e.to_http_exception()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": f"Failed to generate binary embeddings: {str(e)}"}
+        )
+
+
 @router.post(
     "/collections/store",
     response_model=StoreEmbeddingResponse,
@@ -83,7 +185,7 @@ async def store_embeddings(
 ):
     """Store embeddings in a collection."""
     try:
-        ids, collection_name, count = service.store_embeddings(
+        ids, collection_name, count = await service.astore_embeddings(
             texts=request.texts,
             collection_name=request.collection_name,
             metadata=request.metadata,
@@ -117,31 +219,40 @@ async def query_similar(
 ):
     """Query for similar embeddings."""
     try:
-        results, collection_name = service.query_similar(
+        results, collection_name = await service.aquery_similar(
             query_texts=request.query_texts,
             collection_name=request.collection_name,
             top_k=request.top_k,
             model_name=request.model
         )
         
-        # Convert to response model
-        query_results = []
-        for result_list in results:
-            query_result = [
-                QueryResult(
-                    id=item["id"],
-                    text=item["text"],
-                    score=item["score"],
-                    metadata=item["metadata"]
-                )
+        # The vector DB already returns dicts matching the response schema,
+        # so build plain dicts instead of per-item Pydantic models (which
+        # would validate every field for top_k x n_queries items).
+        # Embeddings stay as numpy arrays when requested; orjson serializes
+        # them directly without a .tolist() round-trip.
+        query_results = [
+            [
+                {
+                    "id": item["id"],
+                    "text": item["text"],
+                    "score": item["score"],
+                    "metadata": item.get("metadata"),
+                    **(
+                        {"embedding": item["embedding"]}
+                        if request.include_embeddings and "embedding" in item
+                        else {}
+                    )
+                }
                 for item in result_list
             ]
-            query_results.append(query_result)
-        
-        return QueryResponse(
-            results=query_results,
-            collection_name=collection_name
-        )
+            for result_list in results
+        ]
+
+        return ORJSONResponse({
+            "results": query_results,
+            "collection_name": collection_name
+        })
     except EmbeddingServiceError as e:
         raise e.to_http_exception()
     except Exception as e:
@@ -163,7 +274,7 @@ async def list_collections(
 ):
     """List collections."""
     try:
-        collections = service.list_collections()
+        collections = await service.alist_collections()
         
         # Convert to response model
         collection_infos = [
@@ -198,7 +309,7 @@ async def delete_collection(
 ):
     """Delete a collection."""
     try:
-        success = service.delete_collection(request.collection_name)
+        success = await service.adelete_collection(request.collection_name)
         
         return DeleteCollectionResponse(
             collection_name=request.collection_name,
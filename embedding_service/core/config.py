@@ -16,16 +16,33 @@ class Settings(BaseSettings):
     # Embedding model settings
     EMBEDDING_MODEL: str = "BAAI/bge-small-en-v1.5"  # Good quality model with smaller size (384 dimensions)
     EMBEDDING_DIMENSION: int = 384  # Expected dimension for the model
+    EMBEDDING_BACKEND: str = "auto"  # Options: "auto", "torch", "onnx" ("auto" picks int8 ONNX on CPU-only hosts)
     FORCE_MODEL_DOWNLOAD: bool = False  # Don't force download to avoid timeouts
     MODEL_CACHE_DIR: Optional[str] = None  # Custom cache directory for models
+    MAX_LOADED_MODELS: int = 2  # Max alternate models kept loaded alongside the default
 
     # Vector DB settings
-    VECTOR_DB_TYPE: str = "chroma"  # Options: "chroma", "faiss"
+    VECTOR_DB_TYPE: str = "chroma"  # Options: "chroma", "hnsw"
     VECTOR_DB_PATH: str = "./vector_db_data"  # Local storage path
+    STORAGE_BACKEND: str = "memory"  # Hot-read vector copies: "memory" or "mmap" (chroma only)
+
+    # HNSW index tunables (used when VECTOR_DB_TYPE == "hnsw")
+    HNSW_M: int = 16  # Graph connectivity
+    HNSW_EF_CONSTRUCTION: int = 64  # Build-time candidate list size
+    HNSW_EF_SEARCH: int = 64  # Query-time candidate list size
+    BRUTE_FORCE_THRESHOLD: int = 1024  # Below this many vectors, search with one exact BLAS matmul
 
     # Performance settings
     BATCH_SIZE: int = 32
     MAX_CONCURRENT_REQUESTS: int = 10
+    EMBEDDING_CACHE_SIZE: int = 100000  # Max entries in the content-addressed embedding cache (0 disables)
+    EMBEDDING_CACHE_DIR: Optional[str] = None  # Directory for the persistent embedding cache (None disables)
+    EMBEDDING_WORKERS: int = 1  # Worker processes for embedding; >1 enables the process pool
+    EMBED_CONCURRENCY: int = 4  # Concurrent batches dispatched for large async embedding requests
+    TORCH_COMPILE_KERNELS: bool = False  # Compile shape-specialized kernels at load (adds first-call latency)
+    MICRO_BATCH_WINDOW_MS: int = 8  # How long /embeddings waits to coalesce concurrent requests
+    MICRO_BATCH_MAX_TEXTS: int = 128  # Flush a coalesced batch once it reaches this many texts
+    STREAM_THRESHOLD: int = 256  # /embeddings switches to NDJSON streaming at this many texts (0 disables)
 
     # Logging
     LOG_LEVEL: str = "INFO"
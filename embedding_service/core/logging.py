@@ -37,8 +37,9 @@ class InterceptHandler(logging.Handler):
 
 def setup_logging():
     """Configure logging for the application."""
-    # Remove default handlers
-    logging.root.handlers = [InterceptHandler()]
+    # Route all stdlib logging to Loguru via the root handler; library
+    # loggers reach it through normal propagation
+    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
     logging.root.setLevel(settings.LOG_LEVEL)
     
     # Remove all Loguru handlers
@@ -72,9 +73,4 @@ def setup_logging():
             retention="1 month",
         )
     
-    # Intercept standard library logging
-    for name in logging.root.manager.loggerDict.keys():
-        logging.getLogger(name).handlers = []
-        logging.getLogger(name).propagate = True
-    
     return logger
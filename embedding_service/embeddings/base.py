@@ -4,6 +4,8 @@ Base class for embedding models.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
 
 class BaseEmbeddingModel(ABC):
     """Abstract base class for embedding models."""
@@ -19,7 +21,7 @@ class BaseEmbeddingModel(ABC):
         pass
     
     @abstractmethod
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(self, texts: List[str], **kwargs) -> np.ndarray:
         """Generate embeddings for a list of texts.
         
         Args:
@@ -27,7 +29,7 @@ class BaseEmbeddingModel(ABC):
             **kwargs: Additional embedding parameters
             
         Returns:
-            List of embeddings (each embedding is a list of floats)
+            Float32 array of embeddings, shape (n, dim)
         """
         pass
     
@@ -50,7 +52,7 @@ class BaseEmbeddingModel(ABC):
         pass
     
     @abstractmethod
-    def batch_embed(self, texts: List[str], batch_size: int, **kwargs) -> List[List[float]]:
+    def batch_embed(self, texts: List[str], batch_size: int, **kwargs) -> np.ndarray:
         """Generate embeddings for a list of texts in batches.
         
         Args:
@@ -59,6 +61,6 @@ class BaseEmbeddingModel(ABC):
             **kwargs: Additional embedding parameters
             
         Returns:
-            List of embeddings (each embedding is a list of floats)
+            Float32 array of embeddings, shape (n, dim)
         """
         pass
@@ -0,0 +1,71 @@
+"""
+On-disk embedding cache backing the in-memory LRU.
+"""
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+class EmbeddingDiskCache:
+    """SQLite-backed store of embeddings keyed by content digest.
+
+    Persists cache entries across restarts so repeated texts skip the
+    model forward pass even after a cold start. Vectors are stored as raw
+    float16 bytes to halve the on-disk footprint.
+    """
+
+    def __init__(self, cache_dir: str, filename: str = "embedding_cache.sqlite3"):
+        """Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            filename: Database file name within the directory
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, filename)
+        logger.info(f"Opening embedding disk cache at {path}")
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        # Durability is best-effort for a cache; trade fsync cost for speed
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.commit()
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Look up a cached embedding.
+
+        Args:
+            key: Content digest of (model, text)
+
+        Returns:
+            Float32 embedding array, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float16).astype(np.float32)
+
+    def put(self, key: bytes, embedding: np.ndarray):
+        """Store an embedding.
+
+        Args:
+            key: Content digest of (model, text)
+            embedding: Embedding to persist
+        """
+        blob = np.asarray(embedding, dtype=np.float16).tobytes()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", (key, blob)
+            )
+            self._conn.commit()
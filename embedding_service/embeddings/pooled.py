@@ -0,0 +1,126 @@
+"""
+Process-pool wrapper around the embedding model for parallel batches.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from loguru import logger
+
+from .base import BaseEmbeddingModel
+from ..core.errors import EmbeddingModelError
+
+
+# Per-process model instance, populated by the pool initializer
+_worker_model = None
+
+
+def _load_model(model_name: str, model_params: Dict[str, Any]):
+    """Load the embedding model once per worker process."""
+    global _worker_model
+    from .sentence_transformers import SentenceTransformerModel
+    _worker_model = SentenceTransformerModel(model_name=model_name, **model_params)
+
+
+def _embed_batch(texts: List[str], batch_size: int, kwargs: Dict[str, Any]) -> np.ndarray:
+    """Run batch_embed on the worker-local model."""
+    return _worker_model.batch_embed(texts, batch_size=batch_size, **kwargs)
+
+
+def _get_dimension() -> int:
+    """Get the embedding dimension from the worker-local model."""
+    return _worker_model.get_dimension()
+
+
+class PooledEmbeddingModel(BaseEmbeddingModel):
+    """Embedding model that fans batches out across a process pool.
+
+    Each worker process holds its own model instance, so batches run in
+    parallel across cores instead of contending on one GIL-bound model.
+    """
+
+    def __init__(self, model_name: str, num_workers: int = 2, **kwargs):
+        """Initialize the pooled embedding model.
+
+        Args:
+            model_name: Name of the embedding model
+            num_workers: Number of worker processes
+            **kwargs: Additional model parameters passed to each worker
+        """
+        try:
+            logger.info(f"Starting embedding worker pool: {num_workers} workers for model {model_name}")
+            self.model_name = model_name
+            self.num_workers = num_workers
+            self._pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_load_model,
+                initargs=(model_name, kwargs)
+            )
+            self._dimension: Optional[int] = None
+        except Exception as e:
+            error_msg = f"Failed to initialize embedding worker pool: {str(e)}"
+            logger.error(error_msg)
+            raise EmbeddingModelError(message=error_msg, details={"model_name": model_name})
+
+    def embed(self, texts: List[str], **kwargs) -> np.ndarray:
+        """Generate embeddings for a list of texts.
+
+        Args:
+            texts: List of texts to embed
+            **kwargs: Additional embedding parameters
+
+        Returns:
+            Float32 array of embeddings, shape (n, dim)
+        """
+        return self.batch_embed(texts, batch_size=len(texts) or 1, **kwargs)
+
+    def get_dimension(self) -> int:
+        """Get the dimension of the embeddings.
+
+        Returns:
+            Dimension of the embeddings
+        """
+        if self._dimension is None:
+            self._dimension = self._pool.submit(_get_dimension).result()
+        return self._dimension
+
+    def get_model_name(self) -> str:
+        """Get the name of the model.
+
+        Returns:
+            Name of the model
+        """
+        return self.model_name
+
+    def batch_embed(self, texts: List[str], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """Generate embeddings for a list of texts across the worker pool.
+
+        Args:
+            texts: List of texts to embed
+            batch_size: Size of each batch within a worker
+            **kwargs: Additional embedding parameters
+
+        Returns:
+            Float32 array of embeddings, shape (n, dim)
+        """
+        try:
+            if not texts:
+                return np.empty((0, self.get_dimension()), dtype=np.float32)
+
+            # Split into one contiguous sub-batch per worker and concatenate
+            # results back in order.
+            chunk_size = max(1, -(-len(texts) // self.num_workers))
+            chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+            futures = [
+                self._pool.submit(_embed_batch, chunk, batch_size, kwargs)
+                for chunk in chunks
+            ]
+
+            return np.vstack([future.result() for future in futures])
+        except EmbeddingModelError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to generate pooled batch embeddings: {str(e)}"
+            logger.error(error_msg)
+            raise EmbeddingModelError(message=error_msg, details={"batch_size": batch_size})
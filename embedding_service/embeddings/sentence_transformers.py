@@ -1,18 +1,25 @@
 """
 Sentence Transformers implementation of the embedding model.
 """
-import torch
+import hashlib
+import queue
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
+
+import numpy as np
+import torch
 from loguru import logger
 
 from .base import BaseEmbeddingModel
+from ..core.config import settings
 from ..core.errors import EmbeddingModelError
 
 
 class SentenceTransformerModel(BaseEmbeddingModel):
     """Sentence Transformers implementation of the embedding model."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", **kwargs):
+    def __init__(self, model_name: str = settings.EMBEDDING_MODEL, **kwargs):
         """Initialize the Sentence Transformers model.
 
         Args:
@@ -66,9 +73,9 @@ class SentenceTransformerModel(BaseEmbeddingModel):
                 logger.info(f"Model successfully loaded from HuggingFace or cache")
             except Exception as model_error:
                 logger.error(f"Error loading model {model_name}: {str(model_error)}")
-                logger.warning(f"Falling back to default model: BAAI/bge-small-en-v1.5")
-                self.model = SentenceTransformer("BAAI/bge-small-en-v1.5", **kwargs)
-                self.model_name = "BAAI/bge-small-en-v1.5"  # Update model name to match actual model
+                logger.warning(f"Falling back to default model: {settings.EMBEDDING_MODEL}")
+                self.model = SentenceTransformer(settings.EMBEDDING_MODEL, **kwargs)
+                self.model_name = settings.EMBEDDING_MODEL  # Update model name to match actual model
 
             # Set device if specified
             device = kwargs.get('device')
@@ -79,6 +86,45 @@ class SentenceTransformerModel(BaseEmbeddingModel):
                 logger.info(f"Moving model to CUDA automatically")
                 self.model.to('cuda')
 
+            # Content-addressed LRU cache of embeddings, keyed by sha256(text).
+            # Short-circuits both intra-batch duplicates and cross-request repeats.
+            # The lock serializes get/move_to_end/evict, since the async fan-out
+            # runs generate_embeddings chunks on concurrent threads.
+            self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+            self._cache_size = settings.EMBEDDING_CACHE_SIZE
+            self._cache_mutex = threading.Lock()
+
+            # Optional persistent layer behind the in-memory LRU, so cache
+            # hits survive restarts
+            self._disk_cache = None
+            if settings.EMBEDDING_CACHE_DIR:
+                from .disk_cache import EmbeddingDiskCache
+                self._disk_cache = EmbeddingDiskCache(settings.EMBEDDING_CACHE_DIR)
+
+            # Reusable pinned host buffers for staging tokenized batches to
+            # CUDA without per-call pageable allocations
+            self._pinned: Dict[str, torch.Tensor] = {}
+
+            # Cache the dimension: sentence-transformers walks its module
+            # list on every get_sentence_embedding_dimension() call
+            self._dim = int(self.model.get_sentence_embedding_dimension())
+
+            # Optionally compile a normalize kernel specialized to the
+            # model's fixed embedding shape. dynamic=False lets the compiler
+            # bind the concrete dim and fully unroll/vectorize; the compile
+            # cost is paid once on the first batch.
+            self._normalize_kernel = None
+            if settings.TORCH_COMPILE_KERNELS and hasattr(torch, "compile"):
+                try:
+                    self._normalize_kernel = torch.compile(
+                        lambda x: torch.nn.functional.normalize(x, p=2, dim=-1),
+                        mode="reduce-overhead",
+                        dynamic=False
+                    )
+                    logger.info("Compiled shape-specialized normalize kernel")
+                except Exception as compile_error:
+                    logger.warning(f"torch.compile unavailable, using eager normalize: {str(compile_error)}")
+
             dimension = self.get_dimension()
             logger.info(f"Model loaded successfully with dimension: {dimension}")
             if dimension != 384 and 'bge-small' in model_name:
@@ -88,7 +134,7 @@ class SentenceTransformerModel(BaseEmbeddingModel):
             logger.error(error_msg)
             raise EmbeddingModelError(message=error_msg, details={"model_name": model_name})
 
-    def embed(self, texts: List[str], **kwargs) -> List[List[float]]:
+    def embed(self, texts: List[str], **kwargs) -> np.ndarray:
         """Generate embeddings for a list of texts.
 
         Args:
@@ -96,7 +142,7 @@ class SentenceTransformerModel(BaseEmbeddingModel):
             **kwargs: Additional embedding parameters
 
         Returns:
-            List of embeddings (each embedding is a list of floats)
+            Float32 array of embeddings, shape (n, dim)
         """
         try:
             # Get embeddings
@@ -107,8 +153,7 @@ class SentenceTransformerModel(BaseEmbeddingModel):
                 show_progress_bar=kwargs.get('show_progress', False)
             )
 
-            # Convert to list of lists
-            return embeddings.tolist() if not isinstance(embeddings, list) else embeddings
+            return np.asarray(embeddings, dtype=np.float32)
         except Exception as e:
             error_msg = f"Failed to generate embeddings: {str(e)}"
             logger.error(error_msg)
@@ -120,7 +165,7 @@ class SentenceTransformerModel(BaseEmbeddingModel):
         Returns:
             Dimension of the embeddings
         """
-        return self.model.get_sentence_embedding_dimension()
+        return self._dim
 
     def get_model_name(self) -> str:
         """Get the name of the model.
@@ -130,7 +175,7 @@ class SentenceTransformerModel(BaseEmbeddingModel):
         """
         return self.model_name
 
-    def batch_embed(self, texts: List[str], batch_size: int = 32, **kwargs) -> List[List[float]]:
+    def batch_embed(self, texts: List[str], batch_size: int = 32, **kwargs) -> np.ndarray:
         """Generate embeddings for a list of texts in batches.
 
         Args:
@@ -139,21 +184,231 @@ class SentenceTransformerModel(BaseEmbeddingModel):
             **kwargs: Additional embedding parameters
 
         Returns:
-            List of embeddings (each embedding is a list of floats)
+            Float32 array of embeddings, shape (n, dim)
         """
         try:
-            # Get embeddings in batches
-            embeddings = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                convert_to_tensor=False,
-                normalize_embeddings=kwargs.get('normalize', True),
-                show_progress_bar=kwargs.get('show_progress', False)
-            )
+            # Deduplicate via the content-addressed cache: only texts that
+            # miss the cache (and appear for the first time in this call)
+            # are sent through the model forward pass.
+            keys = [self._cache_key(text) for text in texts]
+            cached: List[Optional[np.ndarray]] = [self._cache_get(key) for key in keys]
+
+            miss_indices = []
+            seen_keys = set()
+            for i, embedding in enumerate(cached):
+                if embedding is None and keys[i] not in seen_keys:
+                    miss_indices.append(i)
+                    seen_keys.add(keys[i])
+
+            computed_by_key: Dict[bytes, np.ndarray] = {}
+            if miss_indices:
+                miss_texts = [texts[i] for i in miss_indices]
+                normalize = kwargs.get('normalize', True)
 
-            # Convert to list of lists
-            return embeddings.tolist() if not isinstance(embeddings, list) else embeddings
+                # Large calls go through the tokenize/forward pipeline so the
+                # tokenizer CPU work overlaps the model forward pass; small
+                # calls stay on the plain encode fast path.
+                if len(miss_texts) >= 2 * batch_size:
+                    embeddings = self._pipelined_encode(miss_texts, batch_size, normalize)
+                else:
+                    embeddings = np.asarray(self.model.encode(
+                        miss_texts,
+                        batch_size=batch_size,
+                        convert_to_tensor=False,
+                        normalize_embeddings=False,
+                        show_progress_bar=kwargs.get('show_progress', False)
+                    ), dtype=np.float32)
+                    if normalize:
+                        embeddings = self._normalize_inplace(embeddings)
+
+                for i, embedding in zip(miss_indices, embeddings):
+                    computed_by_key[keys[i]] = embedding
+                    self._cache_put(keys[i], embedding)
+
+            # Assemble the output array, scattering computed rows back
+            # (covers intra-batch duplicates too)
+            if not texts:
+                return np.empty((0, self._dim), dtype=np.float32)
+            rows = [
+                embedding if embedding is not None else computed_by_key[keys[i]]
+                for i, embedding in enumerate(cached)
+            ]
+            return np.vstack(rows)
         except Exception as e:
             error_msg = f"Failed to generate batch embeddings: {str(e)}"
             logger.error(error_msg)
             raise EmbeddingModelError(message=error_msg, details={"batch_size": batch_size})
+
+    def _pipelined_encode(self, texts: List[str], batch_size: int, normalize: bool) -> np.ndarray:
+        """Encode texts with tokenization overlapped against the forward pass.
+
+        A background thread tokenizes batches into a bounded queue while this
+        thread drains it and runs the model forward, so the device is not idle
+        while the next batch is being tokenized.
+
+        Args:
+            texts: Texts to encode
+            batch_size: Size of each batch
+            normalize: Whether to L2-normalize the embeddings
+
+        Returns:
+            Float32 array of embeddings, shape (n, dim)
+        """
+        batches: "queue.Queue" = queue.Queue(maxsize=4)
+        stop = threading.Event()
+
+        def put_batch(item) -> bool:
+            # Timed put so the worker notices `stop` even when the queue is
+            # full (the consumer stops draining once the forward pass raises)
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def tokenize_worker():
+            try:
+                for start in range(0, len(texts), batch_size):
+                    if not put_batch(self.model.tokenize(texts[start:start + batch_size])):
+                        return
+                put_batch(None)
+            except Exception as e:
+                put_batch(e)
+
+        worker = threading.Thread(target=tokenize_worker, daemon=True)
+        worker.start()
+
+        device = next(self.model.parameters()).device
+        outputs = []
+        try:
+            with torch.no_grad():
+                while True:
+                    features = batches.get()
+                    if features is None:
+                        break
+                    if isinstance(features, Exception):
+                        raise features
+
+                    features = self._features_to_device(features, device)
+                    embeddings = self.model.forward(features)['sentence_embedding']
+                    if normalize:
+                        if self._normalize_kernel is not None:
+                            embeddings = self._normalize_kernel(embeddings)
+                        else:
+                            # In-place divide by the row norms: one read+write of
+                            # the batch instead of allocating a normalized copy.
+                            embeddings = embeddings.div_(embeddings.norm(dim=1, keepdim=True).clamp_min_(1e-12))
+                    outputs.append(embeddings.cpu())
+        finally:
+            stop.set()
+            worker.join()
+
+        return torch.cat(outputs).numpy().astype(np.float32, copy=False)
+
+    def _features_to_device(self, features: Dict[str, Any], device: torch.device) -> Dict[str, Any]:
+        """Move tokenized features to the model device.
+
+        On CUDA, 2D integer tensors are staged through preallocated pinned
+        buffers and copied with non_blocking=True, so the host-to-device
+        transfer overlaps the previous batch's forward pass instead of
+        bouncing through a fresh pageable allocation each call.
+
+        Args:
+            features: Tokenizer output (BatchEncoding-style dict)
+            device: Target device
+
+        Returns:
+            Features dict with tensors on the target device
+        """
+        moved = {}
+        for key, value in features.items():
+            if not isinstance(value, torch.Tensor):
+                moved[key] = value
+            elif device.type == 'cuda' and value.dim() == 2:
+                buffer = self._pinned.get(key)
+                if (buffer is None or buffer.dtype != value.dtype
+                        or buffer.shape[0] < value.shape[0] or buffer.shape[1] < value.shape[1]):
+                    buffer = torch.empty(
+                        (max(value.shape[0], buffer.shape[0] if buffer is not None else 0),
+                         max(value.shape[1], buffer.shape[1] if buffer is not None else 0)),
+                        dtype=value.dtype,
+                        pin_memory=True
+                    )
+                    self._pinned[key] = buffer
+                staged = buffer[:value.shape[0], :value.shape[1]]
+                staged.copy_(value)
+                moved[key] = staged.to(device, non_blocking=True)
+            else:
+                moved[key] = value.to(device)
+        return moved
+
+    @staticmethod
+    def _normalize_inplace(embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalize a 2D float32 array of embeddings in place.
+
+        Args:
+            embeddings: Array of shape (n, dim) to normalize
+
+        Returns:
+            The same array, row-normalized
+        """
+        norms = np.sqrt(np.einsum('ij,ij->i', embeddings, embeddings))[:, np.newaxis]
+        np.maximum(norms, 1e-12, out=norms)
+        embeddings /= norms
+        return embeddings
+
+    def _cache_key(self, text: str) -> bytes:
+        """Build the content-addressed cache key for a text.
+
+        Args:
+            text: Text to build the key for
+
+        Returns:
+            Digest uniquely identifying (model, text)
+        """
+        return hashlib.sha256(self.model_name.encode() + b"\x00" + text.encode()).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[np.ndarray]:
+        """Look up a cached embedding, refreshing its LRU position.
+
+        Args:
+            key: Cache key from `_cache_key`
+
+        Returns:
+            Cached embedding, or None on a miss
+        """
+        with self._cache_mutex:
+            embedding = self._cache.get(key)
+            if embedding is not None:
+                self._cache.move_to_end(key)
+                return embedding
+
+        # Fall through to the persistent layer and promote hits
+        if self._disk_cache is not None:
+            embedding = self._disk_cache.get(key)
+            if embedding is not None and self._cache_size > 0:
+                with self._cache_mutex:
+                    self._cache[key] = embedding
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+        return embedding
+
+    def _cache_put(self, key: bytes, embedding: np.ndarray):
+        """Insert an embedding, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from `_cache_key`
+            embedding: Embedding to cache
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.put(key, embedding)
+        if self._cache_size <= 0:
+            return
+        with self._cache_mutex:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
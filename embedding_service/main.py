@@ -4,7 +4,8 @@ Main entry point for the Embedding Service.
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import time
 from typing import Dict, Any
 
@@ -24,6 +25,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -35,10 +37,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (embedding responses are mostly ASCII float
+# digits and shrink 4-6x under gzip)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("startup")
+async def warm_up():
+    """Load the embedding model before serving traffic.
+
+    The model would otherwise load lazily inside the first request, making
+    that request pay the multi-second cold start. A warm-up failure only
+    logs a warning; the lazy path still covers the first real request.
+    """
+    from fastapi.concurrency import run_in_threadpool
+    from embedding_service.api.routes import embedding_service
+
+    try:
+        await run_in_threadpool(embedding_service.generate_embeddings, ["warm-up"], None)
+        logger.info("Embedding model warmed up")
+    except Exception as e:
+        logger.warning(f"Warm-up failed, model will load on first request: {str(e)}")
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log requests and responses."""
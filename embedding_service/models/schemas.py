@@ -1,17 +1,18 @@
 """
 Pydantic models for the Embedding Service.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Dict, List, Optional, Union, Any
 
 
 class TextEmbeddingRequest(BaseModel):
     """Request model for text embedding generation."""
-    
-    texts: List[str] = Field(..., min_items=1, description="List of texts to embed")
+
+    texts: List[str] = Field(..., min_length=1, description="List of texts to embed")
     model: Optional[str] = Field(None, description="Embedding model to use")
-    
-    @validator('texts')
+
+    @field_validator('texts')
+    @classmethod
     def validate_texts(cls, texts):
         if not all(isinstance(text, str) for text in texts):
             raise ValueError("All items in 'texts' must be strings")
@@ -31,16 +32,16 @@ class TextEmbeddingResponse(BaseModel):
 class StoreEmbeddingRequest(BaseModel):
     """Request model for storing embeddings in the vector database."""
     
-    texts: List[str] = Field(..., min_items=1, description="List of texts to embed and store")
+    texts: List[str] = Field(..., min_length=1, description="List of texts to embed and store")
     metadata: Optional[List[Dict[str, Any]]] = Field(None, description="Metadata for each text")
     collection_name: str = Field(..., description="Name of the collection to store embeddings")
     model: Optional[str] = Field(None, description="Embedding model to use")
-    
-    @validator('metadata')
-    def validate_metadata(cls, metadata, values):
-        if metadata and 'texts' in values and len(metadata) != len(values['texts']):
+
+    @model_validator(mode='after')
+    def validate_metadata(self):
+        if self.metadata and len(self.metadata) != len(self.texts):
             raise ValueError("Length of metadata must match length of texts")
-        return metadata
+        return self
 
 
 class StoreEmbeddingResponse(BaseModel):
@@ -54,10 +55,11 @@ class StoreEmbeddingResponse(BaseModel):
 class QueryRequest(BaseModel):
     """Request model for querying similar embeddings."""
     
-    query_texts: List[str] = Field(..., min_items=1, description="List of query texts")
+    query_texts: List[str] = Field(..., min_length=1, description="List of query texts")
     collection_name: str = Field(..., description="Name of the collection to query")
     top_k: int = Field(5, ge=1, le=100, description="Number of results to return")
     model: Optional[str] = Field(None, description="Embedding model to use")
+    include_embeddings: bool = Field(False, description="Include stored embeddings in the results")
 
 
 class QueryResult(BaseModel):
@@ -67,6 +69,7 @@ class QueryResult(BaseModel):
     text: str = Field(..., description="Original text")
     score: float = Field(..., description="Similarity score")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Metadata associated with the embedding")
+    embedding: Optional[List[float]] = Field(None, description="Stored embedding, if requested")
 
 
 class QueryResponse(BaseModel):
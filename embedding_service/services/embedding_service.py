@@ -1,15 +1,48 @@
 """
 Embedding service implementation.
 """
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Type
+
+import numpy as np
 from loguru import logger
 
 from ..core.config import settings
 from ..core.errors import EmbeddingServiceError, ValidationError, ResourceNotFoundError
 from ..embeddings.base import BaseEmbeddingModel
+from ..embeddings.onnx_backend import ONNXEmbeddingModel
+from ..embeddings.pooled import PooledEmbeddingModel
 from ..embeddings.sentence_transformers import SentenceTransformerModel
 from ..vector_db.base import BaseVectorDB
 from ..vector_db.chroma import ChromaVectorDB
+from ..vector_db.hnsw import HnswVectorDB
+
+
+@lru_cache(maxsize=1024)
+def _query_terms(query: str) -> Tuple[str, ...]:
+    """Split a query into its unique lowercase terms, cached.
+
+    Chat traffic repeats queries heavily (follow-ups, retries, paraphrase
+    loops), so caching the term split removes it from the rerank hot
+    path. The terms are sorted so the result is deterministic across
+    processes; a regex alternation built from a set was not, and its
+    match counts depended on hash-randomized term order when terms
+    overlapped (e.g. "cat" and "category").
+
+    Args:
+        query: Original query text
+
+    Returns:
+        Sorted unique query terms; empty for empty queries
+    """
+    return tuple(sorted(set(query.lower().split())))
 
 
 class EmbeddingService:
@@ -19,6 +52,16 @@ class EmbeddingService:
         """Initialize the embedding service."""
         self._embedding_model = None
         self._vector_db = None
+
+        # Bounded LRU of alternate models so non-default model requests
+        # don't reload a checkpoint per call
+        self._model_cache: "OrderedDict[str, BaseEmbeddingModel]" = OrderedDict()
+        self._model_lock = threading.Lock()
+
+        # Collection dimensions are immutable once created, so cache them and
+        # skip the vector-DB metadata round trip on every query
+        self._collection_dim_cache: Dict[str, int] = {}
+
         self._initialize_components()
 
     def _initialize_components(self):
@@ -31,9 +74,53 @@ class EmbeddingService:
         # Initialize vector database
         self._vector_db = self._create_vector_db(
             db_type=settings.VECTOR_DB_TYPE,
-            persist_directory=settings.VECTOR_DB_PATH
+            persist_directory=settings.VECTOR_DB_PATH,
+            storage_backend=settings.STORAGE_BACKEND
         )
 
+        self._init_catalog()
+
+    def _init_catalog(self):
+        """Open the on-disk catalog of collection metadata.
+
+        Listing collections through the vector DB walks every collection's
+        metadata; the catalog keeps (name, count, dimension) in one small
+        SQLite table updated on store/delete, so listing is a single SELECT
+        regardless of collection count.
+        """
+        os.makedirs(settings.VECTOR_DB_PATH, exist_ok=True)
+        path = os.path.join(settings.VECTOR_DB_PATH, "_catalog.db")
+        self._catalog_lock = threading.Lock()
+        self._catalog = sqlite3.connect(path, check_same_thread=False)
+        self._catalog.execute(
+            "CREATE TABLE IF NOT EXISTS collections ("
+            "name TEXT PRIMARY KEY, count INTEGER NOT NULL, "
+            "dim INTEGER NOT NULL, updated_at INTEGER NOT NULL)"
+        )
+        self._catalog.commit()
+
+    def _catalog_record_store(self, collection_name: str, added: int, dimension: int):
+        """Record a store event in the catalog.
+
+        The count is incremented by the rows written; upserts that replace
+        existing rows may overcount slightly, which is acceptable for a
+        listing cache.
+        """
+        with self._catalog_lock:
+            self._catalog.execute(
+                "INSERT INTO collections (name, count, dim, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET count = count + excluded.count, "
+                "updated_at = excluded.updated_at",
+                (collection_name, added, dimension, int(time.time()))
+            )
+            self._catalog.commit()
+
+    def _catalog_record_delete(self, collection_name: str):
+        """Remove a collection's row from the catalog."""
+        with self._catalog_lock:
+            self._catalog.execute("DELETE FROM collections WHERE name = ?", (collection_name,))
+            self._catalog.commit()
+
     def _create_embedding_model(self, model_name: str) -> BaseEmbeddingModel:
         """Create an embedding model.
 
@@ -50,19 +137,48 @@ class EmbeddingService:
             'cache_folder': settings.MODEL_CACHE_DIR,
         }
 
-        # If force download is enabled, add a unique cache folder to bypass cache
+        # Forced downloads go into one stable per-model cache directory with
+        # a completion sentinel, so a force only re-downloads once instead of
+        # pulling the checkpoint into a fresh tempdir on every call
+        force_sentinel = None
         if settings.FORCE_MODEL_DOWNLOAD:
+            import shutil
             import tempfile
-            import os
-            import uuid
-            # Create a unique temporary directory for this download
-            temp_dir = os.path.join(tempfile.gettempdir(), f"st_model_{uuid.uuid4().hex}")
-            os.makedirs(temp_dir, exist_ok=True)
-            model_params['cache_folder'] = temp_dir
-            logger.info(f"Forcing model download to temporary directory: {temp_dir}")
+            from pathlib import Path
+
+            cache_root = Path(settings.MODEL_CACHE_DIR or Path(tempfile.gettempdir()) / "st_models")
+            cache_dir = cache_root / model_name.replace('/', '_')
+            force_sentinel = cache_dir / ".complete"
+
+            if force_sentinel.exists():
+                logger.info(f"Forced download already completed in {cache_dir}, reusing it")
+                force_sentinel = None
+            else:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                logger.info(f"Forcing model download into cache directory: {cache_dir}")
+
+            model_params['cache_folder'] = str(cache_dir)
+
+        # On CPU-only hosts the int8 ONNX backend is several times faster
+        # than FP32 torch, so "auto" picks it when its dependencies exist.
+        # Names pointing at an exported ONNX artifact always use it.
+        if model_name.endswith(".onnx") or self._use_onnx_backend():
+            model = ONNXEmbeddingModel(model_name=model_name, **model_params)
+        # Fan out across a process pool when configured, otherwise a single
+        # in-process Sentence Transformers model
+        elif settings.EMBEDDING_WORKERS > 1:
+            model = PooledEmbeddingModel(
+                model_name=model_name,
+                num_workers=settings.EMBEDDING_WORKERS,
+                **model_params
+            )
+        else:
+            model = SentenceTransformerModel(model_name=model_name, **model_params)
 
-        # Currently only supporting Sentence Transformers
-        model = SentenceTransformerModel(model_name=model_name, **model_params)
+        # Mark the forced download complete so later calls reuse the cache
+        if force_sentinel is not None:
+            force_sentinel.touch()
 
         # Verify the model dimension matches what we expect
         actual_dim = model.get_dimension()
@@ -75,6 +191,54 @@ class EmbeddingService:
 
         return model
 
+    def _get_or_load_model(self, model_name: str) -> BaseEmbeddingModel:
+        """Get a cached alternate model, loading and caching it on first use.
+
+        The lock keeps concurrent requests from double-loading the same
+        checkpoint; the cache is LRU-bounded by MAX_LOADED_MODELS.
+
+        Args:
+            model_name: Name of the model to load
+
+        Returns:
+            Embedding model instance
+        """
+        with self._model_lock:
+            model = self._model_cache.get(model_name)
+            if model is not None:
+                self._model_cache.move_to_end(model_name)
+                return model
+
+            model = self._create_embedding_model(model_name)
+            self._model_cache[model_name] = model
+            while len(self._model_cache) > settings.MAX_LOADED_MODELS:
+                evicted_name, _ = self._model_cache.popitem(last=False)
+                logger.info(f"Evicted cached embedding model: {evicted_name}")
+            return model
+
+    def _use_onnx_backend(self) -> bool:
+        """Decide whether to serve embeddings through the ONNX backend.
+
+        Returns:
+            True if the ONNX backend should be used
+        """
+        backend = settings.EMBEDDING_BACKEND.lower()
+        if backend == "onnx":
+            return True
+        if backend != "auto":
+            return False
+
+        # Auto mode: prefer ONNX only on CPU-only hosts where the optional
+        # dependencies are installed
+        import importlib.util
+        if importlib.util.find_spec("optimum") is None:
+            return False
+        try:
+            import torch
+            return not torch.cuda.is_available()
+        except ImportError:
+            return True
+
     def _create_vector_db(self, db_type: str, **kwargs) -> BaseVectorDB:
         """Create a vector database.
 
@@ -87,9 +251,10 @@ class EmbeddingService:
         """
         logger.info(f"Creating vector database: {db_type}")
 
-        # Currently only supporting ChromaDB
         if db_type.lower() == "chroma":
             return ChromaVectorDB(**kwargs)
+        elif db_type.lower() == "hnsw":
+            return HnswVectorDB(**kwargs)
         else:
             raise ValueError(f"Unsupported vector database type: {db_type}")
 
@@ -97,7 +262,7 @@ class EmbeddingService:
         self,
         texts: List[str],
         model_name: Optional[str] = None
-    ) -> Tuple[List[List[float]], str, int]:
+    ) -> Tuple[np.ndarray, str, int]:
         """Generate embeddings for a list of texts.
 
         Args:
@@ -105,14 +270,14 @@ class EmbeddingService:
             model_name: Optional model name to use
 
         Returns:
-            Tuple of (embeddings, model_name, dimension)
+            Tuple of (float32 embedding array, model_name, dimension)
         """
         logger.info(f"Generating embeddings for {len(texts)} texts")
 
         # Use specified model or default
         model = self._embedding_model
         if model_name and model_name != model.get_model_name():
-            model = self._create_embedding_model(model_name)
+            model = self._get_or_load_model(model_name)
 
         # Generate embeddings in batches
         embeddings = model.batch_embed(
@@ -145,19 +310,44 @@ class EmbeddingService:
         # Generate embeddings
         embeddings, model_name, dimension = self.generate_embeddings(texts, model_name)
 
+        # Hand the vectors downstream as one contiguous half-precision array
+        # instead of nested Python lists: half the bytes in transit, and the
+        # vector DB re-parses a single buffer rather than N*dim PyFloats.
+        # The HTTP schema stays fp32 JSON. Normalizing here (models already
+        # do by default) makes unit length a hard invariant, so the index can
+        # use plain inner product instead of cosine.
+        vector_array = np.asarray(self._l2_normalize(embeddings), dtype=np.float16)
+
         # Create collection if it doesn't exist
         if not self._vector_db.collection_exists(collection_name):
             self._vector_db.create_collection(collection_name, dimension)
+            self._collection_dim_cache[collection_name] = dimension
+
+        # Deterministic content-derived ids: the same text always maps to the
+        # same id, so re-ingesting a document upserts in place instead of
+        # accumulating duplicate rows. Duplicates within the batch are
+        # collapsed before hitting the vector DB.
+        ids = [
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+            for text in texts
+        ]
+        seen: set = set()
+        unique_indices = [i for i, id_ in enumerate(ids) if not (id_ in seen or seen.add(id_))]
 
         # Store embeddings
-        ids = self._vector_db.add_vectors(
+        self._vector_db.add_vectors(
             collection_name=collection_name,
-            vectors=embeddings,
-            texts=texts,
-            metadata=metadata
+            vectors=vector_array[unique_indices],
+            texts=[texts[i] for i in unique_indices],
+            metadata=[metadata[i] for i in unique_indices] if metadata else None,
+            ids=[ids[i] for i in unique_indices]
         )
 
-        return ids, collection_name, len(ids)
+        self._catalog_record_store(collection_name, len(unique_indices), dimension)
+
+        # ids still maps one-to-one onto the input texts, but count reports
+        # what was actually stored after collapsing in-batch duplicates
+        return ids, collection_name, len(unique_indices)
 
     def query_similar(
         self,
@@ -186,17 +376,24 @@ class EmbeddingService:
                 details={"collection_name": collection_name}
             )
 
-        # Get collection info to check dimension
-        collection_info = self._vector_db.get_collection_info(collection_name)
-        collection_dimension = collection_info.get("dimension", 0)
-
-        # Use the specified model or default to BAAI/bge-small-en-v1.5
-        effective_model_name = model_name or "BAAI/bge-small-en-v1.5"
-
-        # Log a warning if dimensions don't match
-        if collection_dimension > 0 and collection_dimension != 384:
-            logger.warning(f"Collection '{collection_name}' has dimension {collection_dimension} which doesn't match the expected dimension 384")
-            logger.warning(f"This may cause errors. Consider reindexing the collection with the BAAI/bge-small-en-v1.5 model.")
+        # Check the collection dimension, cached after the first lookup so
+        # repeat queries skip the metadata round trip. The mismatch warning
+        # fires once at cache population instead of on every request.
+        collection_dimension = self._collection_dim_cache.get(collection_name)
+        if collection_dimension is None:
+            collection_info = self._vector_db.get_collection_info(collection_name)
+            collection_dimension = collection_info.get("dimension", 0)
+            self._collection_dim_cache[collection_name] = collection_dimension
+
+            if collection_dimension > 0 and collection_dimension != settings.EMBEDDING_DIMENSION:
+                logger.warning(
+                    f"Collection '{collection_name}' has dimension {collection_dimension} which doesn't match "
+                    f"the expected dimension {settings.EMBEDDING_DIMENSION}. This may cause errors. "
+                    f"Consider reindexing the collection with the {settings.EMBEDDING_MODEL} model."
+                )
+
+        # Use the specified model or the configured default
+        effective_model_name = model_name or settings.EMBEDDING_MODEL
 
         # Preprocess and expand queries
         processed_queries = []
@@ -212,8 +409,10 @@ class EmbeddingService:
             # Add query expansion if needed
             # processed_queries.extend(self._expand_query(clean_query))
 
-        # Generate embeddings for processed query texts
+        # Generate embeddings for processed query texts, normalized so
+        # inner-product indexes score them as cosine similarity
         query_embeddings, _, _ = self.generate_embeddings(processed_queries, effective_model_name)
+        query_embeddings = self._l2_normalize(query_embeddings)
 
         # Query for similar embeddings
         results = self._vector_db.search(
@@ -238,7 +437,23 @@ class EmbeddingService:
             List of collection information
         """
         logger.info("Listing collections")
-        return self._vector_db.list_collections()
+
+        with self._catalog_lock:
+            rows = self._catalog.execute(
+                "SELECT name, count, dim FROM collections ORDER BY name"
+            ).fetchall()
+        if rows:
+            return [
+                {"name": name, "count": count, "dimension": dim}
+                for name, count, dim in rows
+            ]
+
+        # Catalog empty (first run or pre-catalog data): fall back to the
+        # vector DB scan once and seed the catalog from it
+        collections = self._vector_db.list_collections()
+        for info in collections:
+            self._catalog_record_store(info["name"], info["count"], info["dimension"])
+        return collections
 
     def delete_collection(self, collection_name: str) -> bool:
         """Delete a collection.
@@ -250,7 +465,11 @@ class EmbeddingService:
             True if successful, False otherwise
         """
         logger.info(f"Deleting collection '{collection_name}'")
-        return self._vector_db.delete_collection(collection_name)
+        self._collection_dim_cache.pop(collection_name, None)
+        success = self._vector_db.delete_collection(collection_name)
+        if success:
+            self._catalog_record_delete(collection_name)
+        return success
 
     def _rerank_results(
         self,
@@ -268,40 +487,162 @@ class EmbeddingService:
         Returns:
             Reranked results
         """
-        # Simple reranking based on exact matches and metadata
-        for result in results:
-            # Initialize boost
-            boost = 0.0
-
-            # Boost for exact matches
-            query_terms = query.lower().split()
-            for term in query_terms:
-                if term in result["text"].lower():
-                    boost += 0.05  # Small boost per matching term
-
-            # Boost based on metadata (if available)
-            metadata = result.get("metadata", {})
-            if metadata:
-                # Example: boost documents with specific metadata
-                if "document_type" in metadata:
-                    doc_type = metadata.get("document_type", "").lower()
-                    if "policy" in doc_type:
-                        boost += 0.15  # Higher boost for policy documents
-                    elif "summary" in doc_type:
-                        boost += 0.1  # Medium boost for summaries
-
-                # Example: boost documents with more complete metadata
-                metadata_completeness = len(metadata) / 10.0  # Normalize by assuming 10 fields is complete
-                boost += min(0.1, metadata_completeness * 0.1)  # Max 0.1 boost for metadata completeness
-
-            # Apply the boost (capped at 1.0)
-            result["score"] = min(1.0, result["score"] + boost)
-
-        # Sort by updated score
-        reranked = sorted(results, key=lambda x: x["score"], reverse=True)[:top_k]
+        if not results:
+            return results
+
+        # Vectorized scoring: lowercase each text once, count the query
+        # terms it contains (same substring semantics as the baseline
+        # per-term checks), and accumulate all boosts in float32 arrays
+        # instead of per-item Python arithmetic
+        terms = _query_terms(query)
+
+        def count_terms(text: str) -> int:
+            text_lower = text.lower()
+            return sum(1 for term in terms if term in text_lower)
+
+        term_boosts = np.fromiter(
+            (
+                0.05 * count_terms(result["text"]) if terms else 0.0
+                for result in results
+            ),
+            dtype=np.float32,
+            count=len(results)
+        )
+        metadata_boosts = np.fromiter(
+            (self._metadata_boost(result.get("metadata")) for result in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+        scores = np.fromiter(
+            (result["score"] for result in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+
+        # Apply the boosts (capped at 1.0), then select the top_k with an
+        # O(n) partition and only sort that slice — the tail never needs
+        # ordering
+        boosted = np.minimum(scores + term_boosts + metadata_boosts, 1.0)
+        if top_k < len(boosted):
+            top = np.argpartition(-boosted, top_k - 1)[:top_k]
+            order = top[np.argsort(-boosted[top])]
+        else:
+            order = np.argsort(-boosted)
+
+        reranked = []
+        for i in order:
+            result = results[i]
+            result["score"] = float(boosted[i])
+            reranked.append(result)
 
         return reranked
 
+    @staticmethod
+    def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize each row of a float32 vector array in place.
+
+        Args:
+            vectors: Array of shape (n, dim)
+
+        Returns:
+            The same array with unit-length rows
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        norms = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))[:, np.newaxis]
+        np.maximum(norms, 1e-12, out=norms)
+        vectors /= norms
+        return vectors
+
+    @staticmethod
+    def _metadata_boost(metadata: Optional[Dict[str, Any]]) -> float:
+        """Compute the metadata-derived score boost for a result.
+
+        Args:
+            metadata: Result metadata (may be None or empty)
+
+        Returns:
+            Boost value
+        """
+        if not metadata:
+            return 0.0
+
+        boost = 0.0
+
+        # Boost documents with specific metadata
+        if "document_type" in metadata:
+            doc_type = metadata.get("document_type", "").lower()
+            if "policy" in doc_type:
+                boost += 0.15  # Higher boost for policy documents
+            elif "summary" in doc_type:
+                boost += 0.1  # Medium boost for summaries
+
+        # Boost documents with more complete metadata
+        metadata_completeness = len(metadata) / 10.0  # Normalize by assuming 10 fields is complete
+        boost += min(0.1, metadata_completeness * 0.1)  # Max 0.1 boost for metadata completeness
+
+        return boost
+
+    async def agenerate_embeddings(
+        self,
+        texts: List[str],
+        model_name: Optional[str] = None
+    ) -> Tuple[np.ndarray, str, int]:
+        """Async wrapper for `generate_embeddings`.
+
+        Runs the CPU-bound embedding work in a thread so the event loop
+        stays free for other requests. Large inputs are split into batches
+        dispatched concurrently (bounded by EMBED_CONCURRENCY) so
+        tokenization, forward passes and host/device copies overlap.
+        """
+        if settings.EMBED_CONCURRENCY > 1 and len(texts) >= 2 * settings.BATCH_SIZE:
+            semaphore = asyncio.Semaphore(settings.EMBED_CONCURRENCY)
+
+            async def run_chunk(chunk: List[str]) -> Tuple[np.ndarray, str, int]:
+                async with semaphore:
+                    return await asyncio.to_thread(self.generate_embeddings, chunk, model_name)
+
+            parts = await asyncio.gather(*(
+                run_chunk(texts[start:start + settings.BATCH_SIZE])
+                for start in range(0, len(texts), settings.BATCH_SIZE)
+            ))
+            embeddings = np.vstack([part[0] for part in parts])
+            _, used_model, dimension = parts[0]
+            return embeddings, used_model, dimension
+
+        return await asyncio.to_thread(self.generate_embeddings, texts, model_name)
+
+    async def astore_embeddings(
+        self,
+        texts: List[str],
+        collection_name: str,
+        metadata: Optional[List[Dict[str, Any]]] = None,
+        model_name: Optional[str] = None
+    ) -> Tuple[List[str], str, int]:
+        """Async wrapper for `store_embeddings`."""
+        return await asyncio.to_thread(
+            self.store_embeddings, texts, collection_name, metadata, model_name
+        )
+
+    async def aquery_similar(
+        self,
+        query_texts: List[str],
+        collection_name: str,
+        top_k: int = 5,
+        model_name: Optional[str] = None
+    ) -> Tuple[List[List[Dict[str, Any]]], str]:
+        """Async wrapper for `query_similar`."""
+        return await asyncio.to_thread(
+            self.query_similar, query_texts, collection_name, top_k, model_name
+        )
+
+    async def alist_collections(self) -> List[Dict[str, Any]]:
+        """Async wrapper for `list_collections`."""
+        return await asyncio.to_thread(self.list_collections)
+
+    async def adelete_collection(self, collection_name: str) -> bool:
+        """Async wrapper for `delete_collection`."""
+        return await asyncio.to_thread(self.delete_collection, collection_name)
+
     def get_health_info(self) -> Dict[str, Any]:
         """Get health information.
 
@@ -0,0 +1,107 @@
+"""
+Micro-batching of concurrent embedding requests.
+"""
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..core.config import settings
+
+
+class EmbeddingMicroBatcher:
+    """Coalesces concurrent embedding requests into one forward pass.
+
+    Requests arriving within a short window are collected from an asyncio
+    queue and embedded together, amortizing tokenizer setup and kernel
+    launches across callers. Each caller gets its own slice of the batched
+    result back through a future.
+    """
+
+    def __init__(self, service):
+        """Initialize the micro-batcher.
+
+        Args:
+            service: EmbeddingService used to run the coalesced batches
+        """
+        self._service = service
+        self._max_texts = settings.MICRO_BATCH_MAX_TEXTS
+        self._window = settings.MICRO_BATCH_WINDOW_MS / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+
+    async def embed(self, texts: List[str], model_name: Optional[str] = None) -> Tuple[np.ndarray, str, int]:
+        """Embed texts, coalescing with other concurrent callers.
+
+        Args:
+            texts: List of texts to embed
+            model_name: Optional model name to use
+
+        Returns:
+            Tuple of (float32 embedding array, model_name, dimension)
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, model_name, future))
+        return await future
+
+    def _ensure_worker(self):
+        """Lazily create the queue and worker task on the running loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.ensure_future(self._worker())
+
+    async def _worker(self):
+        """Drain the queue, flushing on max-batch or max-wait."""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            total = len(items[0][0])
+            deadline = loop.time() + self._window
+
+            while total < self._max_texts:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                items.append(item)
+                total += len(item[0])
+
+            # Group by requested model so one flush still means one forward
+            # pass per distinct model
+            groups: Dict[Optional[str], List[Tuple[List[str], Optional[str], asyncio.Future]]] = {}
+            for item in items:
+                groups.setdefault(item[1], []).append(item)
+
+            for model_name, group in groups.items():
+                await self._flush_group(model_name, group)
+
+    async def _flush_group(self, model_name: Optional[str], group):
+        """Embed one model's worth of queued requests in a single call."""
+        merged: List[str] = []
+        for texts, _, _ in group:
+            merged.extend(texts)
+
+        try:
+            embeddings, used_model, dimension = await asyncio.to_thread(
+                self._service.generate_embeddings, merged, model_name
+            )
+        except Exception as e:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for texts, _, future in group:
+            if not future.done():
+                future.set_result((embeddings[offset:offset + len(texts)], used_model, dimension))
+            offset += len(texts)
+
+        if len(group) > 1:
+            logger.debug(f"Micro-batched {len(group)} requests ({len(merged)} texts) into one forward pass")
@@ -7,10 +7,22 @@ from fastapi.testclient import TestClient
 from ..main import app
 
 
-# Create test client
+# Create test client once for the whole module; constructing one per test
+# would re-run app startup (and the model warm-up) every time
 client = TestClient(app)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_up_service():
+    """Issue one warm-up request before the timed tests run.
+
+    The first embedding call pays the model load; doing it here keeps
+    that cost out of every individual test's runtime.
+    """
+    client.post("/api/v1/embeddings", json={"texts": ["warm-up"]})
+    yield
+
+
 def test_root():
     """Test the root endpoint."""
     response = client.get("/")
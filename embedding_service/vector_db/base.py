@@ -1,9 +1,15 @@
 """
 Base class for vector databases.
 """
+import asyncio
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Any, Optional, Tuple, Union
 
+import numpy as np
+
 
 class BaseVectorDB(ABC):
     """Abstract base class for vector databases."""
@@ -55,7 +61,7 @@ class BaseVectorDB(ABC):
     def add_vectors(
         self,
         collection_name: str,
-        vectors: List[List[float]],
+        vectors: Union[List[List[float]], np.ndarray],
         texts: List[str],
         metadata: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None
@@ -64,7 +70,7 @@ class BaseVectorDB(ABC):
 
         Args:
             collection_name: Name of the collection
-            vectors: List of vectors to add
+            vectors: Vectors to add (nested lists or a 2D array)
             texts: Original texts for the vectors
             metadata: Optional metadata for each vector
             ids: Optional IDs for the vectors
@@ -118,3 +124,79 @@ class BaseVectorDB(ABC):
             True if the collection exists, False otherwise
         """
         pass
+
+    @staticmethod
+    def _generate_ids(count: int) -> List[str]:
+        """Generate random vector ids from one batched entropy read.
+
+        Per-row uuid4 calls hit os.urandom once per id; drawing all the
+        random bytes in a single call removes that per-row syscall. Ids
+        keep the uuid4 format so existing rows and callers are unaffected.
+
+        Args:
+            count: Number of ids to generate
+
+        Returns:
+            List of uuid4-formatted id strings
+        """
+        import uuid
+        raw = os.urandom(16 * count)
+        return [
+            str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4))
+            for i in range(count)
+        ]
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """Get this instance's bounded executor, creating it lazily.
+
+        A dedicated pool (instead of the event loop's default) keeps
+        vector-DB work from starving, or being starved by, other
+        threadpool users, and bounds it at the core count since index
+        traversal is CPU-bound.
+        """
+        pool = getattr(self, "_async_pool", None)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="vectordb"
+            )
+            self._async_pool = pool
+        return pool
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a sync method on the instance executor without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), partial(func, *args, **kwargs))
+
+    async def asearch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Async variant of `search`."""
+        return await self._run(self.search, collection_name, query_vectors, top_k, filter_dict)
+
+    async def aadd_vectors(
+        self,
+        collection_name: str,
+        vectors: Union[List[List[float]], np.ndarray],
+        texts: List[str],
+        metadata: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """Async variant of `add_vectors`."""
+        return await self._run(self.add_vectors, collection_name, vectors, texts, metadata, ids)
+
+    async def alist_collections(self) -> List[Dict[str, Any]]:
+        """Async variant of `list_collections`."""
+        return await self._run(self.list_collections)
+
+    async def adelete_collection(self, collection_name: str) -> bool:
+        """Async variant of `delete_collection`."""
+        return await self._run(self.delete_collection, collection_name)
+
+    async def aget_collection_info(self, collection_name: str) -> Dict[str, Any]:
+        """Async variant of `get_collection_info`."""
+        return await self._run(self.get_collection_info, collection_name)
@@ -2,22 +2,45 @@
 ChromaDB implementation of the vector database.
 """
 import os
-import uuid
+import threading
+import time
 from typing import List, Dict, Any, Optional, Tuple, Union
+
+import numpy as np
 from loguru import logger
 
 from .base import BaseVectorDB
+from .mmap_store import MmapVectorStore
+from .quantization import quantize_int8, dequantize_int8
 from ..core.errors import VectorDBError
 
 
 class ChromaVectorDB(BaseVectorDB):
     """ChromaDB implementation of the vector database."""
 
-    def __init__(self, persist_directory: str = "./vector_db_data", **kwargs):
+    def __init__(
+        self,
+        persist_directory: str = "./vector_db_data",
+        cache_threshold: float = 0.95,
+        cache_size: int = 1024,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        storage_backend: str = "memory",
+        **kwargs
+    ):
         """Initialize the ChromaDB database.
 
         Args:
             persist_directory: Directory to persist the database
+            cache_threshold: Cosine similarity above which a query reuses a
+                cached result (0 disables the semantic cache)
+            cache_size: Max cached queries per collection
+            batch_size: Buffered writes are flushed to Chroma once a
+                collection accumulates this many rows (1 disables buffering)
+            flush_interval: Seconds before a partial write buffer is flushed
+            storage_backend: Where the hot-read vector copies live:
+                "memory" (int8 heap buffers) or "mmap" (page-cache-backed
+                memmap files, bounding RSS for corpora larger than RAM)
             **kwargs: Additional database parameters
         """
         try:
@@ -31,12 +54,289 @@ class ChromaVectorDB(BaseVectorDB):
             # Initialize client
             logger.info(f"Initializing ChromaDB with persist directory: {persist_directory}")
             self.client = chromadb.PersistentClient(path=persist_directory)
+
+            # Whether this Chroma version can return embeddings in query
+            # results. Determined once on the first search (there is nothing
+            # to probe against before a collection exists) and reused for
+            # the life of the process.
+            self._supports_embeddings: Optional[bool] = None
+
+            # Cached collection handles and name set: Chroma round-trips on
+            # every get_collection/list_collections, so hot-path methods hit
+            # these instead. Invalidated on create/delete.
+            self._cache_lock = threading.RLock()
+            self._collection_cache: Dict[str, Any] = {}
+            self._existence_cache: Optional[set] = None
+
+            # Semantic query cache: RAG traffic repeats near-identical
+            # queries, so results for vectors within cache_threshold cosine
+            # similarity of a previous query are served from memory instead
+            # of an HNSW traversal. Per collection, invalidated on writes.
+            self._sem_cache_threshold = cache_threshold
+            self._sem_cache_size = cache_size
+            self._sem_cache: Dict[str, Dict[str, Any]] = {}
+
+            # In-process copy of stored vectors, held as int8 codes with
+            # per-row float32 scales (4x smaller than float32, ~30x smaller
+            # than Python lists) in contiguous matrices with geometric
+            # growth, plus id -> row maps. Rows are dequantized on demand
+            # for reranking and cache math.
+            self._vector_codes: Dict[str, np.ndarray] = {}
+            self._vector_scales: Dict[str, np.ndarray] = {}
+            self._vectors_count: Dict[str, int] = {}
+            self._vector_rows: Dict[str, Dict[str, int]] = {}
+
+            # Optional mmap sidecar replacing the heap buffers: vector
+            # pages then live in the OS page cache, so process RSS stays
+            # bounded no matter how large the collections grow.
+            self._mmap_store = (
+                MmapVectorStore(persist_directory) if storage_backend == "mmap" else None
+            )
+
+            # Write buffer: small add_vectors calls accumulate here and are
+            # flushed as one Chroma transaction per batch_size rows (or on
+            # the flush timer / before any read), amortizing per-write
+            # transaction overhead for row-at-a-time ingestion.
+            self.batch_size = batch_size
+            self.flush_interval = flush_interval
+            self._write_lock = threading.Lock()
+            self._write_buffer: Dict[str, Dict[str, Any]] = {}
+            self._flush_timer: Optional[threading.Timer] = None
+
             logger.info("ChromaDB initialized successfully")
         except Exception as e:
             error_msg = f"Failed to initialize ChromaDB: {str(e)}"
             logger.error(error_msg)
             raise VectorDBError(message=error_msg)
 
+    def _refresh_cache(self):
+        """Reload the set of collection names from Chroma.
+
+        Also drops cached handles for collections that no longer exist.
+        """
+        with self._cache_lock:
+            self._existence_cache = {collection.name for collection in self.client.list_collections()}
+            self._collection_cache = {
+                name: handle for name, handle in self._collection_cache.items()
+                if name in self._existence_cache
+            }
+
+    def _get_collection(self, collection_name: str):
+        """Get a collection handle, cached after the first fetch.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            Chroma collection handle
+        """
+        with self._cache_lock:
+            handle = self._collection_cache.get(collection_name)
+            if handle is None:
+                handle = self.client.get_collection(name=collection_name)
+                self._collection_cache[collection_name] = handle
+            return handle
+
+    def _sem_cache_lookup(
+        self,
+        collection_name: str,
+        normalized_queries: np.ndarray,
+        top_k: int
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Look up each query in the semantic cache.
+
+        Args:
+            collection_name: Name of the collection
+            normalized_queries: L2-normalized query matrix (B, dim)
+            top_k: Requested result count (must match the cached entry)
+
+        Returns:
+            Per-query cached results, None where there is no hit
+        """
+        hits: List[Optional[List[Dict[str, Any]]]] = [None] * len(normalized_queries)
+
+        # search runs in to_thread workers, so lookups can interleave with
+        # stores; hold the cache lock so vecs and results stay aligned
+        with self._cache_lock:
+            cache = self._sem_cache.get(collection_name)
+            if not cache or not cache["results"]:
+                return hits
+
+            # One matmul scores every query against every cached vector
+            sims = normalized_queries @ cache["vecs"].T
+            best = sims.argmax(axis=1)
+            for i, j in enumerate(best):
+                if sims[i, j] >= self._sem_cache_threshold and cache["top_k"][j] == top_k:
+                    # Copy the result dicts: callers (e.g. reranking) mutate them
+                    hits[i] = [dict(item) for item in cache["results"][j]]
+                    cache["last_used"][j] = time.monotonic()
+        return hits
+
+    def _sem_cache_store(
+        self,
+        collection_name: str,
+        normalized_query: np.ndarray,
+        top_k: int,
+        results: List[Dict[str, Any]]
+    ):
+        """Insert a query and its results, evicting the least recently used.
+
+        Args:
+            collection_name: Name of the collection
+            normalized_query: L2-normalized query vector (dim,)
+            top_k: Result count the entry answers
+            results: Search results to cache
+        """
+        snapshot = [dict(item) for item in results]
+
+        # Same lock as lookups: an unsynchronized vstack rebind could be
+        # observed with one more vector row than result entries, and two
+        # interleaved stores would misalign rows and results for good
+        with self._cache_lock:
+            cache = self._sem_cache.setdefault(collection_name, {
+                "vecs": np.empty((0, len(normalized_query)), dtype=np.float32),
+                "results": [],
+                "top_k": [],
+                "last_used": []
+            })
+
+            if len(cache["results"]) >= self._sem_cache_size:
+                slot = int(np.argmin(cache["last_used"]))
+                cache["vecs"][slot] = normalized_query
+                cache["results"][slot] = snapshot
+                cache["top_k"][slot] = top_k
+                cache["last_used"][slot] = time.monotonic()
+            else:
+                cache["vecs"] = np.vstack([cache["vecs"], normalized_query])
+                cache["results"].append(snapshot)
+                cache["top_k"].append(top_k)
+                cache["last_used"].append(time.monotonic())
+
+    def _buffer_vectors(self, collection_name: str, vectors: np.ndarray, ids: List[str]):
+        """Append vectors to the collection's in-process float32 buffer.
+
+        The buffer grows geometrically so appends are amortized O(1) and
+        rows stay contiguous for BLAS.
+
+        Args:
+            collection_name: Name of the collection
+            vectors: Float32 matrix of new rows (n, dim)
+            ids: Ids for the new rows
+        """
+        if self._mmap_store is not None:
+            self._mmap_store.add(collection_name, vectors, ids)
+            return
+
+        n, dim = vectors.shape
+        codes_buffer = self._vector_codes.get(collection_name)
+        scales_buffer = self._vector_scales.get(collection_name)
+        count = self._vectors_count.get(collection_name, 0)
+
+        if codes_buffer is None:
+            capacity = max(1024, n)
+            codes_buffer = np.empty((capacity, dim), dtype=np.int8)
+            scales_buffer = np.empty((capacity,), dtype=np.float32)
+        elif count + n > len(codes_buffer):
+            capacity = max(len(codes_buffer) * 2, count + n)
+            grown_codes = np.empty((capacity, dim), dtype=np.int8)
+            grown_scales = np.empty((capacity,), dtype=np.float32)
+            grown_codes[:count] = codes_buffer[:count]
+            grown_scales[:count] = scales_buffer[:count]
+            codes_buffer, scales_buffer = grown_codes, grown_scales
+
+        codes, scales = quantize_int8(vectors)
+        codes_buffer[count:count + n] = codes
+        scales_buffer[count:count + n] = scales
+        self._vector_codes[collection_name] = codes_buffer
+        self._vector_scales[collection_name] = scales_buffer
+        self._vectors_count[collection_name] = count + n
+
+        rows = self._vector_rows.setdefault(collection_name, {})
+        for offset, id_ in enumerate(ids):
+            rows[id_] = count + offset
+
+    def _buffered_embeddings(self, collection_name: str, ids: List[str]) -> Optional[np.ndarray]:
+        """Fetch buffered rows for the given ids, if all are present.
+
+        Args:
+            collection_name: Name of the collection
+            ids: Ids to look up
+
+        Returns:
+            Float32 matrix (len(ids), dim), or None if any id is unbuffered
+            (e.g. rows ingested by a previous process)
+        """
+        if self._mmap_store is not None:
+            return self._mmap_store.get(collection_name, ids)
+
+        rows = self._vector_rows.get(collection_name)
+        if not rows:
+            return None
+        try:
+            indices = [rows[id_] for id_ in ids]
+        except KeyError:
+            return None
+        return dequantize_int8(
+            self._vector_codes[collection_name][indices],
+            self._vector_scales[collection_name][indices]
+        )
+
+    def _apply_mmr(
+        self,
+        collection_name: str,
+        query_vec: np.ndarray,
+        results: List[Dict[str, Any]],
+        mmr_lambda: float,
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Rerank candidates with maximal marginal relevance, vectorized.
+
+        All query and pairwise candidate similarities are precomputed with
+        two matmuls; each selection step is then a masked argmax instead of
+        a Python-level O(k * dim) loop.
+
+        Args:
+            collection_name: Name of the collection
+            query_vec: L2-normalized query vector (dim,)
+            results: Candidate results, best-first
+            mmr_lambda: Relevance/diversity trade-off in [0, 1]
+            top_k: Number of results to keep
+
+        Returns:
+            Reranked results (falls back to a plain top_k cut when candidate
+            embeddings are unavailable)
+        """
+        if len(results) <= top_k:
+            return results
+
+        if all("embedding" in item for item in results):
+            candidates = np.asarray([item["embedding"] for item in results], dtype=np.float32)
+        else:
+            candidates = self._buffered_embeddings(collection_name, [item["id"] for item in results])
+        if candidates is None:
+            logger.debug("MMR skipped: candidate embeddings unavailable")
+            return results[:top_k]
+
+        norms = np.sqrt(np.einsum('ij,ij->i', candidates, candidates))[:, np.newaxis]
+        np.maximum(norms, 1e-12, out=norms)
+        candidates = candidates / norms
+
+        q_sim = candidates @ query_vec
+        c_sim = candidates @ candidates.T
+
+        selected = [int(np.argmax(q_sim))]
+        remaining_mask = np.ones(len(candidates), dtype=bool)
+        remaining_mask[selected[0]] = False
+
+        while len(selected) < top_k:
+            penalty = c_sim[:, selected].max(axis=1)
+            mmr = np.where(remaining_mask, mmr_lambda * q_sim - (1.0 - mmr_lambda) * penalty, -np.inf)
+            pick = int(np.argmax(mmr))
+            selected.append(pick)
+            remaining_mask[pick] = False
+
+        return [results[i] for i in selected]
+
     def create_collection(self, collection_name: str, dimension: int) -> bool:
         """Create a new collection.
 
@@ -50,30 +350,22 @@ class ChromaVectorDB(BaseVectorDB):
         try:
             # Check if collection already exists
             if self.collection_exists(collection_name):
-                logger.info(f"Collection '{collection_name}' already exists")
+                logger.debug("Collection '{}' already exists", collection_name)
                 return True
 
-            # Create collection
-            # For ChromaDB 1.0.x, we need to use a different approach for setting distance function
+            # Create collection with inner-product distance. All vectors are
+            # L2-normalized before insert and query, so inner product equals
+            # cosine similarity while skipping the per-comparison norm math
+            # inside the index.
             collection = self.client.create_collection(
                 name=collection_name,
-                metadata={"dimension": dimension}
+                metadata={"dimension": dimension, "hnsw:space": "ip"}
             )
 
-            # Try to set the distance function if possible
-            try:
-                # For ChromaDB 1.0.x, we can try to access the underlying collection settings
-                if hasattr(collection, '_embedding_function') and hasattr(collection, '_distance_function'):
-                    # Some versions allow setting these attributes directly
-                    collection._distance_function = "cosine"
-                    logger.info(f"Set distance function to 'cosine' for collection '{collection_name}'")
-                elif hasattr(collection, 'set_distance_function'):
-                    # Some versions have a setter method
-                    collection.set_distance_function("cosine")
-                    logger.info(f"Set distance function to 'cosine' for collection '{collection_name}'")
-            except Exception as e:
-                # If we can't set the distance function, just log it and continue
-                logger.warning(f"Could not set distance function for collection '{collection_name}': {str(e)}")
+            with self._cache_lock:
+                self._collection_cache[collection_name] = collection
+                if self._existence_cache is not None:
+                    self._existence_cache.add(collection_name)
 
             logger.info(f"Created collection '{collection_name}' with dimension {dimension}")
             return True
@@ -92,6 +384,10 @@ class ChromaVectorDB(BaseVectorDB):
             True if successful, False otherwise
         """
         try:
+            # Pending writes for a collection being deleted are just dropped
+            with self._write_lock:
+                self._write_buffer.pop(collection_name, None)
+
             # Check if collection exists
             if not self.collection_exists(collection_name):
                 logger.warning(f"Collection '{collection_name}' does not exist")
@@ -99,6 +395,17 @@ class ChromaVectorDB(BaseVectorDB):
 
             # Delete collection
             self.client.delete_collection(name=collection_name)
+            with self._cache_lock:
+                self._collection_cache.pop(collection_name, None)
+                if self._existence_cache is not None:
+                    self._existence_cache.discard(collection_name)
+                self._sem_cache.pop(collection_name, None)
+            self._vector_codes.pop(collection_name, None)
+            self._vector_scales.pop(collection_name, None)
+            self._vectors_count.pop(collection_name, None)
+            self._vector_rows.pop(collection_name, None)
+            if self._mmap_store is not None:
+                self._mmap_store.drop(collection_name)
             logger.info(f"Deleted collection '{collection_name}'")
             return True
         except Exception as e:
@@ -113,14 +420,15 @@ class ChromaVectorDB(BaseVectorDB):
             List of collection information
         """
         try:
-            collections = self.client.list_collections()
-            result = []
-
-            for collection in collections:
-                collection_info = self.get_collection_info(collection.name)
-                result.append(collection_info)
-
-            return result
+            self.flush()
+            self._refresh_cache()
+            names = sorted(self._existence_cache)
+
+            # The per-collection count() round-trips are independent, so fan
+            # them out across the instance pool instead of serializing them
+            if len(names) <= 1:
+                return [self.get_collection_info(name) for name in names]
+            return list(self._executor().map(self.get_collection_info, names))
         except Exception as e:
             error_msg = f"Failed to list collections: {str(e)}"
             logger.error(error_msg)
@@ -129,7 +437,7 @@ class ChromaVectorDB(BaseVectorDB):
     def add_vectors(
         self,
         collection_name: str,
-        vectors: List[List[float]],
+        vectors: Union[List[List[float]], np.ndarray],
         texts: List[str],
         metadata: Optional[List[Dict[str, Any]]] = None,
         ids: Optional[List[str]] = None
@@ -138,7 +446,7 @@ class ChromaVectorDB(BaseVectorDB):
 
         Args:
             collection_name: Name of the collection
-            vectors: List of vectors to add
+            vectors: Vectors to add (nested lists or a 2D array)
             texts: Original texts for the vectors
             metadata: Optional metadata for each vector
             ids: Optional IDs for the vectors
@@ -147,39 +455,173 @@ class ChromaVectorDB(BaseVectorDB):
             List of IDs for the added vectors
         """
         try:
-            # Check if collection exists
-            if not self.collection_exists(collection_name):
-                dimension = len(vectors[0]) if vectors else 0
-                self.create_collection(collection_name, dimension)
-
-            # Get collection
-            collection = self.client.get_collection(name=collection_name)
+            # One contiguous float32 copy serves the in-process buffer and
+            # any vector math; inputs may arrive as nested lists or fp16
+            vector_array = np.asarray(vectors, dtype=np.float32)
 
             # Generate IDs if not provided
             if ids is None:
-                ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+                ids = self._generate_ids(len(vector_array))
+            if not len(vector_array):
+                return ids
+
+            # Already-batched calls go straight through (flushing any
+            # pending rows first to preserve write order); small calls
+            # accumulate in the write buffer
+            if self.batch_size <= 1 or len(vector_array) >= self.batch_size:
+                self.flush(collection_name)
+                self._write_batch(collection_name, vector_array, list(texts), metadata, list(ids))
+            else:
+                self._buffer_write(collection_name, vector_array, list(texts), metadata, list(ids))
+
+            return ids
+        except VectorDBError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to add vectors to collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
 
-            # Add vectors
-            collection.add(
-                embeddings=vectors,
+    def _write_batch(
+        self,
+        collection_name: str,
+        vector_array: np.ndarray,
+        texts: List[str],
+        metadata: Optional[List[Dict[str, Any]]],
+        ids: List[str]
+    ):
+        """Write one batch of rows to Chroma immediately.
+
+        Args:
+            collection_name: Name of the collection
+            vector_array: Float32 matrix of vectors (n, dim)
+            texts: Original texts for the vectors
+            metadata: Optional metadata for each vector
+            ids: Ids for the vectors
+        """
+        try:
+            # One get_or_create round-trip replaces the old exists/create/get
+            # triple; the handle cache keeps repeat calls local
+            with self._cache_lock:
+                collection = self._collection_cache.get(collection_name)
+            if collection is None:
+                collection = self.client.get_or_create_collection(
+                    name=collection_name,
+                    metadata={"dimension": vector_array.shape[1], "hnsw:space": "ip"}
+                )
+                with self._cache_lock:
+                    self._collection_cache[collection_name] = collection
+                    if self._existence_cache is not None:
+                        self._existence_cache.add(collection_name)
+
+            # Upsert so re-ingesting content-addressed ids replaces existing
+            # rows instead of erroring or duplicating
+            collection.upsert(
+                embeddings=vector_array,
                 documents=texts,
                 metadatas=metadata,
                 ids=ids
             )
 
-            logger.info(f"Added {len(vectors)} vectors to collection '{collection_name}'")
-            return ids
+            # Cached search results are stale once the collection changes
+            with self._cache_lock:
+                self._sem_cache.pop(collection_name, None)
+
+            self._buffer_vectors(collection_name, vector_array, ids)
+
+            # Hot path: deferred formatting at DEBUG so the message is only
+            # built when a sink actually wants it
+            logger.debug("Added {} vectors to collection '{}'", len(vector_array), collection_name)
         except Exception as e:
             error_msg = f"Failed to add vectors to collection '{collection_name}': {str(e)}"
             logger.error(error_msg)
             raise VectorDBError(message=error_msg)
 
+    def _buffer_write(
+        self,
+        collection_name: str,
+        vector_array: np.ndarray,
+        texts: List[str],
+        metadata: Optional[List[Dict[str, Any]]],
+        ids: List[str]
+    ):
+        """Queue rows in the write buffer, flushing when it fills.
+
+        Args:
+            collection_name: Name of the collection
+            vector_array: Float32 matrix of vectors (n, dim)
+            texts: Original texts for the vectors
+            metadata: Optional metadata for each vector
+            ids: Ids for the vectors
+        """
+        has_metadata = metadata is not None
+
+        # Don't mix rows with and without metadata in one Chroma call
+        with self._write_lock:
+            buffer = self._write_buffer.get(collection_name)
+        if buffer is not None and buffer["has_metadata"] != has_metadata:
+            self.flush(collection_name)
+
+        with self._write_lock:
+            buffer = self._write_buffer.setdefault(collection_name, {
+                "vectors": [], "texts": [], "metadata": [], "ids": [],
+                "has_metadata": has_metadata
+            })
+            buffer["vectors"].append(vector_array)
+            buffer["texts"].extend(texts)
+            if has_metadata:
+                buffer["metadata"].extend(metadata)
+            buffer["ids"].extend(ids)
+            buffered = len(buffer["ids"])
+
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timer_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if buffered >= self.batch_size:
+            self.flush(collection_name)
+
+    def flush(self, collection_name: Optional[str] = None):
+        """Flush buffered writes to Chroma.
+
+        Args:
+            collection_name: Collection to flush, or None for all
+        """
+        with self._write_lock:
+            if collection_name is None:
+                pending = self._write_buffer
+                self._write_buffer = {}
+            else:
+                entry = self._write_buffer.pop(collection_name, None)
+                pending = {collection_name: entry} if entry else {}
+
+        for name, entry in pending.items():
+            self._write_batch(
+                name,
+                np.vstack(entry["vectors"]),
+                entry["texts"],
+                entry["metadata"] if entry["has_metadata"] else None,
+                entry["ids"]
+            )
+
+    def _timer_flush(self):
+        """Timer callback: flush everything pending in the background."""
+        with self._write_lock:
+            self._flush_timer = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Background write flush failed: {str(e)}")
+
     def search(
         self,
         collection_name: str,
         query_vectors: List[List[float]],
         top_k: int = 5,
-        filter_dict: Optional[Dict[str, Any]] = None
+        filter_dict: Optional[Dict[str, Any]] = None,
+        mmr_lambda: Optional[float] = None,
+        fetch_k: Optional[int] = None
     ) -> List[List[Dict[str, Any]]]:
         """Search for similar vectors with improved formatting and filtering.
 
@@ -188,6 +630,9 @@ class ChromaVectorDB(BaseVectorDB):
             query_vectors: List of query vectors
             top_k: Number of results to return
             filter_dict: Optional metadata filter dictionary
+            mmr_lambda: Enable MMR diversity reranking with this
+                relevance/diversity trade-off (None disables)
+            fetch_k: Candidate pool size for MMR (default 4 * top_k)
 
         Returns:
             List of lists of results (for each query vector)
@@ -199,82 +644,130 @@ class ChromaVectorDB(BaseVectorDB):
                 logger.error(error_msg)
                 raise VectorDBError(message=error_msg)
 
+            # Make any buffered writes visible before searching
+            self.flush(collection_name)
+
             # Get collection
-            collection = self.client.get_collection(name=collection_name)
+            collection = self._get_collection(collection_name)
+
+            queries = np.ascontiguousarray(np.asarray(query_vectors, dtype=np.float32))
+            norms = np.sqrt(np.einsum('ij,ij->i', queries, queries))[:, np.newaxis]
+            np.maximum(norms, 1e-12, out=norms)
+            normalized = queries / norms
+
+            # Serve near-duplicate queries from the semantic cache; only
+            # misses go to Chroma. Filtered queries bypass the cache since
+            # entries don't record the filter.
+            results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+            use_cache = (
+                filter_dict is None
+                and mmr_lambda is None
+                and self._sem_cache_size > 0
+                and self._sem_cache_threshold > 0
+            )
+            if use_cache:
+                results = self._sem_cache_lookup(collection_name, normalized, top_k)
+
+            pending = [i for i, cached in enumerate(results) if cached is None]
+            if not pending:
+                return results
 
-            # Search for each query vector
-            results = []
-            for query_vector in query_vectors:
-                # Prepare query parameters for ChromaDB 1.0.x
-                # In 1.0.x, the API changed significantly
-                include_fields = ["documents", "metadatas", "distances"]
+            include_fields = ["documents", "metadatas", "distances"]
 
-                # Try to include embeddings if supported
+            # Probe embeddings support once per process, not per search call
+            if self._supports_embeddings is None:
                 try:
-                    # Test if embeddings are supported
-                    test_query = collection.query(
-                        query_embeddings=[query_vector[:5]],  # Just use first few dimensions for test
+                    collection.query(
+                        query_embeddings=queries[:1],
                         n_results=1,
                         include=["embeddings"]
                     )
-                    # If we get here, embeddings are supported
-                    include_fields.append("embeddings")
-                    logger.debug("Including embeddings in query results")
+                    self._supports_embeddings = True
+                    logger.debug("Chroma returns embeddings in query results")
                 except Exception:
-                    # Embeddings not supported, continue without them
-                    logger.debug("Embeddings not included in query results (not supported)")
-
-                query_params = {
-                    "query_embeddings": [query_vector],
-                    "n_results": top_k,
-                    "include": include_fields
-                }
-
-                # Add filter if provided
-                if filter_dict:
-                    query_params["where"] = filter_dict
-
-                # Execute query
-                query_result = collection.query(**query_params)
-
-                # Format results with improved scoring
-                formatted_results = []
-
-                # Check if we have any results
-                if query_result["ids"] and len(query_result["ids"]) > 0 and len(query_result["ids"][0]) > 0:
-                    for i in range(len(query_result["ids"][0])):
-                        # Get the raw distance
-                        distance = query_result["distances"][0][i] if "distances" in query_result and query_result["distances"] else 0.0
-
-                        # Convert distance to similarity score (cosine distance to similarity)
-                        # For cosine distance: similarity = 1 - distance
-                        similarity_score = 1.0 - distance
-
-                        # Get metadata safely
-                        metadata = {}
-                        if "metadatas" in query_result and query_result["metadatas"] and len(query_result["metadatas"]) > 0:
-                            metadata = query_result["metadatas"][0][i] or {}
-
-                        # Create result entry with more information
-                        result_entry = {
-                            "id": query_result["ids"][0][i],
-                            "text": query_result["documents"][0][i] if "documents" in query_result and query_result["documents"] else "",
-                            "score": similarity_score,
-                            "raw_distance": distance,
-                            "metadata": metadata
-                        }
-
-                        # Add embeddings if available
-                        if "embeddings" in query_result and query_result["embeddings"] and len(query_result["embeddings"]) > 0:
-                            result_entry["embedding"] = query_result["embeddings"][0][i]
-
-                        formatted_results.append(result_entry)
-
-                # Sort by score in descending order
-                formatted_results = sorted(formatted_results, key=lambda x: x["score"], reverse=True)
-                results.append(formatted_results)
+                    self._supports_embeddings = False
+                    logger.debug("Chroma does not return embeddings in query results")
+
+            if self._supports_embeddings:
+                include_fields.append("embeddings")
+
+            # One batched query for all cache-missing vectors: Chroma accepts
+            # the whole list and returns parallel result arrays, so B queries
+            # cost one round-trip instead of B
+            # MMR reranks a wider candidate pool down to top_k
+            fetch_count = top_k
+            if mmr_lambda is not None:
+                fetch_count = max(top_k, fetch_k or 4 * top_k)
+
+            # Hand Chroma the contiguous float32 rows directly; a list of
+            # Python lists would be re-cast element by element inside the
+            # client
+            query_params = {
+                "query_embeddings": queries[pending],
+                "n_results": fetch_count,
+                "include": include_fields
+            }
+            if filter_dict:
+                query_params["where"] = filter_dict
+
+            query_result = collection.query(**query_params)
+
+            # Format per-query results from the parallel arrays
+            all_ids = query_result.get("ids") or []
+            all_documents = query_result.get("documents") or []
+            all_distances = query_result.get("distances") or []
+            all_metadatas = query_result.get("metadatas") or []
+            # Embeddings may come back as numpy arrays, which don't support
+            # truthiness; check for None/empty explicitly
+            all_embeddings = query_result.get("embeddings")
+            if all_embeddings is None:
+                all_embeddings = []
+
+            for q in range(len(all_ids)):
+                ids_q = all_ids[q]
+                docs_q = all_documents[q] if all_documents else None
+                metas_q = all_metadatas[q] if all_metadatas else None
+                embs_q = all_embeddings[q] if len(all_embeddings) else None
+
+                # One vectorized pass converts distances to similarity
+                # scores (cosine/ip distance: similarity = 1 - distance)
+                if all_distances:
+                    distances_q = np.asarray(all_distances[q], dtype=np.float32)
+                else:
+                    distances_q = np.zeros(len(ids_q), dtype=np.float32)
+                scores_q = 1.0 - distances_q
+
+                # Chroma already returns rows in ascending-distance order,
+                # which is descending-score order, so no re-sort is needed
+                formatted_results = [
+                    {
+                        "id": ids_q[i],
+                        "text": docs_q[i] if docs_q else "",
+                        "score": float(scores_q[i]),
+                        "raw_distance": float(distances_q[i]),
+                        "metadata": (metas_q[i] or {}) if metas_q else {}
+                    }
+                    for i in range(len(ids_q))
+                ]
+                if embs_q is not None:
+                    for i, result_entry in enumerate(formatted_results):
+                        result_entry["embedding"] = embs_q[i]
+
+                original_index = pending[q]
+                if mmr_lambda is not None:
+                    formatted_results = self._apply_mmr(
+                        collection_name, normalized[original_index],
+                        formatted_results, mmr_lambda, top_k
+                    )
+                results[original_index] = formatted_results
+                if use_cache:
+                    self._sem_cache_store(
+                        collection_name, normalized[original_index], top_k, formatted_results
+                    )
 
-            return results
+            # Queries Chroma returned nothing for (shouldn't happen, but keep
+            # the contract of one list per query)
+            return [result if result is not None else [] for result in results]
         except Exception as e:
             error_msg = f"Failed to search in collection '{collection_name}': {str(e)}"
             logger.error(error_msg)
@@ -290,6 +783,9 @@ class ChromaVectorDB(BaseVectorDB):
             Collection information
         """
         try:
+            # Count buffered rows too
+            self.flush(collection_name)
+
             # Check if collection exists
             if not self.collection_exists(collection_name):
                 error_msg = f"Collection '{collection_name}' does not exist"
@@ -297,7 +793,7 @@ class ChromaVectorDB(BaseVectorDB):
                 raise VectorDBError(message=error_msg)
 
             # Get collection
-            collection = self.client.get_collection(name=collection_name)
+            collection = self._get_collection(collection_name)
 
             # Get collection info
             count = collection.count()
@@ -324,8 +820,22 @@ class ChromaVectorDB(BaseVectorDB):
             True if the collection exists, False otherwise
         """
         try:
-            collections = self.client.list_collections()
-            return any(collection.name == collection_name for collection in collections)
+            with self._cache_lock:
+                if self._existence_cache is not None and collection_name in self._existence_cache:
+                    return True
+
+            # Miss: one direct O(1) lookup instead of listing and scanning
+            # every collection. A hit warms both caches for later calls.
+            try:
+                handle = self.client.get_collection(name=collection_name)
+            except Exception:
+                return False
+
+            with self._cache_lock:
+                self._collection_cache[collection_name] = handle
+                if self._existence_cache is not None:
+                    self._existence_cache.add(collection_name)
+            return True
         except Exception as e:
             error_msg = f"Failed to check if collection '{collection_name}' exists: {str(e)}"
             logger.error(error_msg)
@@ -0,0 +1,404 @@
+"""
+HNSW (hnswlib) implementation of the vector database.
+"""
+import os
+import pickle
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from .base import BaseVectorDB
+from .quantization import quantize_int8, dequantize_int8
+from ..core.errors import VectorDBError
+from ..core.config import settings
+
+
+class HnswVectorDB(BaseVectorDB):
+    """HNSW-backed approximate nearest neighbour vector database.
+
+    Uses an hnswlib cosine index per collection, so top-k lookup is a
+    logarithmic graph traversal instead of Chroma's linear scan. Texts and
+    metadata live in a pickled sidecar next to each index file.
+    """
+
+    def __init__(self, persist_directory: str = "./vector_db_data", **kwargs):
+        """Initialize the HNSW database.
+
+        Args:
+            persist_directory: Directory to persist indexes and payloads
+            **kwargs: Additional database parameters
+        """
+        try:
+            import hnswlib
+
+            self._hnswlib = hnswlib
+            self.persist_directory = persist_directory
+            os.makedirs(persist_directory, exist_ok=True)
+
+            # name -> {"index", "dimension", "ids", "texts", "metadata"}
+            self._collections: Dict[str, Dict[str, Any]] = {}
+
+            logger.info(f"Initializing HNSW store with persist directory: {persist_directory}")
+            self._load_existing_collections()
+            logger.info(f"HNSW store initialized with {len(self._collections)} collections")
+        except Exception as e:
+            error_msg = f"Failed to initialize HNSW store: {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def create_collection(self, collection_name: str, dimension: int) -> bool:
+        """Create a new collection.
+
+        Args:
+            collection_name: Name of the collection
+            dimension: Dimension of the vectors
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if self.collection_exists(collection_name):
+                logger.info(f"Collection '{collection_name}' already exists")
+                return True
+
+            index = self._hnswlib.Index(space="cosine", dim=dimension)
+            index.init_index(
+                max_elements=1024,
+                M=settings.HNSW_M,
+                ef_construction=settings.HNSW_EF_CONSTRUCTION
+            )
+            index.set_ef(settings.HNSW_EF_SEARCH)
+
+            self._collections[collection_name] = {
+                "index": index,
+                "dimension": dimension,
+                "ids": [],
+                "texts": [],
+                "metadata": [],
+                "codes": np.empty((0, dimension), dtype=np.int8),
+                "scales": np.empty((0,), dtype=np.float32)
+            }
+            self._persist_collection(collection_name)
+
+            logger.info(f"Created HNSW collection '{collection_name}' with dimension {dimension}")
+            return True
+        except Exception as e:
+            error_msg = f"Failed to create collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def delete_collection(self, collection_name: str) -> bool:
+        """Delete a collection.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not self.collection_exists(collection_name):
+                logger.warning(f"Collection '{collection_name}' does not exist")
+                return False
+
+            self._collections.pop(collection_name, None)
+            for path in (self._index_path(collection_name), self._payload_path(collection_name)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+            logger.info(f"Deleted collection '{collection_name}'")
+            return True
+        except Exception as e:
+            error_msg = f"Failed to delete collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def list_collections(self) -> List[Dict[str, Any]]:
+        """List all collections.
+
+        Returns:
+            List of collection information
+        """
+        try:
+            return [self.get_collection_info(name) for name in self._collections]
+        except Exception as e:
+            error_msg = f"Failed to list collections: {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def add_vectors(
+        self,
+        collection_name: str,
+        vectors: Union[List[List[float]], np.ndarray],
+        texts: List[str],
+        metadata: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """Add vectors to a collection.
+
+        Args:
+            collection_name: Name of the collection
+            vectors: Vectors to add (nested lists or a 2D array)
+            texts: Original texts for the vectors
+            metadata: Optional metadata for each vector
+            ids: Optional IDs for the vectors
+
+        Returns:
+            List of IDs for the added vectors
+        """
+        try:
+            vectors = np.asarray(vectors, dtype=np.float32)
+
+            if not self.collection_exists(collection_name):
+                dimension = vectors.shape[1] if len(vectors) else 0
+                self.create_collection(collection_name, dimension)
+
+            collection = self._collections[collection_name]
+            index = collection["index"]
+
+            if ids is None:
+                ids = self._generate_ids(len(vectors))
+            if metadata is None:
+                metadata = [None] * len(vectors)
+
+            # int8 copy of the vectors (4x smaller than fp32) for exact
+            # rescoring of ANN candidates at query time
+            codes, scales = quantize_int8(vectors)
+
+            # Ids are content-derived upstream, so re-storing a document
+            # must update its existing row rather than append a
+            # duplicate (the Chroma path upserts). Split the batch into
+            # inserts and updates; an in-batch duplicate of a fresh id
+            # lands as an update of the row its first occurrence inserts
+            id_to_row = {doc_id: row for row, doc_id in enumerate(collection["ids"])}
+            inserts: List[int] = []
+            updates: List[Tuple[int, int]] = []
+            for i, doc_id in enumerate(ids):
+                row = id_to_row.get(doc_id)
+                if row is None:
+                    id_to_row[doc_id] = len(collection["ids"]) + len(inserts)
+                    inserts.append(i)
+                else:
+                    updates.append((i, row))
+
+            if inserts:
+                # Grow the index if needed, then add with sequential labels
+                start = len(collection["ids"])
+                needed = start + len(inserts)
+                if needed > index.get_max_elements():
+                    index.resize_index(max(needed, index.get_max_elements() * 2))
+
+                index.add_items(vectors[inserts], np.arange(start, needed))
+                collection["ids"].extend(ids[i] for i in inserts)
+                collection["texts"].extend(texts[i] for i in inserts)
+                collection["metadata"].extend(metadata[i] for i in inserts)
+                collection["codes"] = np.concatenate([collection["codes"], codes[inserts]])
+                collection["scales"] = np.concatenate([collection["scales"], scales[inserts]])
+
+            if updates:
+                # Re-adding an existing label updates the point in place
+                update_indices = [i for i, _ in updates]
+                rows = [row for _, row in updates]
+                index.add_items(vectors[update_indices], np.asarray(rows))
+                for i, row in updates:
+                    collection["texts"][row] = texts[i]
+                    collection["metadata"][row] = metadata[i]
+                collection["codes"][rows] = codes[update_indices]
+                collection["scales"][rows] = scales[update_indices]
+
+            self._persist_collection(collection_name)
+
+            logger.debug("Added {} vectors to collection '{}'", len(vectors), collection_name)
+            return ids
+        except Exception as e:
+            error_msg = f"Failed to add vectors to collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def search(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        top_k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar vectors.
+
+        Args:
+            collection_name: Name of the collection
+            query_vectors: List of query vectors
+            top_k: Number of results to return
+            filter_dict: Optional metadata filter dictionary
+
+        Returns:
+            List of lists of results (for each query vector)
+        """
+        try:
+            if not self.collection_exists(collection_name):
+                error_msg = f"Collection '{collection_name}' does not exist"
+                logger.error(error_msg)
+                raise VectorDBError(message=error_msg)
+
+            collection = self._collections[collection_name]
+            index = collection["index"]
+            count = len(collection["ids"])
+            if count == 0:
+                return [[] for _ in query_vectors]
+
+            queries = np.asarray(query_vectors, dtype=np.float32)
+
+            if filter_dict:
+                # Filter first, then take top-k over the surviving rows;
+                # filtering after selection could return fewer or zero
+                # results even when enough matching rows exist. The
+                # filtered subset is scored exactly by brute force, the
+                # same way small collections are below.
+                allowed = np.fromiter(
+                    (
+                        not any(
+                            (item_metadata or {}).get(key) != value
+                            for key, value in filter_dict.items()
+                        )
+                        for item_metadata in collection["metadata"]
+                    ),
+                    dtype=bool,
+                    count=count
+                )
+                allowed_rows = np.flatnonzero(allowed)
+                if allowed_rows.size == 0:
+                    return [[] for _ in query_vectors]
+
+                matrix = dequantize_int8(
+                    collection["codes"][allowed_rows], collection["scales"][allowed_rows]
+                )
+                scores = queries @ matrix.T
+                k = min(top_k, allowed_rows.size)
+                labels = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                rows = np.arange(len(queries))[:, np.newaxis]
+                order = np.argsort(-scores[rows, labels], axis=1)
+                labels = labels[rows, order]
+                distances = 1.0 - scores[rows, labels]
+                labels = allowed_rows[labels]
+            # Small collections: one BLAS matmul over the contiguous stored
+            # matrix beats the graph traversal and is exact. The dot products
+            # vectorize to SIMD FMA through BLAS.
+            elif count <= settings.BRUTE_FORCE_THRESHOLD:
+                matrix = dequantize_int8(collection["codes"], collection["scales"])
+                scores = queries @ matrix.T
+                k = min(top_k, count)
+                labels = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                rows = np.arange(len(queries))[:, np.newaxis]
+                order = np.argsort(-scores[rows, labels], axis=1)
+                labels = labels[rows, order]
+                distances = 1.0 - scores[rows, labels]
+            else:
+                labels, distances = index.knn_query(queries, k=min(top_k, count))
+
+            results = []
+            for query, row_labels, row_distances in zip(queries, labels, distances):
+                # Rescore candidates exactly against the dequantized stored
+                # vectors; the graph's approximate distances only pick them
+                rescored = dequantize_int8(
+                    collection["codes"][row_labels], collection["scales"][row_labels]
+                ) @ query
+                formatted_results = []
+                for label, score, distance in zip(row_labels, rescored, row_distances):
+                    formatted_results.append({
+                        "id": collection["ids"][label],
+                        "text": collection["texts"][label],
+                        "score": float(score),
+                        "raw_distance": float(distance),
+                        "metadata": collection["metadata"][label] or {}
+                    })
+                results.append(formatted_results)
+
+            return results
+        except VectorDBError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to search in collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
+        """Get information about a collection.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            Collection information
+        """
+        try:
+            if not self.collection_exists(collection_name):
+                error_msg = f"Collection '{collection_name}' does not exist"
+                logger.error(error_msg)
+                raise VectorDBError(message=error_msg)
+
+            collection = self._collections[collection_name]
+            return {
+                "name": collection_name,
+                "count": len(collection["ids"]),
+                "dimension": collection["dimension"]
+            }
+        except VectorDBError:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to get information for collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def collection_exists(self, collection_name: str) -> bool:
+        """Check if a collection exists.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            True if the collection exists, False otherwise
+        """
+        return collection_name in self._collections
+
+    def _index_path(self, collection_name: str) -> str:
+        """Path of the on-disk HNSW index for a collection."""
+        return os.path.join(self.persist_directory, f"{collection_name}.hnsw")
+
+    def _payload_path(self, collection_name: str) -> str:
+        """Path of the on-disk payload sidecar for a collection."""
+        return os.path.join(self.persist_directory, f"{collection_name}.payload")
+
+    def _persist_collection(self, collection_name: str):
+        """Write a collection's index and payloads to disk."""
+        collection = self._collections[collection_name]
+        collection["index"].save_index(self._index_path(collection_name))
+        with open(self._payload_path(collection_name), "wb") as f:
+            pickle.dump({
+                "dimension": collection["dimension"],
+                "ids": collection["ids"],
+                "texts": collection["texts"],
+                "metadata": collection["metadata"],
+                "codes": collection["codes"],
+                "scales": collection["scales"]
+            }, f)
+
+    def _load_existing_collections(self):
+        """Load previously persisted collections from disk."""
+        for filename in os.listdir(self.persist_directory):
+            if not filename.endswith(".payload"):
+                continue
+            name = filename[:-len(".payload")]
+            try:
+                with open(self._payload_path(name), "rb") as f:
+                    payload = pickle.load(f)
+
+                index = self._hnswlib.Index(space="cosine", dim=payload["dimension"])
+                index.load_index(self._index_path(name), max_elements=max(1024, len(payload["ids"])))
+                index.set_ef(settings.HNSW_EF_SEARCH)
+
+                payload.setdefault("codes", np.empty((0, payload["dimension"]), dtype=np.int8))
+                payload.setdefault("scales", np.empty((0,), dtype=np.float32))
+                self._collections[name] = {"index": index, **payload}
+                logger.info(f"Loaded HNSW collection '{name}' with {len(payload['ids'])} vectors")
+            except Exception as e:
+                logger.warning(f"Skipping unreadable HNSW collection '{name}': {str(e)}")
@@ -0,0 +1,239 @@
+"""
+Memory-mapped sidecar storage for hot-read vectors.
+"""
+import os
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..core.errors import VectorDBError
+
+
+class MmapVectorStore:
+    """Float32 vector sidecar backed by ``numpy.memmap`` files.
+
+    Keeps one append-only memmap file per collection plus a small in-heap
+    id -> row map. Vector data lives in the OS page cache instead of the
+    process heap, so RSS stays bounded regardless of collection size: warm
+    rows are served from cached pages at heap speed, cold rows cost one
+    page fault each.
+
+    The store is a read cache for the current process, not a source of
+    truth — the backing database still holds every vector. A stale file
+    left by a previous process is simply overwritten, and ``get`` returns
+    None for rows this process has not written.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    # Max append records coalesced into one background flush submission
+    FLUSH_BATCH = 64
+
+    def __init__(self, persist_directory: str, use_uring: bool = False):
+        """Initialize the store.
+
+        Args:
+            persist_directory: Directory to keep the per-collection files
+            use_uring: Flush appended pages to disk from a background
+                thread, batched through io_uring where the `liburing`
+                bindings are available (plain pwrite otherwise). Off by
+                default: the kernel's normal writeback already persists
+                the pages eventually, this just tightens the window
+        """
+        self.persist_directory = persist_directory
+        os.makedirs(persist_directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # name -> (memmap, row count, id -> row)
+        self._maps: Dict[str, np.memmap] = {}
+        self._counts: Dict[str, int] = {}
+        self._rows: Dict[str, Dict[str, int]] = {}
+
+        # Background flusher: append records queue up here and a daemon
+        # thread pushes the dirty ranges to disk off the insert path
+        self._flush_queue: Optional["queue.SimpleQueue[Tuple[str, int, int]]"] = None
+        self._uring = None
+        if use_uring:
+            self._uring = self._init_uring()
+            self._flush_queue = queue.SimpleQueue()
+            threading.Thread(
+                target=self._flush_worker, name="mmap-flush", daemon=True
+            ).start()
+
+    def add(self, collection_name: str, vectors: np.ndarray, ids: List[str]):
+        """Append vectors to a collection's memmap file.
+
+        Capacity grows geometrically by extending the file and re-mapping,
+        so appends stay amortized O(1).
+
+        Args:
+            collection_name: Name of the collection
+            vectors: Float32 matrix of new rows (n, dim)
+            ids: Ids for the new rows
+        """
+        try:
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            n, dim = vectors.shape
+
+            with self._lock:
+                mapped = self._maps.get(collection_name)
+                count = self._counts.get(collection_name, 0)
+
+                if mapped is None:
+                    mapped = self._remap(collection_name, dim, max(self.INITIAL_CAPACITY, n))
+                elif count + n > len(mapped):
+                    mapped = self._remap(collection_name, dim, max(len(mapped) * 2, count + n))
+
+                mapped[count:count + n] = vectors
+                self._counts[collection_name] = count + n
+
+                rows = self._rows.setdefault(collection_name, {})
+                for offset, id_ in enumerate(ids):
+                    rows[id_] = count + offset
+
+            if self._flush_queue is not None:
+                self._flush_queue.put((collection_name, count, count + n))
+        except Exception as e:
+            error_msg = f"Failed to write mmap vectors for collection '{collection_name}': {str(e)}"
+            logger.error(error_msg)
+            raise VectorDBError(message=error_msg)
+
+    def get(self, collection_name: str, ids: List[str]) -> Optional[np.ndarray]:
+        """Fetch rows for the given ids, if all are present.
+
+        Args:
+            collection_name: Name of the collection
+            ids: Ids to look up
+
+        Returns:
+            Float32 matrix (len(ids), dim) copied out of the map, or None
+            if any id was not written by this process
+        """
+        with self._lock:
+            rows = self._rows.get(collection_name)
+            if not rows:
+                return None
+            try:
+                indices = [rows[id_] for id_ in ids]
+            except KeyError:
+                return None
+            # Copy out so callers never hold views into a file we may
+            # re-map on the next append
+            return np.array(self._maps[collection_name][indices], dtype=np.float32)
+
+    def drop(self, collection_name: str):
+        """Remove a collection's file and in-heap maps.
+
+        Args:
+            collection_name: Name of the collection
+        """
+        with self._lock:
+            self._maps.pop(collection_name, None)
+            self._counts.pop(collection_name, None)
+            self._rows.pop(collection_name, None)
+            path = self._path(collection_name)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _path(self, collection_name: str) -> str:
+        """Path of the on-disk vector file for a collection."""
+        return os.path.join(self.persist_directory, f"{collection_name}.vectors")
+
+    def _remap(self, collection_name: str, dim: int, capacity: int) -> np.memmap:
+        """(Re)map a collection's file at the given row capacity.
+
+        Extends the backing file first; existing rows are preserved since
+        the file layout is a plain row-major float32 matrix.
+        """
+        path = self._path(collection_name)
+        with open(path, "ab") as f:
+            f.truncate(capacity * dim * 4)
+
+        mapped = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, dim))
+        self._maps[collection_name] = mapped
+        return mapped
+
+    @staticmethod
+    def _init_uring():
+        """Set up an io_uring submission ring, or None without `liburing`.
+
+        io_uring turns a batch of range writes into a single syscall;
+        without the bindings (or off Linux) the flusher falls back to one
+        pwrite per range, which is still off the insert path.
+        """
+        try:
+            import liburing
+
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(MmapVectorStore.FLUSH_BATCH, ring, 0)
+            return (liburing, ring)
+        except Exception:
+            return None
+
+    def _drain_flush_queue(self) -> List[Tuple[str, int, int]]:
+        """Block for one append record, then grab whatever else is queued."""
+        ops = [self._flush_queue.get()]
+        while len(ops) < self.FLUSH_BATCH:
+            try:
+                ops.append(self._flush_queue.get_nowait())
+            except queue.Empty:
+                break
+        return ops
+
+    def _flush_worker(self):
+        """Push dirty row ranges to disk, batched per wakeup."""
+        while True:
+            ops = self._drain_flush_queue()
+            try:
+                self._flush_ranges(ops)
+            except Exception as e:
+                logger.warning(f"Background mmap flush failed: {str(e)}")
+
+    def _flush_ranges(self, ops: List[Tuple[str, int, int]]):
+        """Write the given (collection, start, end) row ranges to disk."""
+        # Snapshot the ranges under the lock; a concurrent re-map swaps the
+        # file contents wholesale, so clamping to the live map is enough
+        payloads = []
+        with self._lock:
+            for collection_name, start, end in ops:
+                mapped = self._maps.get(collection_name)
+                if mapped is None:
+                    continue
+                end = min(end, len(mapped))
+                if start >= end:
+                    continue
+                row_bytes = mapped.shape[1] * 4
+                payloads.append((
+                    self._path(collection_name),
+                    mapped[start:end].tobytes(),
+                    start * row_bytes
+                ))
+
+        if not payloads:
+            return
+
+        fds = {}
+        try:
+            for path, _, _ in payloads:
+                if path not in fds:
+                    fds[path] = os.open(path, os.O_WRONLY)
+
+            if self._uring is not None:
+                liburing, ring = self._uring
+                for path, data, offset in payloads:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_write(sqe, fds[path], data, len(data), offset)
+                liburing.io_uring_submit(ring)
+                for _ in payloads:
+                    cqe = liburing.io_uring_cqe()
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    liburing.io_uring_cqe_seen(ring, cqe)
+            else:
+                for path, data, offset in payloads:
+                    os.pwrite(fds[path], data, offset)
+        finally:
+            for fd in fds.values():
+                os.close(fd)
@@ -0,0 +1,39 @@
+"""
+Scalar quantization helpers for stored vectors.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetrically quantize float vectors to int8 codes.
+
+    Each vector gets its own scale (max-abs / 127), which keeps the codec
+    exact enough for rescoring L2-normalized embeddings while shrinking
+    storage 4x versus float32.
+
+    Args:
+        vectors: Array of shape (n, dim), any float dtype
+
+    Returns:
+        Tuple of (codes int8 (n, dim), scales float32 (n,))
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    np.maximum(scales, 1e-12, out=scales)
+    codes = np.rint(vectors / scales[:, np.newaxis]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize_int8(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Reconstruct float32 vectors from int8 codes.
+
+    Args:
+        codes: Array of int8 codes, shape (n, dim)
+        scales: Per-vector scales, shape (n,)
+
+    Returns:
+        Reconstructed float32 array of shape (n, dim)
+    """
+    return codes.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, np.newaxis]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Import MongoDB data from the JSON dumps in xtra/.
+
+Python counterpart of import_mongo_data.sh for environments without the
+mongoimport binary. Re-runs are idempotent: documents are upserted by _id
+instead of inserted, so an existing database can be refreshed in place.
+"""
+import os
+import sys
+
+from bson import json_util
+from pymongo import MongoClient, ReplaceOne
+
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://0.0.0.0:27017")
+DB_NAME = "chunker_service"
+
+# Ops per bulk_write call; keeps each wire message small while still
+# amortizing the per-call round trip across 100 documents
+BATCH_SIZE = 100
+
+COLLECTION_FILES = {
+    "users": "xtra/chunker_service.users.json",
+    "processed_documents": "xtra/chunker_service.processed_documents.json",
+}
+
+
+def parse_json_file(path):
+    """Stream documents from one exported JSON array.
+
+    With ijson available, documents are yielded one at a time as the file
+    is read, so peak memory is one batch instead of the whole dump plus
+    its parsed tree. Without it, falls back to json_util.loads, which
+    parses and normalizes the whole dump in one pass.
+
+    Yielded documents are already normalized to native BSON types.
+
+    Args:
+        path: Path to the mongoexport-style JSON file.
+
+    Yields:
+        Document dicts.
+    """
+    with open(path, "rb") as f:
+        try:
+            import ijson
+        except ImportError:
+            yield from json_util.loads(f.read())
+        else:
+            for item in ijson.items(f, "item"):
+                yield _normalize_tree(item)
+
+
+def _normalize_tree(value):
+    """Recursively apply extended-JSON normalization to a streamed item."""
+    if isinstance(value, dict):
+        return json_util.object_hook({k: _normalize_tree(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_normalize_tree(v) for v in value]
+    return value
+
+
+def import_collection(db, collection_name, path):
+    """Import one collection with unordered bulk upserts.
+
+    ReplaceOne with upsert makes the import idempotent (insert_many would
+    fail on any _id collision with existing data), ordered=False lets the
+    server apply the batch in parallel, and there is no pre-count round
+    trip — the upsert itself handles both fresh and existing databases.
+
+    Args:
+        db: pymongo database handle.
+        collection_name: Target collection name.
+        path: Path to the JSON dump.
+
+    Returns:
+        Number of documents written.
+    """
+    collection = db[collection_name]
+    total = 0
+    ops = []
+
+    for item in parse_json_file(path):
+        ops.append(ReplaceOne({"_id": item["_id"]}, item, upsert=True))
+        if len(ops) >= BATCH_SIZE:
+            collection.bulk_write(ops, ordered=False)
+            total += len(ops)
+            ops = []
+
+    if ops:
+        collection.bulk_write(ops, ordered=False)
+        total += len(ops)
+
+    print(f"Imported {total} documents into '{collection_name}'")
+    return total
+
+
+def main():
+    """Import every known collection dump."""
+    print(f"Connecting to MongoDB at {MONGO_URI}...")
+    client = MongoClient(MONGO_URI)
+    db = client[DB_NAME]
+
+    for collection_name, path in COLLECTION_FILES.items():
+        if not os.path.exists(path):
+            print(f"Skipping '{collection_name}': {path} not found")
+            continue
+        import_collection(db, collection_name, path)
+
+    print("MongoDB import completed successfully!")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,18 @@
 """
 API routes for the LLM service.
 """
-from fastapi import APIRouter, HTTPException, Depends, status
+import asyncio
+
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from llm_service.api.schemas import HealthResponse
 
 from llm_service.api.schemas import (
     GenerateTextRequest,
     GenerateTextResponse,
+    BatchGenerateRequest,
+    BatchGenerateResponse,
     ErrorResponse,
     TokenUsage
 )
@@ -18,6 +24,18 @@ from llm_service.utils.logging import setup_logging
 logger = setup_logging(__name__)
 router = APIRouter()
 
+# Bounds in-flight upstream calls per batch request so one large batch
+# cannot exhaust the connection pool
+_BATCH_CONCURRENCY = 32
+
+# Health payload is constant, so build it once at import time
+_HEALTH = {
+    "status": "healthy",
+    "version": "0.1.0",
+    "embedding_model": "n/a",
+    "vector_db": "n/a"
+}
+
 
 @router.post(
     "/generate",
@@ -41,7 +59,7 @@ async def generate_text(request: GenerateTextRequest):
         Generated text and metadata.
     """
     try:
-        logger.info(f"Received text generation request for model: {request.model}")
+        logger.info("Received text generation request for model: %s", request.model)
 
         result = await LLMService.generate_text(
             prompt=request.prompt,
@@ -49,19 +67,22 @@ async def generate_text(request: GenerateTextRequest):
             options=request.options
         )
 
-        # Convert the result to the response schema
-        response = GenerateTextResponse(
+        # Convert the result to the response schema. The dict shape is
+        # guaranteed by GeminiModel.generate, so model_construct skips the
+        # per-field validation pass; only the untrusted inbound request
+        # goes through full validation.
+        response = GenerateTextResponse.model_construct(
             text=result["text"],
             model=result["model"],
-            usage=TokenUsage(**result["usage"]),
+            usage=TokenUsage.model_construct(**result["usage"]),
             finish_reason=result.get("finish_reason")
         )
 
-        logger.info(f"Successfully generated text with model: {request.model}")
+        logger.info("Successfully generated text with model: %s", request.model)
         return response
 
     except LLMServiceError as e:
-        logger.error(f"LLM service error: {e.message}")
+        logger.error("LLM service error: %s", e.message)
         raise HTTPException(
             status_code=e.status_code,
             detail={
@@ -82,6 +103,107 @@ async def generate_text(request: GenerateTextRequest):
         )
 
 
+@router.post(
+    "/generate/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream generated text",
+    description="Generate text and stream fragments as NDJSON events while the model is still producing output."
+)
+async def generate_text_stream(request: GenerateTextRequest):
+    """
+    Stream generated text as NDJSON events.
+
+    The client receives headers and the first text fragment as soon as
+    the model produces it; the final event carries usage metadata and the
+    finish reason.
+
+    Args:
+        request: Text generation request.
+
+    Returns:
+        Streaming NDJSON response.
+    """
+    logger.info("Received streaming generation request for model: %s", request.model)
+    model = LLMService.get_model(request.model)
+
+    async def event_stream():
+        try:
+            async for event in model.generate_stream(request.prompt, request.options):
+                yield orjson.dumps(event) + b"\n"
+        except LLMServiceError as e:
+            # Headers are already sent, so errors travel as a final event
+            yield orjson.dumps({
+                "error": e.message,
+                "status_code": e.status_code,
+                "details": e.details
+            }) + b"\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/batch",
+    response_model=BatchGenerateResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    },
+    summary="Generate text for multiple prompts",
+    description="Run several generation requests concurrently and return per-item results in request order."
+)
+async def generate_text_batch(request: BatchGenerateRequest):
+    """
+    Generate text for a batch of prompts concurrently.
+
+    Args:
+        request: Batch of text generation requests.
+
+    Returns:
+        Per-item results in request order; failed items carry an error
+        entry instead of failing the whole batch.
+    """
+    logger.info("Received batch generation request with %d items", len(request.items))
+
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _one(item: GenerateTextRequest):
+        async with semaphore:
+            return await LLMService.generate_text(
+                prompt=item.prompt,
+                model_name=item.model,
+                options=item.options
+            )
+
+    outcomes = await asyncio.gather(
+        *(_one(item) for item in request.items),
+        return_exceptions=True
+    )
+
+    results = []
+    for outcome in outcomes:
+        if isinstance(outcome, LLMServiceError):
+            results.append(ErrorResponse.model_construct(
+                message=outcome.message,
+                status_code=outcome.status_code,
+                details=outcome.details
+            ))
+        elif isinstance(outcome, Exception):
+            results.append(ErrorResponse.model_construct(
+                message=f"Unexpected error: {str(outcome)}",
+                status_code=500,
+                details={}
+            ))
+        else:
+            results.append(GenerateTextResponse.model_construct(
+                text=outcome["text"],
+                model=outcome["model"],
+                usage=TokenUsage.model_construct(**outcome["usage"]),
+                finish_reason=outcome.get("finish_reason")
+            ))
+
+    return BatchGenerateResponse.model_construct(results=results)
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -89,16 +211,9 @@ async def generate_text(request: GenerateTextRequest):
     summary="Health check",
     description="Check the health of the service."
 )
-async def health_check(
-        service: LLMService = Depends(generate_text)
-):
+async def health_check():
     """Health check."""
-    try:
-        health_info = service.get_health_info()
-
-        return HealthResponse(**health_info)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"message": f"Health check failed: {str(e)}"}
-        )
\ No newline at end of file
+    # Constant payload, pre-serialized shape: liveness probes hit this
+    # endpoint continuously, so skip both Pydantic validation and any
+    # service work
+    return ORJSONResponse(_HEALTH)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 API schemas for request and response validation.
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 
 from pydantic import BaseModel, Field
 
@@ -9,7 +9,13 @@ from pydantic import BaseModel, Field
 class GenerateTextRequest(BaseModel):
     """Request schema for text generation."""
     
-    prompt: str = Field(..., description="Input prompt for text generation")
+    # Bounds enforced in pydantic-core before the handler runs, so empty
+    # or oversized prompts are rejected with a 422 instead of paying an
+    # upstream round trip
+    prompt: str = Field(
+        ..., min_length=1, max_length=32768,
+        description="Input prompt for text generation"
+    )
     model: str = Field("gemini-2.0-flash", description="Model to use for generation")
     options: Optional[Dict[str, Any]] = Field(
         default=None, 
@@ -34,6 +40,26 @@ class GenerateTextResponse(BaseModel):
     finish_reason: Optional[str] = Field(None, description="Reason for finishing generation")
 
 
+class BatchGenerateRequest(BaseModel):
+    """Request schema for batched text generation."""
+
+    items: List[GenerateTextRequest] = Field(
+        ..., min_length=1, description="Generation requests to run concurrently"
+    )
+
+
+class BatchGenerateResponse(BaseModel):
+    """Response schema for batched text generation.
+
+    Results are positional: entry i answers items[i], and a failed item
+    yields an ErrorResponse in its slot instead of failing the batch.
+    """
+
+    results: List[Union[GenerateTextResponse, "ErrorResponse"]] = Field(
+        ..., description="Per-item results, in request order"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response schema."""
     
@@ -49,3 +75,7 @@ class HealthResponse(BaseModel):
     version: str = Field(..., description="Version of the service")
     embedding_model: str = Field(..., description="Current embedding model")
     vector_db: str = Field(..., description="Current vector database")
+
+
+# Resolve the forward reference to ErrorResponse
+BatchGenerateResponse.model_rebuild()
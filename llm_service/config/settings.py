@@ -2,38 +2,56 @@
 Configuration settings for the LLM service.
 """
 import os
+from functools import cached_property
 from typing import Dict, Any
-from pydantic_settings import BaseSettings
+
+from pydantic import computed_field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+# Static per-model configuration; credentials are merged in once by
+# Settings.MODEL_CONFIGS so callers never mutate these
+_BASE_MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "gemini-2.0-flash": {
+        "base_url": "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent",
+        "api_key_param": "key",
+        "timeout": 30,
+        "max_tokens": 1024,
+    }
+}
 
 
 class Settings(BaseSettings):
-    """Application settings."""
-    
+    """Application settings (immutable after construction)."""
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+
     # API settings
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "LLM Service"
     DEBUG: bool = True
-    
+
     # LLM Model settings
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
-    
-    # Model configurations
-    MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
-        "gemini-2.0-flash": {
-            "base_url": "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent",
-            "api_key_param": "key",
-            "timeout": 30,
-            "max_tokens": 1024,
-        }
-    }
-    
+
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+
+    @computed_field
+    @cached_property
+    def MODEL_CONFIGS(self) -> Dict[str, Dict[str, Any]]:
+        """Model configurations with credentials already merged.
+
+        Built once on first access, so the per-request path reads a
+        finished config instead of patching the API key into a shared
+        mutable dict.
+        """
+        configs = {name: dict(config) for name, config in _BASE_MODEL_CONFIGS.items()}
+        for name, config in configs.items():
+            if name.startswith("gemini"):
+                config["api_key"] = self.GEMINI_API_KEY
+        return configs
 
 
 settings = Settings()
@@ -1,10 +1,11 @@
 """
 Gemini model implementation.
 """
-import json
+import logging
 from typing import Dict, Any, Optional
 
 import aiohttp
+import orjson
 
 from llm_service.core.models.base import BaseLLMModel
 from llm_service.utils.errors import ModelRequestError, ModelResponseError
@@ -13,10 +14,112 @@ from llm_service.utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Option name -> Gemini generationConfig key; the mapping never changes,
+# so building the config is a single comprehension instead of a branch
+# per supported option
+_GEN_KEY_MAP = {
+    "temperature": "temperature",
+    "max_tokens": "maxOutputTokens",
+    "top_p": "topP",
+    "top_k": "topK",
+}
+
+# Request-body template bytes: the payload shape is fixed and only the
+# prompt (and optional generationConfig) varies, so the body is spliced
+# from constants around orjson-escaped fragments instead of building and
+# traversing a nested dict per request
+_PAYLOAD_PREFIX = b'{"contents":[{"parts":[{"text":'
+_PAYLOAD_SUFFIX = b'}]}]}'
+_PAYLOAD_CFG_INFIX = b'}]}],"generationConfig":'
+
+# Stand-in usage metadata for responses that omit it; shared constant so
+# the parse path allocates nothing on that miss
+_EMPTY_USAGE_METADATA = {
+    "promptTokenCount": 0,
+    "candidatesTokenCount": 0,
+    "totalTokenCount": 0,
+}
+
 
 class GeminiModel(BaseLLMModel):
     """Gemini model implementation."""
 
+    # Shared HTTP session: one pooled connection set for all requests,
+    # instead of a new TCP+TLS handshake per generate call
+    _session = None
+
+    def __init__(self, model_name: str, config: Dict[str, Any]):
+        """
+        Initialize the model, precomputing per-request constants.
+
+        The request URL, headers and timeout never change after
+        construction, so they are built once here instead of on every
+        generate call.
+
+        Args:
+            model_name: Name of the model.
+            config: Model configuration.
+        """
+        super().__init__(model_name, config)
+        api_key = config.get("api_key", "")
+        base_url = config.get("base_url", "")
+        key_param = config.get("api_key_param", "key")
+        self._url = f"{base_url}?{key_param}={api_key}"
+        # Streaming variant of the same endpoint, as server-sent events
+        stream_base = base_url.replace(":generateContent", ":streamGenerateContent")
+        self._stream_url = f"{stream_base}?alt=sse&{key_param}={api_key}"
+        self._headers = {"Content-Type": "application/json"}
+        self._timeout = aiohttp.ClientTimeout(total=config.get("timeout", 30))
+
+    @classmethod
+    async def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Returns:
+            Shared aiohttp client session.
+        """
+        if cls._session is None or cls._session.closed:
+            # Connector limits cap sockets; the per-host cap matters here
+            # since every request goes to the same Gemini endpoint
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    keepalive_timeout=60
+                )
+            )
+        return cls._session
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared HTTP session (called on application shutdown)."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    @staticmethod
+    def _build_payload(prompt: str, options: Dict[str, Any]) -> bytes:
+        """
+        Build the serialized request body for the Gemini API.
+
+        orjson handles the escaping of the variable fragments; the fixed
+        JSON structure around them is pre-encoded constants.
+
+        Args:
+            prompt: Input prompt.
+            options: Generation options.
+
+        Returns:
+            JSON request body bytes.
+        """
+        body = _PAYLOAD_PREFIX + orjson.dumps(prompt)
+
+        generation_config = {v: options[k] for k, v in _GEN_KEY_MAP.items() if k in options}
+        if generation_config:
+            return body + _PAYLOAD_CFG_INFIX + orjson.dumps(generation_config) + b"}"
+        return body + _PAYLOAD_SUFFIX
+
     async def generate(self, prompt: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate text using the Gemini model.
@@ -28,90 +131,62 @@ class GeminiModel(BaseLLMModel):
         Returns:
             Generated text and metadata.
         """
-        options = options or {}
-
-        # Prepare request URL with API key
-        api_key = self.config.get("api_key", "")
-        base_url = self.config.get("base_url", "")
-        url = f"{base_url}?{self.config.get('api_key_param', 'key')}={api_key}"
-
-        # Prepare request payload
-        payload = {
-            "contents": [{
-                "parts": [{"text": prompt}]
-            }]
-        }
-
-        # Add any additional parameters from options as generation config
-        generation_config = {}
-        if "temperature" in options:
-            generation_config["temperature"] = options["temperature"]
-        if "max_tokens" in options:
-            generation_config["maxOutputTokens"] = options["max_tokens"]
-        if "top_p" in options:
-            generation_config["topP"] = options["top_p"]
-        if "top_k" in options:
-            generation_config["topK"] = options["top_k"]
-
-        # Add generation config to payload if not empty
-        if generation_config:
-            payload["generationConfig"] = generation_config
+        body = self._build_payload(prompt, options or {})
 
-        logger.info(f"Sending request to Gemini model: {self.model_name}")
+        logger.info("Sending request to Gemini model: %s", self.model_name)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=self.config.get("timeout", 30)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Gemini API error: {error_text}")
-                        raise ModelResponseError(
-                            message=f"Gemini API returned status {response.status}",
-                            details={"status": response.status, "response": error_text}
-                        )
-
-                    response_data = await response.json()
-
-                    # Extract the generated text from the response
-                    try:
-                        # Log the response structure for debugging
-                        logger.debug(f"Response structure: {json.dumps(response_data)}")
-
-                        # Extract text from the first candidate's content
-                        candidate = response_data.get("candidates", [])[0]
-                        content = candidate.get("content", {})
-                        parts = content.get("parts", [])
-
-                        if not parts:
-                            raise KeyError("No parts found in response content")
-
-                        generated_text = parts[0].get("text", "")
-
-                        # Extract usage metadata if available
-                        usage_metadata = response_data.get("usageMetadata", {})
-
-                        return {
-                            "text": generated_text,
-                            "model": self.model_name,
-                            "usage": {
-                                "prompt_tokens": usage_metadata.get("promptTokenCount", 0),
-                                "completion_tokens": usage_metadata.get("candidatesTokenCount", 0),
-                                "total_tokens": usage_metadata.get("totalTokenCount", 0)
-                            },
-                            "finish_reason": candidate.get("finishReason", "STOP")
-                        }
-                    except (KeyError, IndexError) as e:
-                        logger.error(f"Failed to parse Gemini response: {e}")
-                        logger.error(f"Response data: {json.dumps(response_data)}")
-                        raise ModelResponseError(
-                            message="Failed to parse Gemini response",
-                            details={"error": str(e), "response": response_data}
-                        )
+            session = await self.get_session()
+            async with session.post(
+                url=self._url,
+                data=body,
+                headers=self._headers,
+                timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Gemini API error: {error_text}")
+                    raise ModelResponseError(
+                        message=f"Gemini API returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
+
+                response_data = orjson.loads(await response.read())
+
+                # Extract the generated text from the response
+                try:
+                    # Log the response structure for debugging; guard so the
+                    # dump is never serialized when DEBUG is off
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Response structure: %s", orjson.dumps(response_data).decode())
+
+                    # One direct walk to the generated text: a miss at any
+                    # level raises straight into the handler below, without
+                    # the per-level fallback dicts and lists the chained
+                    # .get() version allocated
+                    candidate = response_data["candidates"][0]
+                    generated_text = candidate["content"]["parts"][0]["text"]
+                    usage_metadata = response_data.get("usageMetadata") or _EMPTY_USAGE_METADATA
+
+                    return {
+                        "text": generated_text,
+                        "model": self.model_name,
+                        "usage": {
+                            "prompt_tokens": usage_metadata.get("promptTokenCount", 0),
+                            "completion_tokens": usage_metadata.get("candidatesTokenCount", 0),
+                            "total_tokens": usage_metadata.get("totalTokenCount", 0)
+                        },
+                        "finish_reason": candidate.get("finishReason", "STOP")
+                    }
+                except (KeyError, IndexError) as e:
+                    # Lazy %s formatting: the payload repr is only built if
+                    # the record is actually emitted
+                    logger.error("Failed to parse Gemini response: %s", e)
+                    logger.error("Response data: %s", response_data)
+                    raise ModelResponseError(
+                        message="Failed to parse Gemini response",
+                        details={"error": str(e), "response": response_data}
+                    )
 
         except aiohttp.ClientError as e:
             logger.error(f"Gemini API request failed: {e}")
@@ -119,3 +194,75 @@ class GeminiModel(BaseLLMModel):
                 message=f"Failed to connect to Gemini API: {e}",
                 details={"error": str(e)}
             )
+
+    async def generate_stream(self, prompt: str, options: Optional[Dict[str, Any]] = None):
+        """
+        Stream generated text fragments as they arrive from Gemini.
+
+        Uses the streamGenerateContent SSE endpoint, so the caller can
+        forward the first fragment while the model is still generating
+        instead of waiting for the full response.
+
+        Args:
+            prompt: Input prompt.
+            options: Additional options for generation.
+
+        Yields:
+            {"text": fragment} dicts per chunk, then one final event with
+            the model name, usage and finish reason.
+        """
+        body = self._build_payload(prompt, options or {})
+
+        logger.info("Streaming request to Gemini model: %s", self.model_name)
+
+        try:
+            session = await self.get_session()
+            async with session.post(
+                url=self._stream_url,
+                data=body,
+                headers=self._headers,
+                timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Gemini API error: {error_text}")
+                    raise ModelResponseError(
+                        message=f"Gemini API returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
+
+                usage_metadata = _EMPTY_USAGE_METADATA
+                finish_reason = "STOP"
+
+                async for line in response.content:
+                    line = line.strip()
+                    if not line.startswith(b"data: "):
+                        continue
+
+                    event = orjson.loads(line[6:])
+                    candidates = event.get("candidates")
+                    if candidates:
+                        candidate = candidates[0]
+                        parts = candidate.get("content", {}).get("parts")
+                        if parts and "text" in parts[0]:
+                            yield {"text": parts[0]["text"]}
+                        if "finishReason" in candidate:
+                            finish_reason = candidate["finishReason"]
+                    if "usageMetadata" in event:
+                        usage_metadata = event["usageMetadata"]
+
+                yield {
+                    "model": self.model_name,
+                    "usage": {
+                        "prompt_tokens": usage_metadata.get("promptTokenCount", 0),
+                        "completion_tokens": usage_metadata.get("candidatesTokenCount", 0),
+                        "total_tokens": usage_metadata.get("totalTokenCount", 0)
+                    },
+                    "finish_reason": finish_reason
+                }
+        except aiohttp.ClientError as e:
+            logger.error(f"Gemini API streaming request failed: {e}")
+            raise ModelRequestError(
+                message=f"Failed to connect to Gemini API: {e}",
+                details={"error": str(e)}
+            )
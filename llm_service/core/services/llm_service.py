@@ -1,7 +1,12 @@
 """
 Core LLM service implementation.
 """
-from typing import Dict, Any, Optional, Type
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Type
+
+import orjson
 
 from llm_service.config.settings import settings
 from llm_service.core.models.base import BaseLLMModel
@@ -24,6 +29,54 @@ class LLMService:
     # Cache of initialized model instances
     _model_instances: Dict[str, BaseLLMModel] = {}
 
+    # Response cache for deterministic calls: repeated prompts (retries,
+    # tests, identical user queries) answer from memory instead of a
+    # Gemini round trip. LRU with a TTL, keyed on model+prompt+options.
+    _response_cache: "OrderedDict[Tuple[str, str, bytes], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _response_cache_size: int = 1024
+    _response_cache_ttl: float = 300.0
+
+    # Caps concurrent upstream generations across all endpoints, so a
+    # request burst queues here instead of overwhelming the provider and
+    # triggering cascading retries
+    _generate_semaphore = asyncio.Semaphore(64)
+
+    @classmethod
+    def _cache_get(cls, key: Tuple[str, str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response if present and not expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached result dict, or None.
+        """
+        entry = cls._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > cls._response_cache_ttl:
+            cls._response_cache.pop(key, None)
+            return None
+        cls._response_cache.move_to_end(key)
+        # Copy so callers can't mutate the cached dict
+        return dict(result)
+
+    @classmethod
+    def _cache_put(cls, key: Tuple[str, str, bytes], result: Dict[str, Any]) -> None:
+        """
+        Store a response, evicting the least recently used beyond capacity.
+
+        Args:
+            key: Cache key.
+            result: Result dict to cache.
+        """
+        cls._response_cache[key] = (time.monotonic(), dict(result))
+        cls._response_cache.move_to_end(key)
+        while len(cls._response_cache) > cls._response_cache_size:
+            cls._response_cache.popitem(last=False)
+
     @classmethod
     def get_model(cls, model_name: str) -> BaseLLMModel:
         """
@@ -38,10 +91,27 @@ class LLMService:
         Raises:
             ModelNotFoundError: If the model is not found.
         """
-        # Check if model is already initialized
-        if model_name in cls._model_instances:
-            return cls._model_instances[model_name]
+        # Fast path: one dict lookup for the already-initialized case,
+        # which is every call after the first per model
+        model_instance = cls._model_instances.get(model_name)
+        if model_instance is not None:
+            return model_instance
+        return cls._init_model(model_name)
+
+    @classmethod
+    def _init_model(cls, model_name: str) -> BaseLLMModel:
+        """
+        Validate, construct and cache a model instance (cache-miss path).
+
+        Args:
+            model_name: Name of the model.
+
+        Returns:
+            Model instance.
 
+        Raises:
+            ModelNotFoundError: If the model is not found.
+        """
         # Check if model is in registry
         if model_name not in cls._model_registry:
             logger.error(f"Model '{model_name}' not found in registry")
@@ -52,13 +122,10 @@ class LLMService:
             logger.error(f"Model '{model_name}' not found in configuration")
             raise ModelNotFoundError(model_name)
 
-        # Get model config
+        # Get model config; credentials are pre-merged by Settings, so
+        # there is nothing to patch in here
         model_config = settings.MODEL_CONFIGS[model_name]
 
-        # Add API key to config
-        if model_name.startswith("gemini"):
-            model_config["api_key"] = settings.GEMINI_API_KEY
-
         # Initialize model
         model_class = cls._model_registry[model_name]
         model_instance = model_class(model_name, model_config)
@@ -87,9 +154,35 @@ class LLMService:
         Returns:
             Generated text and metadata.
         """
-        logger.info(f"Generating text with model: {model_name}")
+        logger.info("Generating text with model: %s", model_name)
+
+        # Only cache calls that are explicitly deterministic. An absent
+        # temperature is not: no generationConfig is sent upstream and
+        # Gemini samples at its own default, so those responses must not
+        # be replayed
+        temperature = (options or {}).get("temperature")
+        cacheable = temperature is not None and temperature <= 0
+        cache_key = None
+        if cacheable:
+            # The tuple itself is the key; hashing it down to 64 bits
+            # would let a collision serve one prompt's answer for another
+            cache_key = (
+                model_name,
+                prompt,
+                orjson.dumps(options or {}, option=orjson.OPT_SORT_KEYS)
+            )
+            cached = cls._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached response for model: %s", model_name)
+                return cached
+
         model = cls.get_model(model_name)
-        return await model.generate(prompt, options)
+        async with cls._generate_semaphore:
+            result = await model.generate(prompt, options)
+
+        if cacheable:
+            cls._cache_put(cache_key, result)
+        return result
 
     @classmethod
     def register_model(cls, model_name: str, model_class: Type[BaseLLMModel]) -> None:
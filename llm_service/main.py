@@ -1,13 +1,16 @@
 """
 Main application entry point.
 """
+import os
+
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from llm_service.api.routes import router as api_router
 from llm_service.config.settings import settings
+from llm_service.core.models.gemini import GeminiModel
 from llm_service.utils.errors import LLMServiceError
 from llm_service.utils.logging import setup_logging
 
@@ -27,6 +30,7 @@ def create_application() -> FastAPI:
         debug=settings.DEBUG,
         openapi_url="/openapi.json",
         docs_url="/docs",
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -53,6 +57,16 @@ def create_application() -> FastAPI:
     # Include API routes
     app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
+    @app.on_event("startup")
+    async def open_http_session():
+        """Create the shared upstream HTTP session before serving traffic."""
+        await GeminiModel.get_session()
+
+    @app.on_event("shutdown")
+    async def close_http_session():
+        """Close the shared upstream HTTP session."""
+        await GeminiModel.close_session()
+
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
@@ -75,9 +89,16 @@ app = create_application()
 
 if __name__ == "__main__":
     logger.info(f"Starting {settings.PROJECT_NAME}")
+    # The service is almost pure I/O (HTTP in, HTTP out to Gemini), so the
+    # event loop and HTTP parser dominate; uvloop and httptools are the
+    # fast C implementations of both. One worker per core in production;
+    # reload mode requires a single process.
     uvicorn.run(
         "llm_service.main:app",
         host="0.0.0.0",
         port=8001,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        workers=None if settings.DEBUG else (os.cpu_count() or 1)
     )
@@ -0,0 +1,37 @@
+"""
+Optional Cython build for the hot Pydantic modules.
+
+Compiling the schema and error modules to extension modules speeds up
+model construction/validation without any source changes. The build is
+strictly optional: without Cython (or if compilation fails) the package
+runs the pure-Python sources unchanged.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+from setuptools import setup
+
+# Modules on the per-request path that benefit from compilation
+EXT_MODULES = [
+    "llm_service/api/schemas.py",
+    "llm_service/utils/errors.py",
+]
+
+
+def get_ext_modules():
+    """Return cythonized extensions, or none when Cython is absent."""
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(EXT_MODULES, language_level=3)
+
+
+setup(
+    name="llm_service",
+    version="0.1.0",
+    description="LLM text generation service",
+    packages=["llm_service"],
+    ext_modules=get_ext_modules(),
+)
@@ -1,38 +1,54 @@
 """
 Logging utilities for the LLM service.
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from llm_service.config.settings import settings
 
 
+# One formatter for every handler, built once at import
+_formatter = logging.Formatter(settings.LOG_FORMAT)
+
+# All loggers enqueue records and a single listener thread does the
+# formatting and stream I/O, so a slow or blocking stdout never stalls
+# the event loop inside a request
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(_formatter)
+_listener = QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
+
 def setup_logging(name: Optional[str] = None) -> logging.Logger:
     """
     Set up logging configuration.
-    
+
+    Safe to call repeatedly for the same name: the handler is attached
+    only once, so records are not emitted in duplicate no matter how many
+    modules import this.
+
     Args:
         name: Logger name. If None, returns the root logger.
-        
+
     Returns:
         Configured logger instance.
     """
     logger = logging.getLogger(name)
-    
+
     # Set log level
     log_level = getattr(logging, settings.LOG_LEVEL)
     logger.setLevel(log_level)
-    
-    # Create handlers
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    
-    # Create formatters
-    formatter = logging.Formatter(settings.LOG_FORMAT)
-    console_handler.setFormatter(formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    
+
+    if not logger.handlers:
+        logger.addHandler(QueueHandler(_log_queue))
+
+    # This logger owns its output; don't also bubble up to the root
+    logger.propagate = False
+
     return logger
@@ -1,18 +1,20 @@
 """
 API routes for the RAG Engine.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from rag_engine.api.schemas import (
     QueryRequest,
     QueryResponse,
+    BatchQueryRequest,
+    BatchQueryResponse,
     StoreDocumentsRequest,
     StoreDocumentsResponse,
     ListCollectionsResponse,
     CollectionInfo,
-    HealthResponse,
-    ContextDocument,
-    TokenUsage
+    HealthResponse
 )
 from rag_engine.services.rag_service import RAGService
 from rag_engine.utils.errors import RAGEngineError
@@ -21,20 +23,26 @@ from rag_engine.utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# SSE frames are encoded by hand, so mirror ORJSONResponse's options:
+# numpy values (e.g. float32 scores from the vectorized retriever) are
+# serialized from their C buffers instead of raising TypeError
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 # Create router
 router = APIRouter()
 
-# Create RAG service instance
-rag_service = RAGService()
 
+def get_rag_service(request: Request) -> RAGService:
+    """Get the per-process RAG service instance.
 
-def get_rag_service() -> RAGService:
-    """Get the RAG service instance.
+    The instance lives on app.state, created by the application lifespan
+    once per worker process, so its clients and caches belong to the
+    worker that serves the request instead of being frozen at import.
 
     Returns:
         RAG service instance
     """
-    return rag_service
+    return request.app.state.rag_service
 
 
 @router.post(
@@ -60,31 +68,146 @@ async def query(
             prev_queries=request.prev_queries
         )
 
-        # Convert context documents to the response schema
-        context_documents = [
-            ContextDocument(
-                id=doc["id"],
-                text=doc["text"],
-                score=doc["score"],
-                metadata=doc.get("metadata")
+        # Shape the payload to match QueryResponse and encode it with
+        # orjson directly. The data comes from our own service layer, so
+        # there is nothing to validate, and returning a Response bypasses
+        # FastAPI's jsonable_encoder — the heaviest step for responses
+        # carrying long context-document texts. response_model on the
+        # route still documents the contract in OpenAPI. Inbound requests
+        # keep full validation since they are untrusted.
+        payload = {
+            "text": result["text"],
+            "model": result["model"],
+            "usage": result["usage"],
+            "finish_reason": result.get("finish_reason"),
+            "context_documents": [
+                {
+                    "id": doc["id"],
+                    "text": doc["text"],
+                    "score": doc["score"],
+                    "metadata": doc.get("metadata")
+                }
+                for doc in result["context_documents"]
+            ]
+        }
+
+        return ORJSONResponse(payload)
+    except RAGEngineError as e:
+        raise e.to_http_exception()
+    except Exception as e:
+        logger.exception(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"message": f"Failed to process query: {str(e)}"}
+        )
+
+
+@router.post(
+    "/query/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Query the RAG Engine with a streamed answer",
+    description=(
+        "Process a query through the RAG pipeline, streaming the answer "
+        "as Server-Sent Events to cut time-to-first-token."
+    )
+)
+async def query_stream(
+    request: QueryRequest,
+    service: RAGService = Depends(get_rag_service)
+):
+    """Query the RAG Engine with a streamed answer."""
+
+    async def event_stream():
+        """Relay pipeline events as SSE frames.
+
+        Text fragments become 'data:' frames with a delta; the final
+        metadata event becomes an 'event: done' frame carrying model,
+        usage and the context documents. Failures after the response has
+        started can only be reported in-band, as an 'event: error' frame.
+        """
+        try:
+            async for event in service.process_query_stream(
+                query=request.query,
+                collection_name=request.collection_name,
+                llm_model=request.llm_model,
+                embedding_model=request.embedding_model,
+                llm_options=request.llm_options,
+                top_k=request.top_k,
+                prev_queries=request.prev_queries
+            ):
+                if "text" in event:
+                    yield b"data: " + orjson.dumps({"delta": event["text"]}) + b"\n\n"
+                elif "error" in event:
+                    yield b"event: error\ndata: " + orjson.dumps(event, option=_ORJSON_OPTS) + b"\n\n"
+                else:
+                    yield b"event: done\ndata: " + orjson.dumps(event, option=_ORJSON_OPTS) + b"\n\n"
+        except RAGEngineError as e:
+            logger.error(f"Streaming query failed: {e.message}")
+            yield (
+                b"event: error\ndata: "
+                + orjson.dumps({"message": e.message, "details": e.details})
+                + b"\n\n"
             )
-            for doc in result["context_documents"]
-        ]
-
-        return QueryResponse(
-            text=result["text"],
-            model=result["model"],
-            usage=TokenUsage(**result["usage"]),
-            finish_reason=result.get("finish_reason"),
-            context_documents=context_documents
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.post(
+    "/query/batch",
+    response_model=BatchQueryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Query the RAG Engine with a batch of queries",
+    description="Process several queries through the RAG pipeline as one batch."
+)
+async def query_batch(
+    request: BatchQueryRequest,
+    service: RAGService = Depends(get_rag_service)
+):
+    """Query the RAG Engine with a batch of queries."""
+    try:
+        results = await service.process_query_batch(
+            queries=request.queries,
+            collection_name=request.collection_name,
+            llm_model=request.llm_model,
+            embedding_model=request.embedding_model,
+            llm_options=request.llm_options,
+            top_k=request.top_k
         )
+
+        # Same trusted-shape direct encoding as /query; failed items keep
+        # their error payload in place of the generated text
+        payload = {
+            "results": [
+                {
+                    "text": result["text"],
+                    "model": result["model"],
+                    "usage": result["usage"],
+                    "finish_reason": result.get("finish_reason"),
+                    "context_documents": [
+                        {
+                            "id": doc["id"],
+                            "text": doc["text"],
+                            "score": doc["score"],
+                            "metadata": doc.get("metadata")
+                        }
+                        for doc in result["context_documents"]
+                    ]
+                } if "text" in result else {
+                    "message": result.get("message", "Generation failed"),
+                    "details": result.get("details") or {}
+                }
+                for result in results
+            ]
+        }
+
+        return ORJSONResponse(payload)
     except RAGEngineError as e:
         raise e.to_http_exception()
     except Exception as e:
         logger.exception(f"Unexpected error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"message": f"Failed to process query: {str(e)}"}
+            detail={"message": f"Failed to process query batch: {str(e)}"}
         )
 
 
@@ -108,11 +231,12 @@ async def store_documents(
             model=request.model
         )
 
-        return StoreDocumentsResponse(
-            ids=result["ids"],
-            collection_name=result["collection_name"],
-            count=result["count"]
-        )
+        # Trusted shape from our own service layer: encode directly
+        return ORJSONResponse({
+            "ids": result["ids"],
+            "collection_name": result["collection_name"],
+            "count": result["count"]
+        })
     except RAGEngineError as e:
         raise e.to_http_exception()
     except Exception as e:
@@ -137,17 +261,17 @@ async def list_collections(
     try:
         collections = await service.list_collections()
 
-        # Convert to response schema
-        collection_infos = [
-            CollectionInfo(
-                name=collection["name"],
-                count=collection["count"],
-                dimension=collection["dimension"]
-            )
-            for collection in collections
-        ]
-
-        return ListCollectionsResponse(collections=collection_infos)
+        # Convert to response schema; same trusted-shape shortcut as /query
+        return ORJSONResponse({
+            "collections": [
+                {
+                    "name": collection["name"],
+                    "count": collection["count"],
+                    "dimension": collection["dimension"]
+                }
+                for collection in collections
+            ]
+        })
     except RAGEngineError as e:
         raise e.to_http_exception()
     except Exception as e:
@@ -172,7 +296,7 @@ async def health_check(
     try:
         health_info = await service.get_health_info()
 
-        return HealthResponse(**health_info)
+        return ORJSONResponse(health_info)
     except Exception as e:
         logger.exception(f"Unexpected error: {str(e)}")
         raise HTTPException(
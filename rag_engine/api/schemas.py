@@ -1,7 +1,7 @@
 """
 API schemas for the RAG Engine.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from pydantic import BaseModel, Field
 
 
@@ -81,6 +81,9 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Service status")
     service: str = Field(..., description="Service name")
     version: str = Field(..., description="Service version")
+    embedding_cache: Optional[Dict[str, int]] = Field(
+        None, description="Embedding cache hit/miss counters"
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -88,3 +91,30 @@ class ErrorResponse(BaseModel):
 
     message: str = Field(..., description="Error message")
     details: Dict[str, Any] = Field({}, description="Error details")
+
+
+class BatchQueryRequest(BaseModel):
+    """Request schema for querying the RAG Engine with a batch of queries."""
+
+    queries: List[str] = Field(
+        ..., min_length=1, max_length=64,
+        description="User queries to process as one batch"
+    )
+    collection_name: Optional[str] = Field(None, description="Name of the collection to query")
+    llm_model: Optional[str] = Field(None, description="LLM model to use")
+    embedding_model: Optional[str] = Field(None, description="Embedding model to use")
+    llm_options: Optional[Dict[str, Any]] = Field(None, description="LLM generation options")
+    top_k: Optional[int] = Field(None, description="Number of context documents to retrieve per query")
+
+
+class BatchQueryResponse(BaseModel):
+    """Response schema for batched RAG Engine queries.
+
+    Results are positional: entry i answers queries[i], and a failed
+    query yields an ErrorResponse in its slot instead of failing the
+    batch.
+    """
+
+    results: List[Union[QueryResponse, ErrorResponse]] = Field(
+        ..., description="Per-query results, in request order"
+    )
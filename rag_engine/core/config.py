@@ -20,6 +20,13 @@ class Settings(BaseSettings):
     # RAG settings
     MAX_CONTEXT_DOCUMENTS: int = 5
     SIMILARITY_THRESHOLD: float = 0.45
+    # Token budget for the formatted context block of the prompt; prompt
+    # tokens dominate LLM cost and latency, so low-score documents are
+    # dropped rather than sent past this limit
+    MAX_CONTEXT_TOKENS: int = 2048
+    # Minimum cosine similarity for the semantic response cache to treat
+    # a new query as a rephrasing of a cached one
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
     PROMPT_TEMPLATE: str = """
     Answer the following question based on the provided context.
 
@@ -51,6 +58,12 @@ class Settings(BaseSettings):
     BATCH_SIZE: int = 32
     MAX_CONCURRENT_REQUESTS: int = 10
     TIMEOUT: int = 30
+    # Capacity of the per-process (text, model) -> embedding memo
+    EMBEDDING_CACHE_SIZE: int = 50_000
+    # Large document stores are split into chunks of this size and
+    # pipelined with at most STORE_CONCURRENCY requests in flight
+    STORE_BATCH_SIZE: int = 256
+    STORE_CONCURRENCY: int = 4
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -3,6 +3,8 @@ Context retriever for the RAG Engine.
 """
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
 from rag_engine.core.config import settings
 from rag_engine.services.embedding_client import EmbeddingClient
 from rag_engine.utils.logging import setup_logging
@@ -10,6 +12,25 @@ from rag_engine.utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Hot-path settings bound once at import: these are read on every
+# request, and a module-level load is cheaper than a pydantic-settings
+# attribute access each time
+_DEFAULT_COLLECTION = settings.DEFAULT_COLLECTION_NAME
+_DEFAULT_TOP_K = settings.MAX_CONTEXT_DOCUMENTS
+_SIMILARITY_THRESHOLD = settings.SIMILARITY_THRESHOLD
+
+
+def refresh_cached_settings() -> None:
+    """Re-read the cached settings values from the live Settings object.
+
+    For use after a runtime settings reload; normal operation never
+    needs it.
+    """
+    global _DEFAULT_COLLECTION, _DEFAULT_TOP_K, _SIMILARITY_THRESHOLD
+    _DEFAULT_COLLECTION = settings.DEFAULT_COLLECTION_NAME
+    _DEFAULT_TOP_K = settings.MAX_CONTEXT_DOCUMENTS
+    _SIMILARITY_THRESHOLD = settings.SIMILARITY_THRESHOLD
+
 
 class ContextRetriever:
     """Retrieves relevant context using embeddings."""
@@ -41,8 +62,8 @@ class ContextRetriever:
         Returns:
             List of relevant documents
         """
-        collection = collection_name or settings.DEFAULT_COLLECTION_NAME
-        k = top_k or settings.MAX_CONTEXT_DOCUMENTS
+        collection = collection_name or _DEFAULT_COLLECTION
+        k = top_k or _DEFAULT_TOP_K
         
         logger.info(f"Retrieving context for query: {query}")
         
@@ -54,11 +75,62 @@ class ContextRetriever:
             model=model
         )
         
-        # Filter results by similarity threshold
-        filtered_results = [
-            result for result in results
-            if result["score"] >= settings.SIMILARITY_THRESHOLD
-        ]
+        # Filter results by similarity threshold: one vectorized compare
+        # over the score column instead of a Python comparison per doc,
+        # and the shape a future batched retrieval can reduce over
+        scores = np.fromiter(
+            (result["score"] for result in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+        keep = np.flatnonzero(scores >= _SIMILARITY_THRESHOLD)
+        filtered_results = [results[i] for i in keep.tolist()]
         
         logger.info(f"Retrieved {len(filtered_results)} relevant documents")
         return filtered_results
+
+    async def retrieve_context_batch(
+        self,
+        queries: List[str],
+        collection_name: Optional[str] = None,
+        top_k: Optional[int] = None,
+        model: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Retrieve relevant context for several queries at once.
+
+        One request to the embedding service covers the whole batch;
+        the per-query threshold filter runs vectorized on each result
+        list.
+
+        Args:
+            queries: User queries
+            collection_name: Name of the collection to query
+            top_k: Number of results to return per query
+            model: Optional model name to use
+
+        Returns:
+            Per-query lists of relevant documents, in query order
+        """
+        collection = collection_name or _DEFAULT_COLLECTION
+        k = top_k or _DEFAULT_TOP_K
+
+        logger.info(f"Retrieving context for batch of {len(queries)} queries")
+
+        result_lists = await self.embedding_client.query_collection_batch(
+            query_texts=queries,
+            collection_name=collection,
+            top_k=k,
+            model=model
+        )
+
+        filtered_lists = []
+        for results in result_lists:
+            scores = np.fromiter(
+                (result["score"] for result in results),
+                dtype=np.float32,
+                count=len(results)
+            )
+            keep = np.flatnonzero(scores >= _SIMILARITY_THRESHOLD)
+            filtered_lists.append([results[i] for i in keep.tolist()])
+
+        return filtered_lists
@@ -1,13 +1,20 @@
 """
 Core RAG Engine implementation.
 """
-from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 
+import numpy as np
+
+from rag_engine.core.config import settings
 from rag_engine.core.query_processor import QueryProcessor
 from rag_engine.core.context_retriever import ContextRetriever
 from rag_engine.core.prompt_builder import PromptBuilder
 from rag_engine.core.response_generator import ResponseGenerator
-from rag_engine.services.embedding_client import EmbeddingClient
+from rag_engine.services.embedding_client import EmbeddingClient, BatchedEmbeddingClient
 from rag_engine.services.llm_client import LLMClient
 from rag_engine.utils.logging import setup_logging
 
@@ -18,6 +25,14 @@ logger = setup_logging(__name__)
 class RAGEngine:
     """Main RAG Engine class."""
 
+    # Response cache sizing: the exact tier answers repeated queries from
+    # memory, the semantic tier answers rephrasings of recent queries whose
+    # embeddings are nearly identical. Both skip the LLM round trip, which
+    # dominates end-to-end latency.
+    _EXACT_CACHE_MAXSIZE = 10_000
+    _EXACT_CACHE_TTL = 3600.0
+    _SEMANTIC_CACHE_MAXSIZE = 512
+
     def __init__(
         self,
         embedding_client: Optional[EmbeddingClient] = None,
@@ -29,8 +44,10 @@ class RAGEngine:
             embedding_client: Optional embedding client
             llm_client: Optional LLM client
         """
-        # Initialize clients
+        # Initialize clients; the batched wrapper coalesces concurrent
+        # single-query embedding calls into one request
         self.embedding_client = embedding_client or EmbeddingClient()
+        self.batched_embedding_client = BatchedEmbeddingClient(self.embedding_client)
         self.llm_client = llm_client or LLMClient()
 
         # Initialize components
@@ -39,8 +56,177 @@ class RAGEngine:
         self.prompt_builder = PromptBuilder()
         self.response_generator = ResponseGenerator(self.llm_client)
 
+        # Exact-match response cache: blake2b key -> (stored_at, response)
+        self._exact_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        # Semantic response cache, bucketed per (collection, llm_model) so
+        # a similar query never gets an answer generated against a
+        # different collection or model: key -> (unit query vector, response)
+        self._semantic_cache: Dict[
+            Tuple[str, str], "OrderedDict[bytes, Tuple[np.ndarray, Dict[str, Any]]]"
+        ] = {}
+
         logger.info("Initialized RAGEngine")
 
+    @staticmethod
+    def _cache_key(processed_query: str, collection: str, llm_model: str) -> bytes:
+        """Build the response cache key.
+
+        Args:
+            processed_query: Normalized query text
+            collection: Collection name
+            llm_model: LLM model name
+
+        Returns:
+            Digest identifying this (query, collection, model) combination
+        """
+        return hashlib.blake2b(
+            f"{processed_query}\x00{collection}\x00{llm_model}".encode(),
+            digest_size=16
+        ).digest()
+
+    def _exact_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Get a cached response if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None
+        """
+        entry = self._exact_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self._EXACT_CACHE_TTL:
+            self._exact_cache.pop(key, None)
+            return None
+        self._exact_cache.move_to_end(key)
+        # Copy so callers can't mutate the cached dict
+        return dict(response)
+
+    def _exact_put(self, key: bytes, response: Dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used beyond capacity.
+
+        Args:
+            key: Cache key
+            response: Response to cache
+        """
+        self._exact_cache[key] = (time.monotonic(), dict(response))
+        self._exact_cache.move_to_end(key)
+        while len(self._exact_cache) > self._EXACT_CACHE_MAXSIZE:
+            self._exact_cache.popitem(last=False)
+
+    def _semantic_get(
+        self,
+        collection: str,
+        llm_model: str,
+        query_vector: np.ndarray
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached response for a semantically similar query.
+
+        One matrix-vector product scores the query against every cached
+        vector in the bucket; cached vectors and the query are unit-norm,
+        so the dot product is the cosine similarity.
+
+        Args:
+            collection: Collection name
+            llm_model: LLM model name
+            query_vector: Unit-normalized query embedding
+
+        Returns:
+            Cached response of the best match above threshold, or None
+        """
+        bucket = self._semantic_cache.get((collection, llm_model))
+        if not bucket:
+            return None
+
+        keys = list(bucket.keys())
+        cached_vectors = np.stack([bucket[k][0] for k in keys])
+        similarities = cached_vectors @ query_vector
+        best = int(np.argmax(similarities))
+
+        if similarities[best] < settings.SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        key = keys[best]
+        bucket.move_to_end(key)
+        logger.info(f"Semantic cache hit (similarity: {similarities[best]:.4f})")
+        return dict(bucket[key][1])
+
+    def _semantic_put(
+        self,
+        collection: str,
+        llm_model: str,
+        key: bytes,
+        query_vector: np.ndarray,
+        response: Dict[str, Any]
+    ) -> None:
+        """Store a query vector and its response in the semantic cache.
+
+        Args:
+            collection: Collection name
+            llm_model: LLM model name
+            key: Cache key
+            query_vector: Unit-normalized query embedding
+            response: Response to cache
+        """
+        bucket = self._semantic_cache.setdefault((collection, llm_model), OrderedDict())
+        bucket[key] = (query_vector, dict(response))
+        bucket.move_to_end(key)
+        while len(bucket) > self._SEMANTIC_CACHE_MAXSIZE:
+            bucket.popitem(last=False)
+
+    def invalidate_collection(self, collection: str) -> None:
+        """Drop cached responses that may predate a store into a collection.
+
+        Newly stored documents can change what retrieval returns, so
+        answers generated before the store must not be replayed. The
+        semantic tier is bucketed per collection and loses only the
+        stored collection's buckets; exact-tier keys are opaque digests
+        that cannot be filtered by collection, so that tier is cleared
+        wholesale -- stores are rare next to queries.
+
+        Args:
+            collection: Collection that received new documents
+        """
+        self._exact_cache.clear()
+        for bucket_key in [
+            k for k in self._semantic_cache if k[0] == collection
+        ]:
+            del self._semantic_cache[bucket_key]
+        logger.debug(f"Invalidated response caches for collection '{collection}'")
+
+    async def _query_vector(
+        self,
+        processed_query: str,
+        embedding_model: Optional[str]
+    ) -> Optional[np.ndarray]:
+        """Embed the processed query for the semantic cache.
+
+        Args:
+            processed_query: Normalized query text
+            embedding_model: Optional embedding model to use
+
+        Returns:
+            Unit-normalized float32 embedding, or None if unavailable
+        """
+        try:
+            embedding = await self.batched_embedding_client.embed_text(
+                text=processed_query,
+                model=embedding_model
+            )
+        except Exception as e:
+            # The cache is an optimization; never fail the query over it
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
     async def process(
         self,
         query: str,
@@ -67,15 +253,58 @@ class RAGEngine:
         """
         logger.info(f"Processing query: {query}")
 
+        # Answer trivial greetings/farewells without touching embedding,
+        # retrieval or the LLM — the prompt template only instructs the
+        # model to produce exactly this kind of reply
+        if (canned := self.query_processor.classify(query)) is not None:
+            return {
+                "text": canned,
+                "model": "canned",
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0
+                },
+                "finish_reason": "STOP",
+                "context_documents": []
+            }
+
         # Process the query
         processed_query = self.query_processor.process_query(query)
 
-        # Retrieve context
-        context_documents = await self.context_retriever.retrieve_context(
-            query=processed_query,
-            collection_name=collection_name,
-            top_k=top_k,
-            model=embedding_model
+        # Check the response caches. Skipped for conversational turns:
+        # the prompt then includes prev_queries, so the same query text
+        # can legitimately produce a different answer.
+        collection = collection_name or settings.DEFAULT_COLLECTION_NAME
+        model_name = llm_model or settings.DEFAULT_LLM_MODEL
+        cacheable = not prev_queries
+        cache_key = None
+        query_vector = None
+
+        if cacheable:
+            cache_key = self._cache_key(processed_query, collection, model_name)
+            cached = self._exact_get(cache_key)
+            if cached is not None:
+                logger.info("Exact cache hit for query")
+                return cached
+
+            query_vector = await self._query_vector(processed_query, embedding_model)
+            if query_vector is not None:
+                cached = self._semantic_get(collection, model_name, query_vector)
+                if cached is not None:
+                    return cached
+
+        # Retrieve context while warming the LLM path. Both stages are
+        # I/O-bound, so running them concurrently costs the slower of the
+        # two instead of their sum.
+        context_documents, _ = await asyncio.gather(
+            self.context_retriever.retrieve_context(
+                query=processed_query,
+                collection_name=collection_name,
+                top_k=top_k,
+                model=embedding_model
+            ),
+            self.llm_client.prewarm(llm_model)
         )
 
         # Build prompt
@@ -95,5 +324,158 @@ class RAGEngine:
         # Add context documents to the response
         response["context_documents"] = context_documents
 
+        # Populate both cache tiers for the next occurrence of this query
+        if cacheable:
+            self._exact_put(cache_key, response)
+            if query_vector is not None:
+                self._semantic_put(collection, model_name, cache_key, query_vector, response)
+
         logger.info("Query processing completed successfully")
         return response
+
+    async def process_stream(
+        self,
+        query: str,
+        collection_name: Optional[str] = None,
+        llm_model: Optional[str] = None,
+        embedding_model: Optional[str] = None,
+        llm_options: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        prev_queries: Optional[List[str]] = None
+    ):
+        """Process a query through the RAG pipeline, streaming the answer.
+
+        Same pipeline as process up to the LLM call, which streams
+        fragments as they arrive so the caller can forward the first
+        token before generation finishes. Responses are not cached on
+        this path since the full text is never assembled here.
+
+        Args:
+            query: User query
+            collection_name: Name of the collection to query
+            llm_model: Optional LLM model to use
+            embedding_model: Optional embedding model to use
+            llm_options: Optional LLM generation options
+            top_k: Number of context documents to retrieve
+            prev_queries: Optional list of previous queries for context
+
+        Yields:
+            {"text": fragment} dicts per chunk, then one final event
+            carrying the model, usage, finish reason and the context
+            documents used
+        """
+        logger.info(f"Processing streaming query: {query}")
+
+        # Canned intents stream their single fragment immediately
+        if (canned := self.query_processor.classify(query)) is not None:
+            yield {"text": canned}
+            yield {
+                "model": "canned",
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0
+                },
+                "finish_reason": "STOP",
+                "context_documents": []
+            }
+            return
+
+        processed_query = self.query_processor.process_query(query)
+
+        context_documents, _ = await asyncio.gather(
+            self.context_retriever.retrieve_context(
+                query=processed_query,
+                collection_name=collection_name,
+                top_k=top_k,
+                model=embedding_model
+            ),
+            self.llm_client.prewarm(llm_model)
+        )
+
+        prompt = self.prompt_builder.build_prompt(
+            query=query,
+            context_documents=context_documents,
+            prev_queries=prev_queries or []
+        )
+
+        async for event in self.llm_client.generate_text_stream(
+            prompt=prompt,
+            model=llm_model,
+            options=llm_options
+        ):
+            # The final event (no text fragment) carries the metadata;
+            # attach the context documents to it
+            if "text" not in event and "error" not in event:
+                event["context_documents"] = context_documents
+            yield event
+
+        logger.info("Streaming query processing completed")
+
+    async def process_batch(
+        self,
+        queries: List[str],
+        collection_name: Optional[str] = None,
+        llm_model: Optional[str] = None,
+        embedding_model: Optional[str] = None,
+        llm_options: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Process several queries through the RAG pipeline as one batch.
+
+        The whole batch costs one retrieval request and one LLM service
+        request; item failures from the LLM batch endpoint stay isolated
+        to their slot.
+
+        Args:
+            queries: User queries
+            collection_name: Name of the collection to query
+            llm_model: Optional LLM model to use
+            embedding_model: Optional embedding model to use
+            llm_options: Optional LLM generation options
+            top_k: Number of context documents to retrieve per query
+
+        Returns:
+            Per-query responses, in query order; a failed item is an
+            error payload with "message"/"details" instead of "text"
+        """
+        logger.info(f"Processing batch of {len(queries)} queries")
+
+        processed_queries = [
+            self.query_processor.process_query(query) for query in queries
+        ]
+
+        # One retrieval request for the whole batch, overlapped with the
+        # LLM prewarm exactly like the single-query path
+        context_lists, _ = await asyncio.gather(
+            self.context_retriever.retrieve_context_batch(
+                queries=processed_queries,
+                collection_name=collection_name,
+                top_k=top_k,
+                model=embedding_model
+            ),
+            self.llm_client.prewarm(llm_model)
+        )
+
+        prompts = [
+            self.prompt_builder.build_prompt(
+                query=query,  # Use original query in the prompt
+                context_documents=context_documents,
+                prev_queries=[]
+            )
+            for query, context_documents in zip(queries, context_lists)
+        ]
+
+        results = await self.response_generator.generate_response_batch(
+            prompts=prompts,
+            model=llm_model,
+            options=llm_options
+        )
+
+        # Attach each query's context documents to its successful result
+        for result, context_documents in zip(results, context_lists):
+            if "text" in result:
+                result["context_documents"] = context_documents
+
+        logger.info("Batch query processing completed successfully")
+        return results
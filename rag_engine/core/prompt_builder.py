@@ -1,7 +1,9 @@
 """
 Prompt builder for the RAG Engine.
 """
-from typing import List, Dict, Any, Optional
+import re
+from string import Formatter
+from typing import List, Dict, Any, Optional, Tuple
 
 from rag_engine.core.config import settings
 from rag_engine.utils.logging import setup_logging
@@ -9,6 +11,27 @@ from rag_engine.utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# The "Previous Queries" block of the template, for eliding the whole
+# section on first-turn queries instead of sending header plus filler
+_PREV_SECTION_RE = re.compile(
+    r"\n[ \t]*Previous Queries:[ \t]*\n[ \t]*\{prev_queries\}[ \t]*\n"
+)
+
+# Token counter for the context budget: tiktoken when available, else a
+# chars/4 heuristic, which is close enough for a budget cut-off
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+
+    def _count_tokens(text: str) -> int:
+        """Count tokens in a text."""
+        return len(_encoding.encode(text))
+except ImportError:
+    def _count_tokens(text: str) -> int:
+        """Estimate tokens in a text (roughly four characters per token)."""
+        return max(1, len(text) // 4)
+
 
 class PromptBuilder:
     """Builds prompts with retrieved context."""
@@ -20,8 +43,41 @@ class PromptBuilder:
             template: Optional prompt template
         """
         self.template = template or settings.PROMPT_TEMPLATE
+
+        # Parse the template once at init: str.format reparses the format
+        # mini-language on every call, while the precompiled segments cost
+        # one list walk and one join per request. Each segment is a
+        # literal chunk plus the placeholder name that follows it (or
+        # None at the tail).
+        self._segments = self._compile(self.template)
+
+        # Variant with the "Previous Queries" section removed, used on
+        # first-turn queries: every prompt token costs LLM latency and
+        # billing, so the header plus "No previous queries." filler is
+        # dropped entirely instead of rendered. None when a custom
+        # template has no recognizable section to elide.
+        trimmed = _PREV_SECTION_RE.sub("", self.template)
+        self._segments_no_prev = (
+            self._compile(trimmed) if trimmed != self.template else None
+        )
+
         logger.info("Initialized PromptBuilder")
 
+    @staticmethod
+    def _compile(template: str) -> List[Tuple[str, Optional[str]]]:
+        """Parse a template into (literal, placeholder) segments.
+
+        Args:
+            template: str.format-style template
+
+        Returns:
+            Precompiled segments for build_prompt
+        """
+        return [
+            (literal, field)
+            for literal, field, _, _ in Formatter().parse(template)
+        ]
+
     def build_prompt(
         self,
         query: str,
@@ -43,15 +99,29 @@ class PromptBuilder:
         # Format context documents
         context_str = self._format_context(context_documents)
 
-        # Format previous queries if available
-        prev_queries_str = self._format_prev_queries(prev_queries or [])
-
-        # Fill in the template
-        prompt = self.template.format(
-            query=query,
-            context=context_str,
-            prev_queries=prev_queries_str
-        )
+        # Skip the whole previous-queries section when there are none
+        if prev_queries:
+            segments = self._segments
+            prev_queries_str = self._format_prev_queries(prev_queries)
+        elif self._segments_no_prev is not None:
+            segments = self._segments_no_prev
+            prev_queries_str = ""
+        else:
+            segments = self._segments
+            prev_queries_str = self._format_prev_queries([])
+
+        # Fill in the precompiled template
+        values = {
+            "query": query,
+            "context": context_str,
+            "prev_queries": prev_queries_str
+        }
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(values[field])
+        prompt = "".join(parts)
 
         logger.debug(f"Built prompt: {prompt}")
         return prompt
@@ -68,17 +138,39 @@ class PromptBuilder:
         if not documents:
             return "No relevant context found."
 
-        # Format each document
+        # Spend the token budget on the highest-scoring documents first;
+        # everything past the budget is dropped rather than sent, since
+        # prompt tokens cost LLM latency and billing directly
+        token_budget = settings.MAX_CONTEXT_TOKENS
+        documents = sorted(documents, key=lambda doc: doc.get("score", 0.0), reverse=True)
+
+        # One string per document, built in a single expression so there
+        # are no intermediate concatenations; the metadata line is only
+        # assembled when metadata exists
         formatted_docs = []
+        tokens_used = 0
         for i, doc in enumerate(documents):
-            formatted_doc = f"Document {i+1}:\n{doc['text']}\n"
-
-            # Add metadata if available
-            if doc.get("metadata"):
-                metadata_str = ", ".join(f"{k}: {v}" for k, v in doc["metadata"].items())
-                formatted_doc += f"Metadata: {metadata_str}\n"
+            if metadata := doc.get("metadata"):
+                formatted_doc = (
+                    f"Document {i+1}:\n{doc['text']}\n"
+                    "Metadata: " + ", ".join(f"{k}: {v}" for k, v in metadata.items()) + "\n"
+                )
+            else:
+                formatted_doc = f"Document {i+1}:\n{doc['text']}\n"
+
+            # The highest-scoring document is always kept, even when it
+            # alone exceeds the budget, so the model never answers from
+            # an empty context block
+            doc_tokens = _count_tokens(formatted_doc)
+            if formatted_docs and tokens_used + doc_tokens > token_budget:
+                logger.debug(
+                    f"Dropping {len(documents) - i} context documents over "
+                    f"token budget ({tokens_used}/{token_budget} used)"
+                )
+                break
 
             formatted_docs.append(formatted_doc)
+            tokens_used += doc_tokens
 
         # Join all formatted documents
         return "\n".join(formatted_docs)
@@ -95,10 +187,7 @@ class PromptBuilder:
         if not prev_queries:
             return "No previous queries."
 
-        # Format each previous query
-        formatted_queries = []
-        for i, query in enumerate(prev_queries):
-            formatted_queries.append(f"Query {i+1}: {query}")
-
-        # Join all formatted queries
-        return "\n".join(formatted_queries)
+        # Single pass: one f-string per query, one join at the end
+        return "\n".join(
+            f"Query {i+1}: {query}" for i, query in enumerate(prev_queries)
+        )
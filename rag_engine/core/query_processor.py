@@ -9,6 +9,27 @@ from rag_engine.utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Compiled once at import instead of per call. The punctuation class
+# must cover Unicode (curly apostrophes, smart quotes, em-dashes from
+# mobile keyboards), which a str.translate table over ASCII punctuation
+# does not -- queries would normalize differently and miss the caches
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Trivial intents answered without embedding, retrieval or the LLM; the
+# prompt template only tells the model to do exactly this, so matching
+# them here saves a full LLM round trip
+_GREET_RE = re.compile(
+    r"^\s*(hi|hello|hey|good (morning|afternoon|evening))[\s!.?]*$", re.I
+)
+_BYE_RE = re.compile(r"^\s*(bye|goodbye|see you|farewell)[\s!.?]*$", re.I)
+
+_GREET_RESPONSE = (
+    "Hello! How can I help you today? I can answer questions about "
+    "America Choice Insurance and AngelOne."
+)
+_BYE_RESPONSE = "Goodbye! Feel free to come back if you have more questions."
+
 
 class QueryProcessor:
     """Processes and optimizes user queries."""
@@ -27,19 +48,32 @@ class QueryProcessor:
             Processed query
         """
         logger.info(f"Processing query: {query}")
-        
-        # Remove extra whitespace
-        processed_query = re.sub(r'\s+', ' ', query).strip()
-        
-        # Convert to lowercase
-        processed_query = processed_query.lower()
-        
-        # Remove special characters
-        processed_query = re.sub(r'[^\w\s]', '', processed_query)
-        
+
+        # Lowercase, strip punctuation and collapse whitespace in one
+        # chained pass over precompiled patterns
+        processed_query = _WS_RE.sub(" ", _PUNCT_RE.sub("", query.lower())).strip()
+
         logger.info(f"Processed query: {processed_query}")
         return processed_query
     
+    def classify(self, query: str) -> Optional[str]:
+        """Return a canned response for trivial greeting/farewell queries.
+
+        Args:
+            query: User query
+
+        Returns:
+            Canned response text, or None for queries that need the
+            full RAG pipeline
+        """
+        if _GREET_RE.match(query):
+            logger.info("Classified query as greeting")
+            return _GREET_RESPONSE
+        if _BYE_RE.match(query):
+            logger.info("Classified query as farewell")
+            return _BYE_RESPONSE
+        return None
+
     def extract_metadata(self, query: str) -> Dict[str, Any]:
         """Extract metadata from a query.
         
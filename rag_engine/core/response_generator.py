@@ -1,7 +1,7 @@
 """
 Response generator for the RAG Engine.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from rag_engine.core.config import settings
 from rag_engine.services.llm_client import LLMClient
@@ -50,3 +50,34 @@ class ResponseGenerator:
         
         logger.info("Response generated successfully")
         return response
+
+    async def generate_response_batch(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate responses for several prompts in one LLM service call.
+
+        Args:
+            prompts: Input prompts
+            model: Optional model name to use
+            options: Optional generation options
+
+        Returns:
+            Per-prompt results, in order; failed items carry an error
+            payload instead of generated text
+        """
+        logger.info(
+            f"Generating batch of {len(prompts)} responses with model: "
+            f"{model or settings.DEFAULT_LLM_MODEL}"
+        )
+
+        results = await self.llm_client.generate_text_batch(
+            prompts=prompts,
+            model=model,
+            options=options
+        )
+
+        logger.info("Batch responses generated successfully")
+        return results
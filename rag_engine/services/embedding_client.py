@@ -3,73 +3,204 @@ Client for interacting with the Embedding Service.
 """
 from typing import List, Dict, Any, Optional, Tuple
 import aiohttp
-import json
+import asyncio
+import hashlib
+import orjson
+import time
+from collections import OrderedDict
 
 from rag_engine.core.config import settings
+from rag_engine.services.http_session import get_session
 from rag_engine.utils.errors import EmbeddingServiceError, ServiceConnectionError
 from rag_engine.utils.logging import setup_logging
 
 
 logger = setup_logging(__name__)
 
+# Payloads are orjson-encoded up front, so aiohttp needs the content
+# type spelled out instead of inferring it from json=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def _read_body(response: "aiohttp.ClientResponse") -> bytearray:
+    """Read a response body in chunks into one growable buffer.
+
+    Embedding payloads can run to megabytes of float arrays; reading in
+    fixed-size chunks avoids the extra full-size intermediate bytes
+    object that response.read() plus decode would hold alongside the
+    parsed result, and orjson decodes the bytearray directly.
+
+    Args:
+        response: Response whose body to read
+
+    Returns:
+        Complete response body
+    """
+    buf = bytearray()
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        buf.extend(chunk)
+    return buf
+
 
 class EmbeddingClient:
     """Client for the Embedding Service."""
-    
+
+    # Embeddings are deterministic per (text, model), so hits never
+    # expire; vector-search results go stale as collections grow, so
+    # that cache is small with a short TTL and is invalidated on store
+    _QUERY_CACHE_MAXSIZE = 2048
+    _QUERY_CACHE_TTL = 300.0
+    _COLLECTIONS_TTL = 30.0
+
     def __init__(self, base_url: Optional[str] = None):
         """Initialize the client.
-        
+
         Args:
             base_url: Base URL for the Embedding Service API
         """
         self.base_url = base_url or settings.EMBEDDING_SERVICE_URL
+
+        # (content hash, model) -> embedding vector, LRU, with hit/miss
+        # counters surfaced through /health
+        self._embed_cache: "OrderedDict[Tuple[bytes, str], List[float]]" = OrderedDict()
+        self._embed_hits = 0
+        self._embed_misses = 0
+        # Model name -> dimension, learned from responses so cache hits
+        # can answer without a round trip
+        self._model_dims: Dict[str, int] = {}
+        # Collection -> ((query hash, top_k, model) -> (stored_at, results));
+        # bucketed per collection so store_embeddings can invalidate just
+        # the collection it touched
+        self._query_cache: Dict[str, "OrderedDict[Tuple[bytes, int, str], Tuple[float, List[Dict[str, Any]]]]"] = {}
+        # (fetched_at, collections); the set of collections only changes
+        # when a store creates one, which invalidates this
+        self._collections_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
         logger.info(f"Initialized Embedding Client with base URL: {self.base_url}")
-    
+
+    @staticmethod
+    def _content_key(text: str, model: str) -> Tuple[bytes, str]:
+        """Build a cache key from text content and model name.
+
+        Args:
+            text: Text the key identifies
+            model: Model name
+
+        Returns:
+            Hashable cache key
+        """
+        return (hashlib.blake2b(text.encode(), digest_size=16).digest(), model)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get embedding-cache counters for health reporting.
+
+        Returns:
+            Hit/miss/size counters for the embedding memo
+        """
+        return {
+            "hits": self._embed_hits,
+            "misses": self._embed_misses,
+            "size": len(self._embed_cache)
+        }
+
     async def generate_embeddings(
         self,
         texts: List[str],
         model: Optional[str] = None
     ) -> Tuple[List[List[float]], str, int]:
         """Generate embeddings for texts.
-        
+
+        Embeddings are memoized per (content hash, model): only texts
+        not seen before are sent to the service, and a fully cached call
+        costs no network at all. Many distinct raw queries normalize to
+        the same processed string, so repeats are common.
+
         Args:
             texts: List of texts to embed
             model: Optional model name to use
-            
+
+        Returns:
+            Tuple of (embeddings, model_name, dimension)
+        """
+        model_name = model or settings.DEFAULT_EMBEDDING_MODEL
+
+        keys = [self._content_key(text, model_name) for text in texts]
+        embeddings: List[Optional[List[float]]] = []
+        misses: List[int] = []
+        for i, key in enumerate(keys):
+            cached = self._embed_cache.get(key)
+            if cached is not None:
+                self._embed_cache.move_to_end(key)
+                embeddings.append(list(cached))
+            else:
+                embeddings.append(None)
+                misses.append(i)
+        self._embed_hits += len(texts) - len(misses)
+        self._embed_misses += len(misses)
+
+        if not misses and model_name in self._model_dims:
+            logger.debug("Embedding cache hit for all %d texts", len(texts))
+            return embeddings, model_name, self._model_dims[model_name]
+
+        fetch_indices = misses or list(range(len(texts)))
+        fetched, model_name, dimension = await self._fetch_embeddings(
+            [texts[i] for i in fetch_indices], model_name
+        )
+        self._model_dims[model_name] = dimension
+
+        for i, embedding in zip(fetch_indices, fetched):
+            embeddings[i] = embedding
+            self._embed_cache[keys[i]] = list(embedding)
+            while len(self._embed_cache) > settings.EMBEDDING_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+
+        return embeddings, model_name, dimension
+
+    async def _fetch_embeddings(
+        self,
+        texts: List[str],
+        model_name: str
+    ) -> Tuple[List[List[float]], str, int]:
+        """Fetch embeddings from the service (cache-miss path).
+
+        Args:
+            texts: List of texts to embed
+            model_name: Resolved model name
+
         Returns:
             Tuple of (embeddings, model_name, dimension)
         """
         url = f"{self.base_url}/embeddings"
-        
+
         payload = {
             "texts": texts,
-            "model": model or settings.DEFAULT_EMBEDDING_MODEL
+            "model": model_name
         }
-        
-        logger.info(f"Generating embeddings for {len(texts)} texts using model: {payload['model']}")
-        
+
+        logger.info("Generating embeddings for %d texts using model: %s", len(texts), model_name)
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=url,
-                    json=payload,
-                    timeout=settings.TIMEOUT
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Embedding Service error: {error_text}")
-                        raise EmbeddingServiceError(
-                            message=f"Embedding Service returned status {response.status}",
-                            details={"status": response.status, "response": error_text}
-                        )
-                    
-                    response_data = await response.json()
-                    
-                    return (
-                        response_data["embeddings"],
-                        response_data["model"],
-                        response_data["dimension"]
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Embedding Service error: {error_text}")
+                    raise EmbeddingServiceError(
+                        message=f"Embedding Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
                     )
+
+                response_data = orjson.loads(await _read_body(response))
+
+                return (
+                    response_data["embeddings"],
+                    response_data["model"],
+                    response_data["dimension"]
+                )
         except aiohttp.ClientError as e:
             logger.error(f"Failed to connect to Embedding Service: {str(e)}")
             raise ServiceConnectionError(
@@ -95,8 +226,25 @@ class EmbeddingClient:
         Returns:
             List of query results
         """
+        model_name = model or settings.DEFAULT_EMBEDDING_MODEL
+        bucket = self._query_cache.get(collection_name)
+        cache_key = (
+            hashlib.blake2b(query_text.encode(), digest_size=16).digest(),
+            top_k,
+            model_name
+        )
+        if bucket is not None:
+            entry = bucket.get(cache_key)
+            if entry is not None:
+                stored_at, results = entry
+                if time.monotonic() - stored_at <= self._QUERY_CACHE_TTL:
+                    bucket.move_to_end(cache_key)
+                    logger.debug("Query cache hit for collection '%s'", collection_name)
+                    return [dict(result) for result in results]
+                bucket.pop(cache_key, None)
+
         url = f"{self.base_url}/collections/query"
-        
+
         payload = {
             "query_texts": [query_text],
             "collection_name": collection_name,
@@ -104,61 +252,140 @@ class EmbeddingClient:
             "model": model or settings.DEFAULT_EMBEDDING_MODEL
         }
         
-        logger.info(f"Querying collection '{collection_name}' with text: {query_text}")
+        logger.info("Querying collection '%s' with text: %s", collection_name, query_text)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=url,
-                    json=payload,
-                    timeout=settings.TIMEOUT
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Embedding Service error: {error_text}")
-                        raise EmbeddingServiceError(
-                            message=f"Embedding Service returned status {response.status}",
-                            details={"status": response.status, "response": error_text}
-                        )
-                    
-                    response_data = await response.json()
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Embedding Service error: {error_text}")
+                    raise EmbeddingServiceError(
+                        message=f"Embedding Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
                     
-                    # Return the first query's results
-                    return response_data["results"][0]
+                response_data = orjson.loads(await _read_body(response))
+
+                results = response_data["results"][0]
+
+                # Cache the first query's results with a short TTL; the
+                # store path invalidates this collection's bucket
+                bucket = self._query_cache.setdefault(collection_name, OrderedDict())
+                bucket[cache_key] = (time.monotonic(), [dict(result) for result in results])
+                while len(bucket) > self._QUERY_CACHE_MAXSIZE:
+                    bucket.popitem(last=False)
+
+                return results
         except aiohttp.ClientError as e:
             logger.error(f"Failed to connect to Embedding Service: {str(e)}")
             raise ServiceConnectionError(
                 message=f"Failed to connect to Embedding Service: {str(e)}",
                 details={"url": url}
             )
-    
+
+    async def query_collection_batch(
+        self,
+        query_texts: List[str],
+        collection_name: str,
+        top_k: int = 5,
+        model: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Query a collection for several queries in one request.
+
+        The embedding service endpoint already accepts a list of query
+        texts, so the whole batch is one embed plus one vector search on
+        the backend instead of a call per query.
+
+        Args:
+            query_texts: Query texts
+            collection_name: Name of the collection to query
+            top_k: Number of results to return per query
+            model: Optional model name to use
+
+        Returns:
+            Per-query result lists, in query order
+        """
+        url = f"{self.base_url}/collections/query"
+
+        payload = {
+            "query_texts": query_texts,
+            "collection_name": collection_name,
+            "top_k": top_k,
+            "model": model or settings.DEFAULT_EMBEDDING_MODEL
+        }
+
+        logger.info("Querying collection '%s' with %d texts", collection_name, len(query_texts))
+
+        try:
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Embedding Service error: {error_text}")
+                    raise EmbeddingServiceError(
+                        message=f"Embedding Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
+
+                response_data = orjson.loads(await _read_body(response))
+
+                return response_data["results"]
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to connect to Embedding Service: {str(e)}")
+            raise ServiceConnectionError(
+                message=f"Failed to connect to Embedding Service: {str(e)}",
+                details={"url": url}
+            )
+
     async def list_collections(self) -> List[Dict[str, Any]]:
         """List all collections.
-        
+
+        The list is served from a short-TTL cache: it is hit on ~every
+        query for the existence precheck but only changes when a store
+        creates a collection, which invalidates the cache directly.
+
         Returns:
             List of collections
         """
+        if self._collections_cache is not None:
+            fetched_at, collections = self._collections_cache
+            if time.monotonic() - fetched_at < self._COLLECTIONS_TTL:
+                return [dict(collection) for collection in collections]
+
         url = f"{self.base_url}/collections"
-        
+
         logger.info("Listing collections")
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url=url,
-                    timeout=settings.TIMEOUT
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Embedding Service error: {error_text}")
-                        raise EmbeddingServiceError(
-                            message=f"Embedding Service returned status {response.status}",
-                            details={"status": response.status, "response": error_text}
-                        )
-                    
-                    response_data = await response.json()
+            session = await get_session()
+            async with session.get(
+                url=url
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Embedding Service error: {error_text}")
+                    raise EmbeddingServiceError(
+                        message=f"Embedding Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
                     
-                    return response_data["collections"]
+                response_data = orjson.loads(await response.read())
+
+                collections = response_data["collections"]
+                self._collections_cache = (
+                    time.monotonic(),
+                    [dict(collection) for collection in collections]
+                )
+                return collections
         except aiohttp.ClientError as e:
             logger.error(f"Failed to connect to Embedding Service: {str(e)}")
             raise ServiceConnectionError(
@@ -193,33 +420,160 @@ class EmbeddingClient:
             "model": model or settings.DEFAULT_EMBEDDING_MODEL
         }
         
-        logger.info(f"Storing {len(texts)} texts in collection '{collection_name}'")
+        logger.info("Storing %d texts in collection '%s'", len(texts), collection_name)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=url,
-                    json=payload,
-                    timeout=settings.TIMEOUT
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Embedding Service error: {error_text}")
-                        raise EmbeddingServiceError(
-                            message=f"Embedding Service returned status {response.status}",
-                            details={"status": response.status, "response": error_text}
-                        )
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Embedding Service error: {error_text}")
+                    raise EmbeddingServiceError(
+                        message=f"Embedding Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
                     
-                    response_data = await response.json()
+                response_data = orjson.loads(await response.read())
                     
-                    return (
-                        response_data["ids"],
-                        response_data["collection_name"],
-                        response_data["count"]
-                    )
+                # New documents make cached search results stale for
+                # this collection; drop its bucket. The store may also
+                # have created the collection, so the cached listing
+                # goes too
+                self._query_cache.pop(collection_name, None)
+                self._collections_cache = None
+
+                return (
+                    response_data["ids"],
+                    response_data["collection_name"],
+                    response_data["count"]
+                )
         except aiohttp.ClientError as e:
             logger.error(f"Failed to connect to Embedding Service: {str(e)}")
             raise ServiceConnectionError(
                 message=f"Failed to connect to Embedding Service: {str(e)}",
                 details={"url": url}
             )
+
+
+class BatchedEmbeddingClient:
+    """Micro-batching wrapper around EmbeddingClient.generate_embeddings.
+
+    Concurrent single-text embed calls arriving within a short window are
+    coalesced into one multi-text request to the embedding service, then
+    the results are scattered back to each awaiter. The backend processes
+    a batch in close to the time of a single text, so under concurrent
+    load this trades a few milliseconds of queueing for one request
+    instead of N.
+    """
+
+    # How long the first call in a window waits for company before the
+    # batch is dispatched
+    MICRO_BATCH_WAIT_MS = 10
+
+    def __init__(
+        self,
+        client: Optional[EmbeddingClient] = None,
+        max_batch: Optional[int] = None,
+        wait_ms: Optional[int] = None
+    ):
+        """Initialize the batching wrapper.
+
+        Args:
+            client: Optional embedding client to dispatch batches through
+            max_batch: Batch size that triggers an immediate dispatch
+            wait_ms: Collection window in milliseconds
+        """
+        self.client = client or EmbeddingClient()
+        self.max_batch = max_batch or settings.BATCH_SIZE
+        self._wait = (wait_ms if wait_ms is not None else self.MICRO_BATCH_WAIT_MS) / 1000.0
+
+        # In-flight requests waiting for the next dispatch
+        self._pending: List[Tuple[str, Optional[str], "asyncio.Future"] ] = []
+        self._flush_task: Optional["asyncio.Task"] = None
+        # Strong references to in-flight dispatches; a task held only by
+        # its create_task result can be garbage-collected mid-flight
+        self._dispatch_tasks: set = set()
+
+        logger.info(
+            f"Initialized BatchedEmbeddingClient (max_batch={self.max_batch}, "
+            f"wait={self._wait * 1000:.0f}ms)"
+        )
+
+    async def embed_text(self, text: str, model: Optional[str] = None) -> List[float]:
+        """Embed one text, transparently batching with concurrent callers.
+
+        Args:
+            text: Text to embed
+            model: Optional model name to use
+
+        Returns:
+            Embedding vector
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, model, future))
+
+        if len(self._pending) >= self.max_batch:
+            # Full batch: dispatch now instead of waiting out the
+            # window. Cancelling the timer only ever interrupts its
+            # sleep -- the dispatch itself runs in a separate task (see
+            # _flush_after_wait), so a flush that has already claimed
+            # pending futures can never be cancelled out from under them
+            if self._flush_task is not None and not self._flush_task.done():
+                self._flush_task.cancel()
+            self._flush_task = None
+            self._spawn_flush()
+        elif self._flush_task is None or self._flush_task.done():
+            # First call of a new window: start the dispatch timer
+            self._flush_task = asyncio.create_task(self._flush_after_wait())
+
+        return await future
+
+    def _spawn_flush(self) -> None:
+        """Run _flush in its own task, kept referenced until done."""
+        task = asyncio.create_task(self._flush())
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _flush_after_wait(self) -> None:
+        """Dispatch the pending batch once the collection window elapses.
+
+        Only the sleep is cancellable; the flush is handed off to a
+        fresh task so cancellation can never reach a dispatch that holds
+        popped futures.
+        """
+        await asyncio.sleep(self._wait)
+        self._spawn_flush()
+
+    async def _flush(self) -> None:
+        """Send the pending texts in one request per model and scatter results."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        # Entries for different models can't share a request
+        by_model: Dict[Optional[str], List[Tuple[str, "asyncio.Future"]]] = {}
+        for text, model, future in pending:
+            by_model.setdefault(model, []).append((text, future))
+
+        for model, entries in by_model.items():
+            # Shorter texts first keeps padding waste low in the backend
+            entries.sort(key=lambda entry: len(entry[0]))
+            try:
+                embeddings, _, _ = await self.client.generate_embeddings(
+                    texts=[text for text, _ in entries],
+                    model=model
+                )
+            except Exception as e:
+                for _, future in entries:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            logger.debug(f"Dispatched embedding micro-batch of {len(entries)}")
+            for (_, future), embedding in zip(entries, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
@@ -0,0 +1,48 @@
+"""
+Shared HTTP session for the RAG Engine service clients.
+"""
+from typing import Optional
+
+import aiohttp
+
+from rag_engine.core.config import settings
+from rag_engine.utils.logging import setup_logging
+
+
+logger = setup_logging(__name__)
+
+# One pooled session serves both the embedding and LLM clients, so every
+# request reuses a kept-alive connection instead of paying TCP handshake
+# and connection setup per call
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        Shared aiohttp client session
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=settings.TIMEOUT)
+        )
+        logger.info("Opened shared HTTP session")
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session (called on application shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("Closed shared HTTP session")
+    _session = None
@@ -1,17 +1,24 @@
 """
 Client for interacting with the LLM Service.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import aiohttp
-import json
+import asyncio
+import logging
+import orjson
 
 from rag_engine.core.config import settings
+from rag_engine.services.http_session import get_session
 from rag_engine.utils.errors import LLMServiceError, ServiceConnectionError
 from rag_engine.utils.logging import setup_logging
 
 
 logger = setup_logging(__name__)
 
+# Payloads are orjson-encoded up front, so aiohttp needs the content
+# type spelled out instead of inferring it from json=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class LLMClient:
     """Client for the LLM Service."""
@@ -25,6 +32,34 @@ class LLMClient:
         self.base_url = base_url or settings.LLM_SERVICE_URL
         logger.info(f"Initialized LLM Client with base URL: {self.base_url}")
     
+    async def prewarm(self, model: Optional[str] = None) -> None:
+        """Warm the path to the LLM Service.
+
+        Hits the cheap health endpoint so connection setup and service
+        readiness are paid while context retrieval is still running,
+        instead of inside the generate call. Best effort: failures are
+        ignored here and any real connectivity error surfaces from
+        generate_text itself.
+
+        Args:
+            model: Optional model name the upcoming generate call will use
+        """
+        url = f"{self.base_url}/health"
+
+        logger.debug(f"Prewarming LLM Service for model: {model or settings.DEFAULT_LLM_MODEL}")
+
+        try:
+            session = await get_session()
+            async with session.get(
+                url=url
+            ) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            # The session timeout raises asyncio.TimeoutError, which is not
+            # a ClientError; prewarm runs gathered with retrieval, so any
+            # escape here would fail the whole query
+            logger.debug(f"LLM Service prewarm failed: {str(e)}")
+
     async def generate_text(
         self,
         prompt: str,
@@ -49,28 +84,147 @@ class LLMClient:
             "options": options or settings.DEFAULT_LLM_OPTIONS
         }
         
-        logger.info(f"Generating text with model: {payload['model']}")
-        logger.debug(f"Prompt: {prompt}")
+        logger.info("Generating text with model: %s", payload["model"])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Prompt: %s", prompt)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=url,
-                    json=payload,
-                    timeout=settings.TIMEOUT
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"LLM Service error: {error_text}")
-                        raise LLMServiceError(
-                            message=f"LLM Service returned status {response.status}",
-                            details={"status": response.status, "response": error_text}
-                        )
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"LLM Service error: {error_text}")
+                    raise LLMServiceError(
+                        message=f"LLM Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
                     
-                    response_data = await response.json()
+                response_data = orjson.loads(await response.read())
                     
-                    logger.debug(f"Generated text: {response_data['text'][:100]}...")
-                    return response_data
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Generated text: %s...", response_data["text"][:100])
+                return response_data
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to connect to LLM Service: {str(e)}")
+            raise ServiceConnectionError(
+                message=f"Failed to connect to LLM Service: {str(e)}",
+                details={"url": url}
+            )
+
+    async def generate_text_batch(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate text for several prompts in one request.
+
+        The LLM service fans the items out concurrently and isolates
+        failures per item, so one bad prompt doesn't fail the batch.
+
+        Args:
+            prompts: Input prompts
+            model: Optional model name to use
+            options: Optional generation options
+
+        Returns:
+            Per-prompt results, in order; a failed item is a dict with
+            "message"/"details" instead of "text"
+        """
+        url = f"{self.base_url}/batch"
+
+        model_name = model or settings.DEFAULT_LLM_MODEL
+        item_options = options or settings.DEFAULT_LLM_OPTIONS
+        payload = {
+            "items": [
+                {"prompt": prompt, "model": model_name, "options": item_options}
+                for prompt in prompts
+            ]
+        }
+
+        logger.info("Generating text for batch of %d with model: %s", len(prompts), model_name)
+
+        try:
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"LLM Service error: {error_text}")
+                    raise LLMServiceError(
+                        message=f"LLM Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
+
+                response_data = orjson.loads(await response.read())
+
+                return response_data["results"]
+        except aiohttp.ClientError as e:
+            logger.error(f"Failed to connect to LLM Service: {str(e)}")
+            raise ServiceConnectionError(
+                message=f"Failed to connect to LLM Service: {str(e)}",
+                details={"url": url}
+            )
+
+    async def generate_text_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ):
+        """Stream generated text fragments from the LLM service.
+
+        Consumes the service's newline-delimited streaming endpoint, so
+        the first fragment is available while the model is still
+        generating instead of after the full response.
+
+        Args:
+            prompt: Input prompt
+            model: Optional model name to use
+            options: Optional generation options
+
+        Yields:
+            {"text": fragment} dicts per chunk, then one final event with
+            the model name, usage and finish reason; a mid-stream failure
+            yields an {"error": ...} event
+        """
+        url = f"{self.base_url}/generate/stream"
+
+        payload = {
+            "prompt": prompt,
+            "model": model or settings.DEFAULT_LLM_MODEL,
+            "options": options or settings.DEFAULT_LLM_OPTIONS
+        }
+
+        logger.info("Streaming text with model: %s", payload["model"])
+
+        try:
+            session = await get_session()
+            async with session.post(
+                url=url,
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"LLM Service error: {error_text}")
+                    raise LLMServiceError(
+                        message=f"LLM Service returned status {response.status}",
+                        details={"status": response.status, "response": error_text}
+                    )
+
+                async for line in response.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    yield orjson.loads(line)
         except aiohttp.ClientError as e:
             logger.error(f"Failed to connect to LLM Service: {str(e)}")
             raise ServiceConnectionError(
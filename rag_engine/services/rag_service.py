@@ -1,7 +1,9 @@
 """
 RAG service implementation.
 """
-from typing import Dict, Any, Optional, List
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Tuple
 
 from rag_engine.core.config import settings
 from rag_engine.core.engine import RAGEngine
@@ -17,6 +19,10 @@ logger = setup_logging(__name__)
 class RAGService:
     """Service for RAG operations."""
 
+    # How long the collection-name list may be served from memory; the
+    # existence precheck otherwise costs one HTTP round trip per query
+    _COLLECTIONS_TTL = 30.0
+
     def __init__(
         self,
         embedding_client: Optional[EmbeddingClient] = None,
@@ -38,8 +44,30 @@ class RAGService:
             llm_client=self.llm_client
         )
 
+        # (fetched_at, names) for the collection existence precheck
+        self._collections_cache: Optional[Tuple[float, List[str]]] = None
+
         logger.info("Initialized RAGService")
 
+    async def _collection_names(self) -> List[str]:
+        """Get collection names, served from a short-TTL cache.
+
+        Collections change rarely (only when store_documents creates
+        one), so most queries skip the list round trip entirely.
+
+        Returns:
+            List of collection names
+        """
+        if self._collections_cache is not None:
+            fetched_at, names = self._collections_cache
+            if time.monotonic() - fetched_at < self._COLLECTIONS_TTL:
+                return names
+
+        collections = await self.embedding_client.list_collections()
+        names = [c["name"] for c in collections]
+        self._collections_cache = (time.monotonic(), names)
+        return names
+
     async def process_query(
         self,
         query: str,
@@ -72,8 +100,7 @@ class RAGService:
         collection = collection_name or settings.DEFAULT_COLLECTION_NAME
 
         # Check if collection exists
-        collections = await self.embedding_client.list_collections()
-        collection_names = [c["name"] for c in collections]
+        collection_names = await self._collection_names()
 
         if collection not in collection_names:
             raise ResourceNotFoundError(
@@ -94,6 +121,106 @@ class RAGService:
 
         return response
 
+    async def process_query_stream(
+        self,
+        query: str,
+        collection_name: Optional[str] = None,
+        llm_model: Optional[str] = None,
+        embedding_model: Optional[str] = None,
+        llm_options: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        prev_queries: Optional[List[str]] = None
+    ):
+        """Process a query through the RAG pipeline, streaming the answer.
+
+        Args:
+            query: User query
+            collection_name: Name of the collection to query
+            llm_model: Optional LLM model to use
+            embedding_model: Optional embedding model to use
+            llm_options: Optional LLM generation options
+            top_k: Number of context documents to retrieve
+            prev_queries: Optional list of previous queries for context
+
+        Yields:
+            Streaming events from the engine
+        """
+        # Validate query
+        if not query or not query.strip():
+            raise ValidationError(message="Query cannot be empty")
+
+        # Use default collection if not specified
+        collection = collection_name or settings.DEFAULT_COLLECTION_NAME
+
+        # Check if collection exists
+        collection_names = await self._collection_names()
+
+        if collection not in collection_names:
+            raise ResourceNotFoundError(
+                message=f"Collection '{collection}' not found",
+                details={"available_collections": collection_names}
+            )
+
+        async for event in self.engine.process_stream(
+            query=query,
+            collection_name=collection,
+            llm_model=llm_model,
+            embedding_model=embedding_model,
+            llm_options=llm_options,
+            top_k=top_k,
+            prev_queries=prev_queries or []
+        ):
+            yield event
+
+    async def process_query_batch(
+        self,
+        queries: List[str],
+        collection_name: Optional[str] = None,
+        llm_model: Optional[str] = None,
+        embedding_model: Optional[str] = None,
+        llm_options: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Process several queries through the RAG pipeline as one batch.
+
+        Args:
+            queries: User queries
+            collection_name: Name of the collection to query
+            llm_model: Optional LLM model to use
+            embedding_model: Optional embedding model to use
+            llm_options: Optional LLM generation options
+            top_k: Number of context documents to retrieve per query
+
+        Returns:
+            Per-query responses, in query order
+        """
+        # Validate queries
+        if not queries:
+            raise ValidationError(message="Queries list cannot be empty")
+        if any(not query or not query.strip() for query in queries):
+            raise ValidationError(message="Queries cannot be empty")
+
+        # Use default collection if not specified
+        collection = collection_name or settings.DEFAULT_COLLECTION_NAME
+
+        # Check if collection exists (once for the whole batch)
+        collection_names = await self._collection_names()
+
+        if collection not in collection_names:
+            raise ResourceNotFoundError(
+                message=f"Collection '{collection}' not found",
+                details={"available_collections": collection_names}
+            )
+
+        return await self.engine.process_batch(
+            queries=queries,
+            collection_name=collection,
+            llm_model=llm_model,
+            embedding_model=embedding_model,
+            llm_options=llm_options,
+            top_k=top_k
+        )
+
     async def store_documents(
         self,
         texts: List[str],
@@ -119,13 +246,50 @@ class RAGService:
         # Use default collection if not specified
         collection = collection_name or settings.DEFAULT_COLLECTION_NAME
 
-        # Store documents
-        ids, collection_name, count = await self.embedding_client.store_embeddings(
-            texts=texts,
-            collection_name=collection,
-            metadata=metadata,
-            model=model
-        )
+        # Store documents. Large batches are split so each request body
+        # stays small, and the chunks are pipelined with bounded
+        # concurrency to overlap embedding-service latency without
+        # unbounded fan-out
+        batch_size = settings.STORE_BATCH_SIZE
+        if len(texts) <= batch_size:
+            ids, collection_name, count = await self.embedding_client.store_embeddings(
+                texts=texts,
+                collection_name=collection,
+                metadata=metadata,
+                model=model
+            )
+        else:
+            semaphore = asyncio.Semaphore(settings.STORE_CONCURRENCY)
+
+            async def store_chunk(chunk_texts, chunk_metadata):
+                async with semaphore:
+                    return await self.embedding_client.store_embeddings(
+                        texts=chunk_texts,
+                        collection_name=collection,
+                        metadata=chunk_metadata,
+                        model=model
+                    )
+
+            results = await asyncio.gather(*(
+                store_chunk(
+                    texts[start:start + batch_size],
+                    metadata[start:start + batch_size] if metadata else None
+                )
+                for start in range(0, len(texts), batch_size)
+            ))
+
+            # Aggregate the per-chunk results, preserving input order
+            ids = [doc_id for chunk_ids, _, _ in results for doc_id in chunk_ids]
+            collection_name = results[0][1]
+            count = sum(chunk_count for _, _, chunk_count in results)
+
+        # The store may have created the collection; make the next query
+        # see it instead of waiting out the TTL
+        self._collections_cache = None
+
+        # Cached answers generated before this store may no longer match
+        # what retrieval would return
+        self.engine.invalidate_collection(collection)
 
         return {
             "ids": ids,
@@ -152,5 +316,6 @@ class RAGService:
         return {
             "status": "ok",
             "service": "rag_engine",
-            "version": "0.1.0"
+            "version": "0.1.0",
+            "embedding_cache": self.embedding_client.cache_stats()
         }
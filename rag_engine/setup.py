@@ -0,0 +1,38 @@
+"""
+Optional Cython build for the per-request hot modules.
+
+The API schemas and settings are touched on every request (request
+parsing, response building, settings attribute reads); compiling them to
+extension modules turns that attribute access and field iteration into C
+calls. The build is strictly optional: without Cython (or if compilation
+fails) the package runs the pure-Python sources unchanged.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+from setuptools import setup
+
+# Modules on the per-request path that benefit from compilation
+EXT_MODULES = [
+    "rag_engine/api/schemas.py",
+    "rag_engine/core/config.py",
+]
+
+
+def get_ext_modules():
+    """Return cythonized extensions, or none when Cython is absent."""
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(EXT_MODULES, language_level=3)
+
+
+setup(
+    name="rag_engine",
+    version="0.1.0",
+    description="Retrieval-Augmented Generation engine",
+    packages=["rag_engine"],
+    ext_modules=get_ext_modules(),
+)
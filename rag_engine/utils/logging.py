@@ -2,42 +2,80 @@
 Logging utilities for the RAG Engine.
 """
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
 from rag_engine.core.config import settings
 
 
+# Log records are handed off to a background listener thread through an
+# unbounded queue, so a log call on the event loop costs one enqueue
+# instead of a blocking stdout/file write
+_log_queue: Optional["queue.Queue"] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    """Get the shared queue handler, starting the listener on first use.
+
+    Returns:
+        Queue handler feeding the background listener thread
+    """
+    global _log_queue, _listener, _queue_handler
+
+    if _queue_handler is None:
+        _log_queue = queue.Queue(-1)
+
+        # Create formatter
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+
+        # Create console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        handlers = [console_handler]
+
+        # Create file handler if log file is specified
+        if settings.LOG_FILE:
+            file_handler = logging.FileHandler(settings.LOG_FILE)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        # The listener thread drains the queue and does the actual I/O
+        _listener = logging.handlers.QueueListener(_log_queue, *handlers)
+        _listener.start()
+
+        _queue_handler = logging.handlers.QueueHandler(_log_queue)
+
+    return _queue_handler
+
+
 def setup_logging(name: Optional[str] = None) -> logging.Logger:
     """Set up logging for the application.
-    
+
     Args:
         name: Logger name (optional)
-        
+
     Returns:
         Configured logger
     """
     # Get logger
     logger = logging.getLogger(name or "rag_engine")
-    
+
     # Set log level
     log_level = getattr(logging, settings.LOG_LEVEL)
     logger.setLevel(log_level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # Create file handler if log file is specified
-    if settings.LOG_FILE:
-        file_handler = logging.FileHandler(settings.LOG_FILE)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+
+    # Attach the shared queue handler exactly once per logger, and stop
+    # records propagating to ancestor loggers that carry the same
+    # handler; without both guards every log line was emitted once per
+    # module that had called setup_logging
+    if not logger.handlers:
+        logger.addHandler(_get_queue_handler())
+    logger.propagate = False
+
     return logger